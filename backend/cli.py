@@ -0,0 +1,73 @@
+"""Maintenance CLI for the CMS database.
+
+    python cli.py export backup.ndjson.gz
+    python cli.py import backup.ndjson.gz
+"""
+import asyncio
+import os
+from pathlib import Path
+from typing import List, Optional
+import typer
+from dotenv import load_dotenv
+from database import create_mongo_client, get_primary_database
+from services.backup_service import BackupService, BACKUP_COLLECTIONS, iter_gzip_lines
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+app = typer.Typer(help="Architecture Studio CMS maintenance commands")
+
+def _database():
+    client, _ = create_mongo_client(os.environ['MONGO_URL'])
+    return client, get_primary_database(client, os.environ['DB_NAME'])
+
+@app.command("export")
+def export_data(
+    output: Path = typer.Argument(..., help="Destination .ndjson.gz file"),
+    collection: Optional[List[str]] = typer.Option(None, help="Collections to export (repeatable)"),
+    batch_size: int = typer.Option(1000, help="Cursor batch size"),
+):
+    """Stream collections to a gzip-compressed NDJSON file"""
+
+    async def run():
+        client, db = _database()
+        service = BackupService(db, batch_size=batch_size)
+        written = 0
+        try:
+            with open(output, "wb") as f:
+                async for chunk in service.export_stream(collection or BACKUP_COLLECTIONS):
+                    f.write(chunk)
+                    written += len(chunk)
+        finally:
+            client.close()
+        typer.echo(f"Exported {written} compressed bytes to {output}")
+
+    asyncio.run(run())
+
+@app.command("import")
+def import_data(
+    source: Path = typer.Argument(..., help="Source .ndjson.gz file"),
+    batch_size: int = typer.Option(1000, help="Bulk write batch size"),
+):
+    """Upsert documents from a gzip-compressed NDJSON file"""
+
+    async def run():
+        client, db = _database()
+        service = BackupService(db, batch_size=batch_size)
+        try:
+            with open(source, "rb") as f:
+                async def read(size: int) -> bytes:
+                    return f.read(size)
+
+                counts = await service.import_lines(
+                    iter_gzip_lines(read),
+                    progress=lambda counts: typer.echo(f"  {counts}")
+                )
+        finally:
+            client.close()
+        typer.echo(f"Imported {sum(counts.values())} documents: {counts}")
+
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,193 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import monitoring
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import (
+    Primary, PrimaryPreferred, Secondary, SecondaryPreferred, Nearest
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.environ.get(name)
+    return int(value) if value else None
+
+def _percentile(values, fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+class PoolMetrics(monitoring.ConnectionPoolListener, monitoring.ServerHeartbeatListener):
+    """Collects connection pool and server monitoring stats from pymongo events
+
+    Motor runs pymongo operations on executor threads, so checkout start
+    times are tracked per thread and matched to the checked-out event.
+    """
+
+    def __init__(self, sample_size: int = 1000):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.checkout_waits_ms = deque(maxlen=sample_size)
+        self.checkout_failures = 0
+        self.checkouts = 0
+        self.in_use: Dict[str, int] = {}
+        self.open_connections: Dict[str, int] = {}
+        self.pool_clears = 0
+        self.heartbeat_ms: Dict[str, float] = {}
+        self.heartbeat_failures: Dict[str, int] = {}
+        self.ping_ms = deque(maxlen=sample_size)
+
+    @staticmethod
+    def _key(address) -> str:
+        return f"{address[0]}:{address[1]}" if address else "unknown"
+
+    # Connection pool events
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pool_clears += 1
+
+    def pool_closed(self, event):
+        with self._lock:
+            self.open_connections.pop(self._key(event.address), None)
+            self.in_use.pop(self._key(event.address), None)
+
+    def connection_created(self, event):
+        key = self._key(event.address)
+        with self._lock:
+            self.open_connections[key] = self.open_connections.get(key, 0) + 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        key = self._key(event.address)
+        with self._lock:
+            self.open_connections[key] = max(0, self.open_connections.get(key, 0) - 1)
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+
+    def connection_check_out_failed(self, event):
+        self._local.started = None
+        with self._lock:
+            self.checkout_failures += 1
+
+    def connection_checked_out(self, event):
+        started = getattr(self._local, "started", None)
+        self._local.started = None
+        key = self._key(event.address)
+        with self._lock:
+            self.checkouts += 1
+            self.in_use[key] = self.in_use.get(key, 0) + 1
+            if started is not None:
+                self.checkout_waits_ms.append((time.perf_counter() - started) * 1000)
+
+    def connection_checked_in(self, event):
+        key = self._key(event.address)
+        with self._lock:
+            self.in_use[key] = max(0, self.in_use.get(key, 0) - 1)
+
+    # Server heartbeat events
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        key = self._key(event.connection_id)
+        with self._lock:
+            self.heartbeat_ms[key] = event.duration * 1000
+
+    def failed(self, event):
+        key = self._key(event.connection_id)
+        with self._lock:
+            self.heartbeat_failures[key] = self.heartbeat_failures.get(key, 0) + 1
+
+    def record_ping(self, elapsed_ms: float) -> None:
+        """Record a readiness ping, end to end (server selection, checkout and round trip)"""
+        with self._lock:
+            self.ping_ms.append(elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a point-in-time view of the collected stats"""
+
+        with self._lock:
+            waits = list(self.checkout_waits_ms)
+            pings = list(self.ping_ms)
+            return {
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "checkout_wait_ms": {
+                    "p50": _percentile(waits, 0.5),
+                    "p95": _percentile(waits, 0.95),
+                    "max": max(waits) if waits else None
+                },
+                "in_use": dict(self.in_use),
+                "open_connections": dict(self.open_connections),
+                "pool_clears": self.pool_clears,
+                "ping_ms": {
+                    "last": pings[-1] if pings else None,
+                    "p95": _percentile(pings, 0.95)
+                },
+                "heartbeat_rtt_ms": dict(self.heartbeat_ms),
+                "heartbeat_failures": dict(self.heartbeat_failures)
+            }
+
+_READ_PREFERENCES = {
+    "primary": Primary,
+    "primarypreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondarypreferred": SecondaryPreferred,
+    "nearest": Nearest
+}
+
+def _public_read_preference():
+    mode = os.environ.get("MONGO_PUBLIC_READ_PREFERENCE", "secondaryPreferred").lower()
+    if mode not in _READ_PREFERENCES:
+        raise ValueError(f"Unknown read preference: {mode}")
+    if mode == "primary":
+        return Primary()
+    # Max staleness must be at least 90 seconds when set
+    max_staleness = _env_int("MONGO_PUBLIC_MAX_STALENESS_SECONDS") or -1
+    return _READ_PREFERENCES[mode](max_staleness=max_staleness)
+
+def create_mongo_client(mongo_url: str) -> Tuple[AsyncIOMotorClient, PoolMetrics]:
+    """Create the Mongo client with pool settings from the environment"""
+
+    metrics = PoolMetrics()
+    options = {
+        "maxPoolSize": _env_int("MONGO_MAX_POOL_SIZE"),
+        "minPoolSize": _env_int("MONGO_MIN_POOL_SIZE"),
+        "maxIdleTimeMS": _env_int("MONGO_MAX_IDLE_TIME_MS"),
+        "waitQueueTimeoutMS": _env_int("MONGO_WAIT_QUEUE_TIMEOUT_MS"),
+        "serverSelectionTimeoutMS": _env_int("MONGO_SERVER_SELECTION_TIMEOUT_MS"),
+        "connectTimeoutMS": _env_int("MONGO_CONNECT_TIMEOUT_MS"),
+        "socketTimeoutMS": _env_int("MONGO_SOCKET_TIMEOUT_MS"),
+    }
+    options = {key: value for key, value in options.items() if value is not None}
+
+    client = AsyncIOMotorClient(mongo_url, event_listeners=[metrics], **options)
+    logger.info("Mongo client configured: %s", options)
+    return client, metrics
+
+def get_primary_database(client: AsyncIOMotorClient, name: str) -> AsyncIOMotorDatabase:
+    """Database handle for admin reads and writes, pinned to the primary"""
+    return client.get_database(name, read_preference=Primary())
+
+def get_public_database(client: AsyncIOMotorClient, name: str) -> AsyncIOMotorDatabase:
+    """Database handle for public content reads, routed per configuration"""
+    return client.get_database(
+        name,
+        read_preference=_public_read_preference(),
+        read_concern=ReadConcern(os.environ.get("MONGO_PUBLIC_READ_CONCERN", "local"))
+    )
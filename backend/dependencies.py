@@ -1,6 +1,18 @@
 from fastapi import Depends, Request
 from services.content_service import ContentService
 from services.auth_service import AdminAuthService
+from services.autosave_service import AutosaveBuffer
+from services.event_broadcaster import EventBroadcaster
+from middleware.profiling import ProfileStore
+from middleware.admission import AdmissionController
+from services.backup_service import BackupService
+from services.retention_service import RetentionService
+from services.publish_scheduler import PublishScheduler
+from services.tenant_service import TenantRegistry, DEFAULT_TENANT
+from services.social_feed_service import SocialFeedService
+from services.audit_service import AuditLog
+from services.page_renderer import PageTemplate
+from database import PoolMetrics
 from motor.motor_asyncio import AsyncIOMotorDatabase
 import os
 
@@ -8,14 +20,103 @@ def get_database(request: Request) -> AsyncIOMotorDatabase:
     """Get database dependency"""
     return request.app.state.db
 
+def get_public_database(request: Request) -> AsyncIOMotorDatabase:
+    """Get database dependency for public reads (replica-routed)"""
+    return request.app.state.public_db
+
+def get_tenant_id(request: Request) -> str:
+    """Get the tenant resolved for this request"""
+    return getattr(request.state, "tenant_id", DEFAULT_TENANT)
+
+def get_tenant_registry(request: Request) -> TenantRegistry:
+    """Get tenant registry dependency"""
+    return request.app.state.tenants
+
+def get_event_broadcaster(request: Request) -> EventBroadcaster:
+    """Get event broadcaster dependency"""
+    return request.app.state.broadcaster
+
+def get_snapshot_store(request: Request, tenant_id: str = Depends(get_tenant_id)):
+    """Get the tenant's published snapshot store dependency"""
+    return request.app.state.snapshot_stores.get(tenant_id)
+
+def get_bootstrap_store(request: Request, tenant_id: str = Depends(get_tenant_id)):
+    """Get the tenant's cached bootstrap payload store dependency"""
+    return request.app.state.bootstrap_stores.get(tenant_id)
+
+def get_page_store(request: Request, tenant_id: str = Depends(get_tenant_id)):
+    """Get the tenant's rendered landing page store dependency"""
+    return request.app.state.page_stores.get(tenant_id)
+
+def get_page_template(request: Request) -> PageTemplate:
+    """Get compiled landing page template dependency"""
+    return request.app.state.page_template
+
+def get_social_feed(request: Request) -> SocialFeedService:
+    """Get social feed service dependency"""
+    return request.app.state.social_feed
+
+def get_audit_log(request: Request) -> AuditLog:
+    """Get audit log dependency"""
+    return request.app.state.audit
+
 def get_content_service(
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    broadcaster: EventBroadcaster = Depends(get_event_broadcaster),
+    snapshot_store=Depends(get_snapshot_store),
+    tenant_id: str = Depends(get_tenant_id),
+    audit: AuditLog = Depends(get_audit_log)
 ) -> ContentService:
     """Get content service dependency"""
-    return ContentService(db)
+    return ContentService(db, broadcaster, snapshot_store, tenant_id=tenant_id, audit=audit)
+
+def get_public_content_service(
+    db: AsyncIOMotorDatabase = Depends(get_public_database),
+    tenant_id: str = Depends(get_tenant_id)
+) -> ContentService:
+    """Get content service dependency for public reads"""
+    return ContentService(db, tenant_id=tenant_id)
 
 def get_admin_auth_service(
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    request: Request,
+    db: AsyncIOMotorDatabase = Depends(get_database),
+    tenant_id: str = Depends(get_tenant_id),
+    audit: AuditLog = Depends(get_audit_log)
 ) -> AdminAuthService:
     """Get admin auth service dependency"""
-    return AdminAuthService(db)
\ No newline at end of file
+    return AdminAuthService(
+        db,
+        revocation_list=request.app.state.revocation_list,
+        tenant_id=tenant_id,
+        audit=audit
+    )
+
+def get_autosave_buffer(request: Request) -> AutosaveBuffer:
+    """Get autosave buffer dependency"""
+    return request.app.state.autosave
+
+def get_profile_store(request: Request) -> ProfileStore:
+    """Get request profile store dependency"""
+    return request.app.state.profile_store
+
+def get_admission_controller(request: Request) -> AdmissionController:
+    """Get admission controller dependency"""
+    return request.app.state.admission
+
+def get_pool_metrics(request: Request) -> PoolMetrics:
+    """Get Mongo connection pool metrics dependency"""
+    return request.app.state.pool_metrics
+
+def get_backup_service(
+    db: AsyncIOMotorDatabase = Depends(get_database)
+) -> BackupService:
+    """Get backup service dependency"""
+    return BackupService(db)
+
+def get_retention_service(request: Request) -> RetentionService:
+    """Get retention service dependency"""
+    return request.app.state.retention
+
+def get_publish_scheduler(request: Request) -> PublishScheduler:
+    """Get publish scheduler dependency"""
+    return request.app.state.scheduler
\ No newline at end of file
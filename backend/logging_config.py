@@ -0,0 +1,153 @@
+import atexit
+import contextvars
+import json
+import logging
+import os
+import queue
+import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Dict, Any, Tuple
+
+# Per-request context, set by RequestContextMiddleware
+request_context: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    "request_context", default=None
+)
+
+class ContextFilter(logging.Filter):
+    """Stamps records with the current request id, route and tenant
+
+    Runs on the calling thread, since context variables are not visible
+    from the listener thread.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = request_context.get()
+        if context:
+            record.request_id = context["request_id"]
+            route = context["scope"].get("route")
+            record.route = getattr(route, "path", None) or context["scope"].get("path")
+            record.tenant_id = context["scope"].get("state", {}).get("tenant_id")
+        else:
+            record.request_id = None
+            record.route = None
+            record.tenant_id = None
+        return True
+
+class RateLimitFilter(logging.Filter):
+    """Rate-limits repeated warnings and errors
+
+    Records are grouped by logger, level and unformatted message. Within
+    each window the first ``burst`` records pass, after that only one in
+    ``sample_every``; the next record that passes carries the number of
+    suppressed duplicates.
+    """
+
+    def __init__(self, window: float = 10.0, burst: int = 5, sample_every: int = 100):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.sample_every = sample_every
+        self._counters: Dict[Tuple[str, int, str], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING:
+            return True
+
+        now = time.monotonic()
+        key = (record.name, record.levelno, str(record.msg))
+        counter = self._counters.get(key)
+        if counter is None or now - counter[0] >= self.window:
+            suppressed = counter[2] if counter else 0
+            # [window start, seen in window, suppressed since last emit]
+            self._counters[key] = [now, 1, 0]
+            if len(self._counters) > 10000:
+                self._counters.clear()
+            record.suppressed = suppressed
+            return True
+
+        counter[1] += 1
+        if counter[1] <= self.burst or counter[1] % self.sample_every == 0:
+            record.suppressed = counter[2]
+            counter[2] = 0
+            return True
+
+        counter[2] += 1
+        return False
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves message formatting to the listener thread
+
+    The queue is in-process, so records are passed through unformatted
+    instead of being merged and stripped on the event loop. When the queue
+    is full the record is dropped and counted rather than blocking.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+            "route": getattr(record, "route", None),
+            "tenant_id": getattr(record, "tenant_id", None)
+        }
+        if getattr(record, "suppressed", 0):
+            entry["suppressed"] = record.suppressed
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+def configure_logging() -> QueueListener:
+    """Route all logging through a queue drained by a background thread"""
+
+    level = os.environ.get("LOG_LEVEL", "INFO").upper()
+    log_queue: queue.Queue = queue.Queue(maxsize=int(os.environ.get("LOG_QUEUE_SIZE", "10000")))
+
+    output = logging.StreamHandler(sys.stdout)
+    if os.environ.get("LOG_FORMAT", "json").lower() == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s'
+        ))
+
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+    queue_handler.addFilter(RateLimitFilter(
+        window=float(os.environ.get("LOG_RATE_LIMIT_WINDOW_SECONDS", "10")),
+        burst=int(os.environ.get("LOG_RATE_LIMIT_BURST", "5"))
+    ))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+
+    # Send uvicorn's own loggers through the same queue
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+
+    listener = QueueListener(log_queue, output, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
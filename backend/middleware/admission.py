@@ -0,0 +1,232 @@
+import json
+import math
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class RouteClass:
+    """Admission limits for one class of routes (0 disables a limit)"""
+    name: str
+    max_concurrency: int = 0
+    rate: float = 0.0
+    burst: int = 1
+
+    @classmethod
+    def from_env(cls, name: str, max_concurrency: int, rate: float = 0.0, burst: int = 1) -> "RouteClass":
+        prefix = f"ADMISSION_{name.upper()}_"
+        return cls(
+            name=name,
+            max_concurrency=int(os.environ.get(prefix + "CONCURRENCY", str(max_concurrency))),
+            rate=float(os.environ.get(prefix + "RATE", str(rate))),
+            burst=int(os.environ.get(prefix + "BURST", str(burst)))
+        )
+
+class TokenBucket:
+    """Refills ``rate`` tokens per second up to ``burst``"""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, burst: int):
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self, rate: float, burst: int) -> float:
+        """Take a token; returns 0 on success, else seconds until one is available"""
+        now = time.monotonic()
+        self.tokens = min(burst, self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / rate
+
+def classify(method: str, path: str) -> Optional[str]:
+    """Route class of a request (None for routes exempt from admission)"""
+
+    if path.startswith("/api/health") or path in ("/api/content/events", "/api/admin/events"):
+        # Probes must always answer; event streams have their own cap
+        return None
+    if method in ("GET", "HEAD") and (path.startswith("/api/content/") or path in ("/", "/api/", "/api/page")):
+        return "public_read"
+    if method == "POST" and path in ("/api/admin/auth/login", "/api/admin/auth/refresh", "/api/admin/setup"):
+        return "auth"
+    if method == "POST" and path == "/api/status":
+        return "ingest"
+    if path.startswith("/api/admin"):
+        return "admin"
+    return "default"
+
+class AdmissionController:
+    """Per-class concurrency limits and per-client rate limits
+
+    All work of a worker shares ``max_in_flight`` slots, of which
+    ``reserved_public`` can only be used by the public read path, so a
+    flood of logins or status pings cannot starve landing page reads.
+    Rate limits are token buckets per (class, client IP), kept in an LRU
+    of at most ``max_clients`` entries. Everything is in-memory and per
+    worker; rejected requests are answered immediately, never queued.
+
+    Behind ``proxy_hops`` reverse proxies the client IP is taken from
+    ``X-Forwarded-For``: the entry the outermost trusted proxy appended.
+    Entries before it are client-supplied and ignored.
+    """
+
+    def __init__(self,
+                 classes: Dict[str, RouteClass],
+                 max_in_flight: int = 256,
+                 reserved_public: int = 64,
+                 max_clients: int = 10000,
+                 proxy_hops: int = 0):
+        self.classes = classes
+        self.max_in_flight = max_in_flight
+        self.reserved_public = reserved_public
+        self.max_clients = max_clients
+        self.proxy_hops = proxy_hops
+        self.in_flight = 0
+        self._buckets: "OrderedDict[Tuple[str, str], TokenBucket]" = OrderedDict()
+        self._stats = {
+            name: {"in_flight": 0, "peak": 0, "admitted": 0, "shed_concurrency": 0, "shed_rate": 0}
+            for name in classes
+        }
+
+    @classmethod
+    def from_env(cls) -> "AdmissionController":
+        classes = [
+            RouteClass.from_env("public_read", max_concurrency=0),
+            RouteClass.from_env("auth", max_concurrency=4, rate=0.2, burst=5),
+            RouteClass.from_env("ingest", max_concurrency=32, rate=10, burst=20),
+            RouteClass.from_env("admin", max_concurrency=32),
+            RouteClass.from_env("default", max_concurrency=64),
+        ]
+        return cls(
+            {route_class.name: route_class for route_class in classes},
+            max_in_flight=int(os.environ.get("ADMISSION_MAX_IN_FLIGHT", "256")),
+            reserved_public=int(os.environ.get("ADMISSION_RESERVED_PUBLIC", "64")),
+            max_clients=int(os.environ.get("ADMISSION_MAX_CLIENTS", "10000")),
+            proxy_hops=int(os.environ.get("ADMISSION_PROXY_HOPS", "0"))
+        )
+
+    def client_ip(self, scope) -> str:
+        if self.proxy_hops:
+            forwarded = b",".join(value for name, value in scope["headers"] if name == b"x-forwarded-for")
+            hops = [hop.strip() for hop in forwarded.decode("latin-1").split(",") if hop.strip()]
+            if hops:
+                return hops[max(0, len(hops) - self.proxy_hops)]
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    def admit(self, class_name: str, client_ip: str) -> Optional[Tuple[int, float]]:
+        """Take a slot for a request; returns (status, retry_after) when shed"""
+
+        route_class = self.classes[class_name]
+        stats = self._stats[class_name]
+
+        limit = self.max_in_flight
+        if class_name != "public_read":
+            limit -= self.reserved_public
+        if self.in_flight >= limit or (
+            route_class.max_concurrency and stats["in_flight"] >= route_class.max_concurrency
+        ):
+            stats["shed_concurrency"] += 1
+            return 503, 1.0
+
+        if route_class.rate:
+            wait = self._bucket(class_name, client_ip, route_class.burst).take(
+                route_class.rate, route_class.burst
+            )
+            if wait:
+                stats["shed_rate"] += 1
+                return 429, wait
+
+        self.in_flight += 1
+        stats["in_flight"] += 1
+        stats["peak"] = max(stats["peak"], stats["in_flight"])
+        stats["admitted"] += 1
+        return None
+
+    def release(self, class_name: str) -> None:
+        self.in_flight -= 1
+        self._stats[class_name]["in_flight"] -= 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter state and shed counts"""
+
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "reserved_public": self.reserved_public,
+            "tracked_clients": len(self._buckets),
+            "classes": {
+                name: {
+                    "max_concurrency": self.classes[name].max_concurrency,
+                    "rate": self.classes[name].rate,
+                    "burst": self.classes[name].burst,
+                    **stats
+                }
+                for name, stats in self._stats.items()
+            }
+        }
+
+    def _bucket(self, class_name: str, client_ip: str, burst: int) -> TokenBucket:
+        key = (class_name, client_ip)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(burst)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_clients:
+                # Forgetting a client only ever gives it a fresh burst
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+class AdmissionMiddleware:
+    """Sheds requests the controller does not admit with 429/503 and Retry-After"""
+
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Route path, without a tenant prefix moved to root_path
+        path = scope["path"][len(scope.get("root_path", "")):]
+        class_name = classify(scope["method"], path)
+        if class_name is None:
+            await self.app(scope, receive, send)
+            return
+
+        shed = self.controller.admit(class_name, self.controller.client_ip(scope))
+        if shed:
+            status, retry_after = shed
+            await self._reject(send, status, class_name, retry_after)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(class_name)
+
+    @staticmethod
+    async def _reject(send, status: int, class_name: str, retry_after: float) -> None:
+        detail = "Too many requests" if status == 429 else "Server busy, try again shortly"
+        body = json.dumps({"detail": detail, "route_class": class_name}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode())
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
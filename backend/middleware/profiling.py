@@ -0,0 +1,201 @@
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+from services.auth_service import AdminAuthService
+from services.tenant_service import DEFAULT_TENANT
+import logging
+
+logger = logging.getLogger(__name__)
+
+class RequestProfile:
+    """Sampled stacks captured for a single request"""
+
+    def __init__(self, method: str, path: str, trigger: str):
+        self.id = str(uuid.uuid4())
+        self.method = method
+        self.path = path
+        self.trigger = trigger
+        self.status_code: Optional[int] = None
+        self.duration_ms: Optional[float] = None
+        self.created_at = datetime.utcnow()
+        self.stacks: Counter = Counter()
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "trigger": self.trigger,
+            "status_code": self.status_code,
+            "duration_ms": self.duration_ms,
+            "samples": self.samples,
+            "created_at": self.created_at
+        }
+
+    def collapsed(self) -> str:
+        """Folded stacks ("a;b;c count" per line), as read by flamegraph.pl and speedscope"""
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+class ProfileStore:
+    """Bounded ring buffer of recent request profiles"""
+
+    def __init__(self, maxlen: int = 50):
+        self._profiles = deque(maxlen=maxlen)
+
+    def add(self, profile: RequestProfile) -> None:
+        self._profiles.append(profile)
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        for profile in self._profiles:
+            if profile.id == profile_id:
+                return profile
+        return None
+
+    def list(self) -> List[Dict[str, Any]]:
+        return [profile.summary() for profile in reversed(self._profiles)]
+
+def _label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class TaskSampler(threading.Thread):
+    """Samples the stack of one asyncio task from a background thread
+
+    While the task runs, the loop thread's Python stack is recorded. While
+    it is suspended, the chain of awaiting coroutines is recorded instead,
+    ending in the awaited object, so time spent waiting on Mongo shows up
+    under the query that issued it.
+    """
+
+    def __init__(self, task: asyncio.Task, loop, profile: RequestProfile, interval: float):
+        super().__init__(daemon=True, name="request-profiler")
+        self.task = task
+        self.loop = loop
+        self.loop_thread_id = threading.get_ident()
+        self.profile = profile
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    async def stop(self) -> None:
+        """Stop sampling; the join waits off the loop for a sample in progress"""
+        self._stop_event.set()
+        await asyncio.to_thread(self.join)
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                stack = self._sample()
+            except Exception:
+                # The task mutates under us; a torn sample is just skipped
+                continue
+            if stack:
+                self.profile.stacks[";".join(stack)] += 1
+
+    def _sample(self) -> List[str]:
+        coroutine_frames = []
+        awaited = self.task.get_coro()
+        while awaited is not None:
+            frame = getattr(awaited, "cr_frame", None) or getattr(awaited, "gi_frame", None)
+            if frame is None:
+                break
+            coroutine_frames.append(frame)
+            awaited = getattr(awaited, "cr_await", None) or getattr(awaited, "gi_yieldfrom", None)
+
+        if not coroutine_frames:
+            return []
+
+        if asyncio.current_task(self.loop) is self.task:
+            # Running: the loop thread's stack holds the synchronous frames too
+            frame = sys._current_frames().get(self.loop_thread_id)
+            stack = []
+            root = coroutine_frames[0]
+            while frame is not None:
+                stack.append(_label(frame))
+                if frame is root:
+                    break
+                frame = frame.f_back
+            return list(reversed(stack))
+
+        stack = [_label(frame) for frame in coroutine_frames]
+        stack.append(f"[await {type(awaited).__name__}]" if awaited is not None else "[scheduled]")
+        return stack
+
+class ProfilingMiddleware:
+    """Opt-in per-request sampling profiler
+
+    A request is profiled when it carries ``X-Profile: 1`` with a valid
+    admin bearer token, or when it is picked by ``sample_rate``. Other
+    requests pay only a header scan.
+    """
+
+    def __init__(self, app, store: ProfileStore, sample_rate: float = 0.0, interval: float = 0.005):
+        self.app = app
+        self.store = store
+        self.sample_rate = sample_rate
+        self.interval = interval
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trigger = await self._trigger(scope)
+        if not trigger:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope["method"], scope["path"], trigger)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", profile.id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler = TaskSampler(asyncio.current_task(), asyncio.get_running_loop(), profile, self.interval)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profile.duration_ms = (time.perf_counter() - started) * 1000
+            await sampler.stop()
+            self.store.add(profile)
+
+    async def _trigger(self, scope) -> Optional[str]:
+        if self.sample_rate and random.random() < self.sample_rate:
+            return "sampled"
+
+        headers = dict(scope["headers"])
+        if headers.get(b"x-profile") != b"1":
+            return None
+
+        authorization = headers.get(b"authorization", b"").decode()
+        if not authorization.lower().startswith("bearer "):
+            return None
+
+        state = scope["app"].state
+        auth_service = AdminAuthService(
+            state.db,
+            revocation_list=state.revocation_list,
+            tenant_id=scope.get("state", {}).get("tenant_id", DEFAULT_TENANT)
+        )
+        user = await auth_service.verify_token(authorization[7:])
+        if not user:
+            logger.warning("Ignoring profile request with invalid admin token")
+            return None
+
+        return f"admin:{user.username}"
@@ -0,0 +1,32 @@
+import uuid
+from logging_config import request_context
+
+class RequestContextMiddleware:
+    """Assigns a request id and exposes it to logging via a context variable
+
+    An incoming ``X-Request-ID`` header is reused; the id is echoed back on
+    the response.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = dict(scope["headers"]).get(b"x-request-id", b"").decode() or uuid.uuid4().hex
+        token = request_context.set({"request_id": request_id, "scope": scope})
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-request-id", request_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_context.reset(token)
@@ -0,0 +1,53 @@
+import json
+from services.tenant_service import DEFAULT_TENANT
+
+PATH_PREFIX = "/t/"
+
+class TenantMiddleware:
+    """Resolves the tenant of a request and stores it in ``request.state``
+
+    A ``/t/<tenant>/...`` path prefix wins and is appended to ``root_path``
+    so routing ignores it, which makes every route reachable per tenant
+    without separate host names. Otherwise the Host header is looked up
+    in the tenant registry's in-memory host map.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        registry = getattr(scope["app"].state, "tenants", None)
+        state = scope.setdefault("state", {})
+        root_path = scope.get("root_path", "")
+        path = scope["path"][len(root_path):]
+
+        if path.startswith(PATH_PREFIX):
+            tenant_id = path[len(PATH_PREFIX):].split("/", 1)[0]
+            if not registry or not registry.is_known(tenant_id):
+                await self._not_found(send)
+                return
+
+            scope = {**scope, "root_path": root_path + PATH_PREFIX + tenant_id}
+            state["tenant_id"] = tenant_id
+        else:
+            host = dict(scope["headers"]).get(b"host", b"").decode("latin-1")
+            state["tenant_id"] = registry.resolve_host(host) if registry else DEFAULT_TENANT
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _not_found(send) -> None:
+        body = json.dumps({"detail": "Unknown site"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 404,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode())
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
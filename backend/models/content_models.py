@@ -60,8 +60,8 @@ class FooterSection(BaseModel):
     tagline: str = "Crafting spaces that inspire and endure"
     copyright_text: str = "Designed with passion in Ahmedabad"
 
-class LandingPageContent(BaseModel):
-    """Complete landing page content model"""
+class PublishedContent(BaseModel):
+    """Landing page content as served to the public site"""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     version: str = Field(default="1.0")
     is_published: bool = Field(default=False)
@@ -85,6 +85,46 @@ class LandingPageContent(BaseModel):
     created_by: str = "admin"
     updated_by: str = "admin"
 
+class LandingPageContent(PublishedContent):
+    """Complete landing page content model"""
+    tenant_id: str = Field(default="default")
+    revision: int = Field(default=0)
+    pinned: bool = Field(default=False)
+    publish_at: Optional[datetime] = None
+    change_seq: int = Field(default=0)
+    changed_at: Optional[datetime] = None
+
+class StudioInfo(BaseModel):
+    """Studio details shown across the landing page"""
+    name: str
+    tagline: str
+    contact_info: ContactInfo
+    address: StudioAddress
+    social_links: SocialMediaLinks
+
+class SocialPost(BaseModel):
+    """A post from the studio's social feed"""
+    id: str
+    caption: Optional[str] = None
+    media_type: str = "IMAGE"
+    media_url: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    permalink: Optional[str] = None
+    timestamp: Optional[datetime] = None
+
+class SocialFeed(BaseModel):
+    """Social feed with its freshness (fresh, stale or empty)"""
+    status: str
+    posts: List[SocialPost] = []
+    fetched_at: Optional[datetime] = None
+
+class BootstrapPayload(BaseModel):
+    """Everything the landing page needs for first paint"""
+    version: str
+    content: PublishedContent
+    studio: StudioInfo
+    social_feed: SocialFeed
+
 class ContentUpdateRequest(BaseModel):
     """Request model for content updates"""
     hero: Optional[HeroSection] = None
@@ -97,9 +137,37 @@ class ContentUpdateRequest(BaseModel):
     studio_address: Optional[StudioAddress] = None
     social_links: Optional[SocialMediaLinks] = None
     
+class ScheduleRequest(BaseModel):
+    """Request model for scheduled publishing"""
+    publish_at: datetime
+
+class AutosaveResponse(BaseModel):
+    """Autosave acknowledgement returned to the editor"""
+    content_id: str
+    revision: int
+    persisted_revision: int
+    pending: bool
+    flush_due_at: Optional[datetime] = None
+
+class SearchHighlight(BaseModel):
+    """Highlighted snippet of a matching field"""
+    field: str
+    snippet: str
+
+class ContentSearchHit(BaseModel):
+    """Ranked content search result"""
+    id: str
+    version: str
+    is_published: bool
+    updated_at: datetime
+    updated_by: str
+    score: float
+    highlights: List[SearchHighlight] = []
+
 class AdminUser(BaseModel):
     """Admin user model"""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    tenant_id: str = "default"
     username: str
     password_hash: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -109,12 +177,51 @@ class AdminUser(BaseModel):
 class AdminSession(BaseModel):
     """Admin session model"""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    tenant_id: str = "default"
     user_id: str
     token: str
     expires_at: datetime
     created_at: datetime = Field(default_factory=datetime.utcnow)
     last_accessed: datetime = Field(default_factory=datetime.utcnow)
 
+class Tenant(BaseModel):
+    """A site served from this deployment"""
+    id: str
+    name: str
+    hosts: List[str] = []
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+class TenantCreateRequest(BaseModel):
+    """Request model for registering a site and its first admin"""
+    id: str
+    name: str
+    hosts: List[str] = []
+    admin_username: str
+    admin_password: str
+
+class AuditEntry(BaseModel):
+    """One append-only audit record"""
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    tenant_id: str = "default"
+    action: str
+    actor: str
+    content_id: Optional[str] = None
+    at: datetime = Field(default_factory=datetime.utcnow)
+    details: Dict[str, Any] = {}
+
+class AuditPage(BaseModel):
+    """A page of audit entries, newest first"""
+    entries: List[AuditEntry]
+    next_cursor: Optional[str] = None
+
+class ContentChanges(BaseModel):
+    """Versions written or deleted after a client's last sync"""
+    changed: List[LandingPageContent] = []
+    deleted: List[str] = []
+    next_since: int
+    has_more: bool = False
+    reset: bool = False
+
 class LoginRequest(BaseModel):
     """Login request model"""
     username: str
@@ -124,4 +231,10 @@ class LoginResponse(BaseModel):
     """Login response model"""
     access_token: str
     expires_at: datetime
-    user_info: Dict[str, Any]
\ No newline at end of file
+    user_info: Dict[str, Any]
+    refresh_token: Optional[str] = None
+    refresh_expires_at: Optional[datetime] = None
+
+class RefreshRequest(BaseModel):
+    """Token refresh request model"""
+    refresh_token: str
\ No newline at end of file
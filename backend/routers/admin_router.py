@@ -1,13 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, status
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
 from services.auth_service import AdminAuthService
 from services.content_service import ContentService
+from services.autosave_service import AutosaveBuffer
+from middleware.profiling import ProfileStore
+from middleware.admission import AdmissionController
+from database import PoolMetrics
+from services.backup_service import BackupService, BACKUP_COLLECTIONS, SENSITIVE_COLLECTIONS, iter_gzip_lines
+from services.retention_service import RetentionService
+from services.publish_scheduler import PublishScheduler
+from services.tenant_service import TenantRegistry, DEFAULT_TENANT
+from services.audit_service import AuditLog
+from services.event_broadcaster import EventBroadcaster
 from models.content_models import (
-    LoginRequest, LoginResponse, AdminUser, 
-    LandingPageContent, ContentUpdateRequest
+    LoginRequest, LoginResponse, RefreshRequest, AdminUser, 
+    LandingPageContent, ContentUpdateRequest, AutosaveResponse, ContentSearchHit,
+    ScheduleRequest, Tenant, TenantCreateRequest, AuditPage, ContentChanges
+)
+from dependencies import (
+    get_admin_auth_service, get_content_service, get_autosave_buffer, get_profile_store,
+    get_backup_service, get_retention_service, get_publish_scheduler, get_tenant_registry,
+    get_admission_controller, get_audit_log, get_event_broadcaster, get_pool_metrics
 )
-from dependencies import get_admin_auth_service, get_content_service
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +47,18 @@ async def get_current_admin_user(
         )
     return user
 
+async def get_platform_admin_user(
+    current_user: AdminUser = Depends(get_current_admin_user)
+) -> AdminUser:
+    """Admin of the default tenant (deployment-wide operations)"""
+    
+    if current_user.tenant_id != DEFAULT_TENANT:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Requires a deployment administrator"
+        )
+    return current_user
+
 # Authentication endpoints
 @router.post("/auth/login", response_model=LoginResponse)
 async def admin_login(
@@ -59,12 +88,34 @@ async def admin_login(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Login error: {str(e)}")
+        logger.error("Login error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Login failed"
         )
 
+@router.post("/auth/refresh", response_model=LoginResponse)
+async def admin_refresh(
+    refresh_request: RefreshRequest,
+    auth_service: AdminAuthService = Depends(get_admin_auth_service)
+):
+    """Exchange a refresh token for a new access token (stateless mode)"""
+    
+    if not auth_service.stateless:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Token refresh is not enabled"
+        )
+    
+    login_response = await auth_service.refresh_access_token(refresh_request.refresh_token)
+    if not login_response:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token"
+        )
+    
+    return login_response
+
 @router.post("/auth/logout")
 async def admin_logout(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -77,7 +128,7 @@ async def admin_logout(
         return {"success": success, "message": "Logged out successfully"}
         
     except Exception as e:
-        logger.error(f"Logout error: {str(e)}")
+        logger.error("Logout error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Logout failed"
@@ -92,6 +143,7 @@ async def get_current_user_info(
     return {
         "id": current_user.id,
         "username": current_user.username,
+        "tenant_id": current_user.tenant_id,
         "last_login": current_user.last_login,
         "created_at": current_user.created_at
     }
@@ -112,7 +164,7 @@ async def get_published_content(
         return content
         
     except Exception as e:
-        logger.error(f"Failed to get published content: {str(e)}")
+        logger.error("Failed to get published content: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve content"
@@ -130,12 +182,59 @@ async def get_all_content_versions(
         return versions
         
     except Exception as e:
-        logger.error(f"Failed to get content versions: {str(e)}")
+        logger.error("Failed to get content versions: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve content versions"
         )
 
+@router.get("/content/changes", response_model=ContentChanges)
+async def get_content_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    current_user: AdminUser = Depends(get_current_admin_user),
+    content_service: ContentService = Depends(get_content_service)
+):
+    """Get versions written or deleted after change ``since`` (0 for everything)"""
+    
+    try:
+        return await content_service.get_changes(since=since, limit=limit)
+        
+    except Exception as e:
+        logger.error("Failed to get content changes: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve content changes"
+        )
+
+@router.get("/content/search", response_model=List[ContentSearchHit])
+async def search_content(
+    q: str = Query(..., min_length=1),
+    updated_by: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: AdminUser = Depends(get_current_admin_user),
+    content_service: ContentService = Depends(get_content_service)
+):
+    """Full-text search over content versions"""
+    
+    try:
+        return await content_service.search_content(
+            query=q,
+            updated_by=updated_by,
+            start=start,
+            end=end,
+            limit=limit
+        )
+        
+    except Exception as e:
+        logger.error("Failed to search content: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to search content"
+        )
+
 @router.get("/content/{content_id}", response_model=LandingPageContent)
 async def get_content_by_id(
     content_id: str,
@@ -157,7 +256,7 @@ async def get_content_by_id(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get content: {str(e)}")
+        logger.error("Failed to get content: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve content"
@@ -180,7 +279,7 @@ async def create_content_draft(
         return draft
         
     except Exception as e:
-        logger.error(f"Failed to create content draft: {str(e)}")
+        logger.error("Failed to create content draft: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create draft"
@@ -213,21 +312,98 @@ async def update_content(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to update content: {str(e)}")
+        logger.error("Failed to update content: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update content"
         )
 
+@router.put("/content/{content_id}/autosave", response_model=AutosaveResponse)
+async def autosave_content(
+    content_id: str,
+    updates: ContentUpdateRequest,
+    current_user: AdminUser = Depends(get_current_admin_user),
+    autosave: AutosaveBuffer = Depends(get_autosave_buffer)
+):
+    """Buffer an editor autosave (persisted once per flush window)"""
+    
+    try:
+        state = await autosave.record_edit(
+            content_id=content_id,
+            updates=updates,
+            updated_by=current_user.username,
+            tenant_id=current_user.tenant_id
+        )
+        
+        if not state:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Content not found"
+            )
+        
+        return state
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to autosave content: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to autosave content"
+        )
+
+@router.post("/content/{content_id}/save", response_model=LandingPageContent)
+async def save_content(
+    content_id: str,
+    current_user: AdminUser = Depends(get_current_admin_user),
+    content_service: ContentService = Depends(get_content_service),
+    autosave: AutosaveBuffer = Depends(get_autosave_buffer)
+):
+    """Persist buffered autosave edits immediately"""
+    
+    try:
+        flushed = await autosave.flush(content_id, current_user.tenant_id)
+        
+        content = await content_service.get_content_by_id(content_id)
+        if not content:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Content not found"
+            )
+        if not flushed:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Buffered edits could not be saved, try again"
+            )
+        
+        return content
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to save content: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to save content"
+        )
+
 @router.post("/content/{content_id}/publish")
 async def publish_content(
     content_id: str,
     current_user: AdminUser = Depends(get_current_admin_user),
-    content_service: ContentService = Depends(get_content_service)
+    content_service: ContentService = Depends(get_content_service),
+    autosave: AutosaveBuffer = Depends(get_autosave_buffer)
 ):
     """Publish content"""
     
     try:
+        # Make sure buffered edits go live with the publish
+        if not await autosave.flush(content_id, current_user.tenant_id):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Buffered edits could not be saved, publish aborted"
+            )
+        
         success = await content_service.publish_content(
             content_id=content_id,
             published_by=current_user.username
@@ -244,22 +420,132 @@ async def publish_content(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to publish content: {str(e)}")
+        logger.error("Failed to publish content: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to publish content"
         )
 
+@router.post("/content/{content_id}/schedule")
+async def schedule_publish(
+    content_id: str,
+    schedule: ScheduleRequest,
+    current_user: AdminUser = Depends(get_current_admin_user),
+    content_service: ContentService = Depends(get_content_service)
+):
+    """Schedule content to be published at a given time"""
+    
+    publish_at = schedule.publish_at
+    if publish_at.tzinfo:
+        publish_at = publish_at.astimezone(timezone.utc).replace(tzinfo=None)
+    
+    try:
+        scheduled = await content_service.schedule_publish(
+            content_id=content_id,
+            publish_at=publish_at,
+            scheduled_by=current_user.username
+        )
+        
+        if not scheduled:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Content not found or already published"
+            )
+        
+        return {"success": True, "publish_at": publish_at}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to schedule publish: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to schedule publish"
+        )
+
+@router.delete("/content/{content_id}/schedule")
+async def cancel_scheduled_publish(
+    content_id: str,
+    current_user: AdminUser = Depends(get_current_admin_user),
+    content_service: ContentService = Depends(get_content_service)
+):
+    """Cancel a scheduled publish"""
+    
+    if not await content_service.cancel_scheduled_publish(content_id, current_user.username):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No scheduled publish for this content"
+        )
+    
+    return {"success": True, "message": "Scheduled publish cancelled"}
+
+@router.get("/schedule")
+async def get_publish_schedule(
+    current_user: AdminUser = Depends(get_current_admin_user),
+    content_service: ContentService = Depends(get_content_service),
+    scheduler: PublishScheduler = Depends(get_publish_scheduler)
+):
+    """List pending scheduled publishes and scheduler status"""
+    
+    scheduled = await content_service.get_scheduled_content()
+    return {
+        "scheduled": [
+            {
+                "id": content.id,
+                "version": content.version,
+                "publish_at": content.publish_at,
+                "scheduled_by": content.updated_by
+            }
+            for content in scheduled
+        ],
+        "scheduler": scheduler.get_status()
+    }
+
+@router.post("/content/{content_id}/pin")
+async def pin_content(
+    content_id: str,
+    current_user: AdminUser = Depends(get_current_admin_user),
+    content_service: ContentService = Depends(get_content_service)
+):
+    """Pin content so retention never removes it"""
+    
+    if not await content_service.set_pinned(content_id, True, current_user.username):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Content not found"
+        )
+    
+    return {"success": True, "message": "Content pinned"}
+
+@router.delete("/content/{content_id}/pin")
+async def unpin_content(
+    content_id: str,
+    current_user: AdminUser = Depends(get_current_admin_user),
+    content_service: ContentService = Depends(get_content_service)
+):
+    """Unpin content"""
+    
+    if not await content_service.set_pinned(content_id, False, current_user.username):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Content not found"
+        )
+    
+    return {"success": True, "message": "Content unpinned"}
+
 @router.delete("/content/{content_id}")
 async def delete_content(
     content_id: str,
     current_user: AdminUser = Depends(get_current_admin_user),
-    content_service: ContentService = Depends(get_content_service)
+    content_service: ContentService = Depends(get_content_service),
+    autosave: AutosaveBuffer = Depends(get_autosave_buffer)
 ):
     """Delete content draft"""
     
     try:
-        success = await content_service.delete_content(content_id)
+        success = await content_service.delete_content(content_id, current_user.username)
+        if success:
+            autosave.discard(content_id)
         
         if not success:
             raise HTTPException(
@@ -272,7 +558,7 @@ async def delete_content(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete content: {str(e)}")
+        logger.error("Failed to delete content: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete content"
@@ -290,12 +576,251 @@ async def get_content_summary(
         return summary
         
     except Exception as e:
-        logger.error(f"Failed to get content summary: {str(e)}")
+        logger.error("Failed to get content summary: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get content summary"
         )
 
+# Retention endpoints
+@router.get("/retention")
+async def get_retention_status(
+    current_user: AdminUser = Depends(get_platform_admin_user),
+    retention: RetentionService = Depends(get_retention_service)
+):
+    """Get the retention policy and the last compaction report"""
+    
+    return {
+        "policy": retention.policy,
+        "last_report": retention.last_report
+    }
+
+@router.post("/retention/run")
+async def run_retention(
+    current_user: AdminUser = Depends(get_platform_admin_user),
+    retention: RetentionService = Depends(get_retention_service)
+):
+    """Run a compaction pass now"""
+    
+    try:
+        return await retention.enforce()
+        
+    except Exception as e:
+        logger.error("Retention run error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Retention run failed"
+        )
+
+# Profiling endpoints
+@router.get("/profiles")
+async def list_profiles(
+    current_user: AdminUser = Depends(get_platform_admin_user),
+    profile_store: ProfileStore = Depends(get_profile_store)
+):
+    """List recently captured request profiles"""
+    
+    return profile_store.list()
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def download_profile(
+    profile_id: str,
+    current_user: AdminUser = Depends(get_platform_admin_user),
+    profile_store: ProfileStore = Depends(get_profile_store)
+):
+    """Download a profile as folded stacks (flamegraph.pl / speedscope)"""
+    
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    
+    return PlainTextResponse(
+        profile.collapsed(),
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.folded"'}
+    )
+
+# Audit endpoints
+@router.get("/audit", response_model=AuditPage)
+async def get_audit_entries(
+    actor: Optional[str] = None,
+    content_id: Optional[str] = None,
+    action: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    current_user: AdminUser = Depends(get_current_admin_user),
+    audit: AuditLog = Depends(get_audit_log)
+):
+    """Page through this site's audit trail, newest first"""
+    
+    try:
+        return await audit.query(
+            current_user.tenant_id,
+            actor=actor,
+            content_id=content_id,
+            action=action,
+            start=start,
+            end=end,
+            limit=limit,
+            cursor=cursor
+        )
+    
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    except Exception as e:
+        logger.error("Audit query error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve audit entries"
+        )
+
+# Event stream endpoints
+@router.get("/events")
+async def admin_events(
+    current_user: AdminUser = Depends(get_current_admin_user),
+    broadcaster: EventBroadcaster = Depends(get_event_broadcaster)
+):
+    """Server-Sent Events stream of all content events of this site (drafts included)"""
+    
+    subscription = broadcaster.subscribe(current_user.tenant_id, admin=True)
+    if not subscription:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many event stream connections",
+            headers={"Retry-After": "30"}
+        )
+    
+    return StreamingResponse(
+        broadcaster.stream(subscription),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+# Admission control endpoints
+@router.get("/admission")
+async def get_admission_stats(
+    current_user: AdminUser = Depends(get_platform_admin_user),
+    admission: AdmissionController = Depends(get_admission_controller)
+):
+    """Get admission limiter state and shed counts for this worker"""
+    
+    return admission.get_stats()
+
+# Database endpoints
+@router.get("/database/pool")
+async def get_pool_stats(
+    current_user: AdminUser = Depends(get_platform_admin_user),
+    pool_metrics: PoolMetrics = Depends(get_pool_metrics)
+):
+    """Get connection pool, heartbeat and readiness ping stats for this worker"""
+    
+    return pool_metrics.snapshot()
+
+# Backup endpoints
+@router.get("/backup/export")
+async def export_backup(
+    collections: Optional[List[str]] = Query(None),
+    current_user: AdminUser = Depends(get_platform_admin_user),
+    backup_service: BackupService = Depends(get_backup_service)
+):
+    """Stream collections as gzip-compressed NDJSON
+    
+    Admin users are left out unless requested in ``collections``.
+    """
+    
+    selected = collections or [name for name in BACKUP_COLLECTIONS if name not in SENSITIVE_COLLECTIONS]
+    unknown = set(selected) - set(BACKUP_COLLECTIONS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown collections: {', '.join(sorted(unknown))}"
+        )
+    
+    filename = f"cms-backup-{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.ndjson.gz"
+    return StreamingResponse(
+        backup_service.export_stream(selected),
+        media_type="application/gzip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@router.post("/backup/import")
+async def import_backup(
+    file: UploadFile = File(...),
+    current_user: AdminUser = Depends(get_platform_admin_user),
+    backup_service: BackupService = Depends(get_backup_service)
+):
+    """Upsert documents from a gzip-compressed NDJSON backup"""
+    
+    try:
+        counts = await backup_service.import_lines(iter_gzip_lines(file.read))
+        return {"success": True, "imported": counts}
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error("Backup import error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Backup import failed"
+        )
+
+# Tenant endpoints
+@router.get("/tenants", response_model=List[Tenant])
+async def list_tenants(
+    current_user: AdminUser = Depends(get_platform_admin_user),
+    registry: TenantRegistry = Depends(get_tenant_registry)
+):
+    """List sites served by this deployment"""
+    
+    return await registry.list_tenants()
+
+@router.post("/tenants", response_model=Tenant)
+async def create_tenant(
+    request: TenantCreateRequest,
+    current_user: AdminUser = Depends(get_platform_admin_user),
+    registry: TenantRegistry = Depends(get_tenant_registry),
+    auth_service: AdminAuthService = Depends(get_admin_auth_service)
+):
+    """Register a site, the host names it is served on and its first admin"""
+    
+    try:
+        tenant = await registry.create_tenant(request.id, request.name, request.hosts)
+        
+        # The only way into a new site; /setup is closed once any admin exists
+        tenant_auth = AdminAuthService(
+            auth_service.db,
+            revocation_list=auth_service.revocation_list,
+            tenant_id=tenant.id,
+            audit=auth_service.audit
+        )
+        await tenant_auth.create_admin_user(request.admin_username, request.admin_password)
+        return tenant
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        logger.error("Tenant creation error: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create tenant"
+        )
+
 # Setup endpoint for initial admin user creation
 @router.post("/setup", include_in_schema=False)
 async def setup_admin(
@@ -303,10 +828,20 @@ async def setup_admin(
     password: str = "admin123",
     auth_service: AdminAuthService = Depends(get_admin_auth_service)
 ):
-    """Setup initial admin user (development only)"""
+    """Setup initial admin user (development only)
+    
+    Creates the deployment administrator; admins of other sites are
+    created together with their tenant.
+    """
     
     try:
-        # Check if any admin user exists
+        if auth_service.tenant_id != DEFAULT_TENANT:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Not found"
+            )
+        
+        # Check if any admin user exists, on any site
         existing_count = await auth_service.db.admin_users.count_documents({})
         if existing_count > 0:
             raise HTTPException(
@@ -326,7 +861,7 @@ async def setup_admin(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Setup error: {str(e)}")
+        logger.error("Setup error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Setup failed"
@@ -1,34 +1,177 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from typing import Dict, Any
 from services.content_service import ContentService
-from models.content_models import LandingPageContent
-from dependencies import get_content_service
+from models.content_models import LandingPageContent, PublishedContent, BootstrapPayload, StudioInfo
+from services.event_broadcaster import EventBroadcaster
+from services.snapshot_store import PublishedSnapshot, build_snapshot, snapshot_from_bytes
+from services.social_feed_service import SocialFeedService
+from dependencies import (
+    get_public_content_service, get_content_service, get_event_broadcaster, get_snapshot_store, get_tenant_id,
+    get_bootstrap_store, get_social_feed
+)
+import asyncio
+import hashlib
+import os
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Longest the bootstrap waits for optional parts (the social feed)
+BOOTSTRAP_PART_TIMEOUT_SECONDS = float(os.environ.get("BOOTSTRAP_PART_TIMEOUT_SECONDS", "0.3"))
+
 router = APIRouter(prefix="/api/content", tags=["Content"])
 
-@router.get("/landing-page", response_model=LandingPageContent)
+class SnapshotResponse(Response):
+    """Response whose body is a pre-serialized (possibly mmap-backed) buffer"""
+    
+    def render(self, content) -> bytes:
+        # Memoryviews are written to the transport as-is, without a copy
+        return content
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an ``Accept-Encoding`` header allows gzip (``gzip;q=0`` refuses it)"""
+    
+    wildcard = False
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return quality > 0
+        if coding == "*":
+            wildcard = quality > 0
+    return wildcard
+
+def snapshot_response(request: Request,
+                      snapshot: PublishedSnapshot,
+                      media_type: str = "application/json") -> Response:
+    """Serve a published snapshot with ETag validation and gzip negotiation"""
+    
+    headers = {
+        "ETag": snapshot.etag,
+        "Cache-Control": "public, max-age=0, must-revalidate",
+        "Vary": "Accept-Encoding"
+    }
+    
+    if request.headers.get("if-none-match") == snapshot.etag:
+        return Response(status_code=304, headers=headers)
+    
+    if accepts_gzip(request.headers.get("accept-encoding", "")):
+        headers["Content-Encoding"] = "gzip"
+        return SnapshotResponse(snapshot.compressed, media_type=media_type, headers=headers)
+    
+    return SnapshotResponse(snapshot.plain, media_type=media_type, headers=headers)
+
+async def load_published_snapshot(content_service: ContentService,
+                                  snapshot_store,
+                                  primary_service: ContentService) -> PublishedSnapshot:
+    """Published snapshot from the store, rebuilt from the database on a miss
+    
+    ``content_service`` reads from the public (replica-routed) handle; the
+    "nothing published yet" decision and the default insert are made on
+    the primary, since a lagging secondary can miss a published version.
+    """
+    
+    snapshot = snapshot_store.current()
+    if snapshot:
+        return snapshot
+    
+    content = await content_service.get_published_content()
+    
+    if not content:
+        # Initialize default content if none exists
+        content = await primary_service.initialize_default_content()
+    
+    snapshot = build_snapshot(content)
+    snapshot_store.set(snapshot)
+    return snapshot
+
+def studio_info(content: PublishedContent) -> StudioInfo:
+    """Studio details derived from the published content"""
+    
+    return StudioInfo(
+        name=content.footer.studio_name,
+        tagline=content.footer.tagline,
+        contact_info=content.contact_info,
+        address=content.studio_address,
+        social_links=content.social_links
+    )
+
+@router.get("/landing-page", response_model=PublishedContent)
 async def get_landing_page_content(
-    content_service: ContentService = Depends(get_content_service)
+    request: Request,
+    content_service: ContentService = Depends(get_public_content_service),
+    primary_service: ContentService = Depends(get_content_service),
+    snapshot_store=Depends(get_snapshot_store)
 ):
     """Get current landing page content for frontend display"""
     
     try:
-        content = await content_service.get_published_content()
+        snapshot = await load_published_snapshot(content_service, snapshot_store, primary_service)
+        return snapshot_response(request, snapshot)
         
-        if not content:
-            # Initialize default content if none exists
-            content = await content_service.initialize_default_content()
+    except Exception as e:
+        logger.error("Failed to get landing page content: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to retrieve landing page content"
+        )
+
+@router.get("/bootstrap", response_model=BootstrapPayload)
+async def get_bootstrap(
+    request: Request,
+    content_service: ContentService = Depends(get_public_content_service),
+    primary_service: ContentService = Depends(get_content_service),
+    snapshot_store=Depends(get_snapshot_store),
+    bootstrap_store=Depends(get_bootstrap_store),
+    social_feed: SocialFeedService = Depends(get_social_feed),
+    tenant_id: str = Depends(get_tenant_id)
+):
+    """Everything the landing page needs for first paint, in one response
+    
+    Content and social feed are gathered concurrently; the feed is given at
+    most BOOTSTRAP_PART_TIMEOUT_SECONDS and otherwise served stale or
+    empty. The payload is cached until the version of either part changes.
+    """
+    
+    try:
+        snapshot, feed = await asyncio.gather(
+            load_published_snapshot(content_service, snapshot_store, primary_service),
+            social_feed.get_feed(tenant_id, timeout=BOOTSTRAP_PART_TIMEOUT_SECONDS)
+        )
         
-        return content
+        composite = f"{snapshot.etag}|{social_feed.version(tenant_id, feed)}"
+        version = hashlib.sha1(composite.encode()).hexdigest()[:20]
+        
+        cached = bootstrap_store.current()
+        if cached and cached.version == version:
+            return snapshot_response(request, cached)
+        
+        content = PublishedContent.model_validate_json(bytes(snapshot.plain))
+        payload = BootstrapPayload(
+            version=version,
+            content=content,
+            studio=studio_info(content),
+            social_feed=feed
+        )
+        bootstrap = snapshot_from_bytes(content.id, version, payload.model_dump_json().encode())
+        bootstrap_store.set(bootstrap)
+        
+        return snapshot_response(request, bootstrap)
         
     except Exception as e:
-        logger.error(f"Failed to get landing page content: {str(e)}")
+        logger.error("Failed to build landing page bootstrap: %s", e)
         raise HTTPException(
             status_code=500,
-            detail="Failed to retrieve landing page content"
+            detail="Failed to retrieve landing page"
         )
 
 @router.get("/preview/{content_id}", response_model=LandingPageContent)
@@ -36,7 +179,7 @@ async def preview_content(
     content_id: str,
     content_service: ContentService = Depends(get_content_service)
 ):
-    """Preview content by ID (for admin preview)"""
+    """Preview content by ID (for admin preview, read from the primary)"""
     
     try:
         content = await content_service.get_content_by_id(content_id)
@@ -52,8 +195,35 @@ async def preview_content(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to preview content: {str(e)}")
+        logger.error("Failed to preview content: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Failed to retrieve content for preview"
-        )
\ No newline at end of file
+        )
+
+@router.get("/events")
+async def content_events(
+    broadcaster: EventBroadcaster = Depends(get_event_broadcaster),
+    tenant_id: str = Depends(get_tenant_id)
+):
+    """Server-Sent Events stream of changes to the site's live page
+    
+    Draft edits are only sent on the authenticated /api/admin/events stream.
+    """
+    
+    subscription = broadcaster.subscribe(tenant_id)
+    if not subscription:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many event stream connections",
+            headers={"Retry-After": "30"}
+        )
+    
+    return StreamingResponse(
+        broadcaster.stream(subscription),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
\ No newline at end of file
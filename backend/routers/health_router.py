@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+import asyncio
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/health", tags=["Health"])
+
+# The probes are unauthenticated: they report status only. Pool details
+# (per-host stats) are on the admin API at /api/admin/database/pool.
+
+@router.get("/live")
+async def liveness():
+    """Liveness probe (process is up, no database access)"""
+
+    return {"status": "alive"}
+
+@router.get("/ready")
+async def readiness(request: Request):
+    """Readiness probe (primary reachable within the ping timeout)"""
+
+    started = time.perf_counter()
+
+    try:
+        await asyncio.wait_for(
+            request.app.state.mongo_client.admin.command("ping"),
+            timeout=5
+        )
+        request.app.state.pool_metrics.record_ping((time.perf_counter() - started) * 1000)
+
+        return {"status": "ready"}
+
+    except Exception as e:
+        # Details stay in the log
+        logger.warning("Readiness check failed: %s", e)
+        return JSONResponse(
+            status_code=503,
+            content={"status": "unavailable"}
+        )
@@ -0,0 +1,59 @@
+"""Server-rendered landing page
+
+Served at ``/api/page``, which the ingress already routes to the backend
+(``/`` goes to the frontend host). To serve it as the site's front page,
+point the ingress's ``/`` at ``/api/page``, or run the backend alone with
+``FRONTEND_BUILD_DIR`` set, where ``/`` answers too. Without a frontend
+build the page is the static hero only, with no bundle to hydrate it.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import HTMLResponse
+from services.content_service import ContentService
+from models.content_models import PublishedContent
+from services.page_renderer import PageTemplate
+from services.snapshot_store import snapshot_from_bytes
+from routers.content_router import load_published_snapshot, snapshot_response
+from dependencies import (
+    get_public_content_service, get_content_service, get_snapshot_store, get_page_store, get_page_template
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["Page"])
+
+@router.get("/", response_class=HTMLResponse, include_in_schema=False)
+@router.get("/api/page", response_class=HTMLResponse, include_in_schema=False)
+async def get_landing_page(
+    request: Request,
+    content_service: ContentService = Depends(get_public_content_service),
+    primary_service: ContentService = Depends(get_content_service),
+    snapshot_store=Depends(get_snapshot_store),
+    page_store=Depends(get_page_store),
+    template: PageTemplate = Depends(get_page_template)
+):
+    """Landing page with the published content rendered into the HTML shell
+    
+    The rendered page is cached per tenant and keyed by the published
+    snapshot's ETag, so a publish invalidates it and every other request is
+    served from the cached (pre-compressed) bytes.
+    """
+    
+    try:
+        snapshot = await load_published_snapshot(content_service, snapshot_store, primary_service)
+        version = f"{template.digest}:{snapshot.etag}"
+        
+        page = page_store.current()
+        if not page or page.version != version:
+            content = PublishedContent.model_validate_json(bytes(snapshot.plain))
+            page = snapshot_from_bytes(content.id, version, template.render(content, snapshot.plain))
+            page_store.set(page)
+        
+        return snapshot_response(request, page, media_type="text/html; charset=utf-8")
+        
+    except Exception as e:
+        logger.error("Failed to render landing page: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to render landing page"
+        )
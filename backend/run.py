@@ -0,0 +1,129 @@
+"""Production launcher: preloaded app, N uvicorn workers, shared snapshot.
+
+    python run.py --workers 4 --port 8001
+
+The app is imported once in the launcher and workers are forked from it;
+each worker opens its own Mongo client in the app's startup. A separate
+publisher process, started with spawn so no client state is ever forked,
+keeps the shared published snapshots (one
+``services.snapshot_store.SharedSnapshotStore`` per tenant) up to date,
+so workers serve landing pages from shared memory without hitting Mongo.
+"""
+import asyncio
+import multiprocessing
+import os
+import signal
+import socket
+import tempfile
+import typer
+import logging
+
+def _default_snapshot_dir(port: int) -> str:
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, f"studio-cms-{port}")
+
+def _bind(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+def _serve(sock: socket.socket, log_level: str) -> None:
+    import uvicorn
+    import server
+    from logging_config import configure_logging
+
+    # The log listener thread does not survive fork
+    configure_logging()
+    config = uvicorn.Config(server.app, lifespan="on", log_level=log_level, log_config=None)
+    uvicorn.Server(config).run(sockets=[sock])
+
+def _publish(interval: float) -> None:
+    import server
+    from database import create_mongo_client, get_primary_database
+    from services.snapshot_store import SnapshotPublisher
+
+    async def run():
+        client, _ = create_mongo_client(server.mongo_url)
+        publisher = SnapshotPublisher(
+            get_primary_database(client, os.environ['DB_NAME']),
+            server.create_snapshot_stores(),
+            interval=interval
+        )
+        try:
+            await publisher.run()
+        finally:
+            client.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+async def _supervise(processes, starters) -> None:
+    """Restart exited processes (``starters[i]`` starts ``processes[i]``) until signalled"""
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    while not stop.is_set():
+        for index, process in enumerate(processes):
+            if not process.is_alive():
+                logging.getLogger(__name__).warning(
+                    "Process %s exited with %s, restarting", process.pid, process.exitcode
+                )
+                processes[index] = starters[index]()
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=1)
+        except asyncio.TimeoutError:
+            pass
+
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join(timeout=10)
+
+def main(
+    host: str = typer.Option("0.0.0.0", help="Bind address"),
+    port: int = typer.Option(8001, help="Bind port"),
+    workers: int = typer.Option(multiprocessing.cpu_count(), help="Number of worker processes"),
+    snapshot_dir: str = typer.Option(None, help="Shared snapshot directory (default: /dev/shm)"),
+    log_level: str = typer.Option("info", help="Uvicorn log level"),
+):
+    """Launch the CMS API with preforked workers"""
+
+    os.environ["SNAPSHOT_DIR"] = snapshot_dir or _default_snapshot_dir(port)
+
+    # Preload: import the app (and its config) once before forking; the
+    # launcher itself never connects to Mongo
+    import server
+
+    logger = logging.getLogger(__name__)
+    sock = _bind(host, port)
+    fork = multiprocessing.get_context("fork")
+    spawn = multiprocessing.get_context("spawn")
+    interval = float(os.environ.get("SNAPSHOT_POLL_SECONDS", "2"))
+
+    def start_worker():
+        process = fork.Process(target=_serve, args=(sock, log_level), daemon=False)
+        process.start()
+        return process
+
+    def start_publisher():
+        process = spawn.Process(target=_publish, args=(interval,), daemon=False)
+        process.start()
+        return process
+
+    starters = [start_publisher] + [start_worker] * workers
+    processes = [start() for start in starters]
+    logger.info("Started %s workers on %s:%s (snapshot: %s)",
+                workers, host, port, os.environ["SNAPSHOT_DIR"])
+
+    asyncio.run(_supervise(processes, starters))
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -1,25 +1,56 @@
-from fastapi import FastAPI, APIRouter
+from fastapi import FastAPI, APIRouter, Depends, HTTPException
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Import new routers
-from routers import admin_router, content_router
+from fastapi.staticfiles import StaticFiles
+from routers import admin_router, content_router, health_router, page_router
+from database import create_mongo_client, get_primary_database, get_public_database
+from middleware.profiling import ProfilingMiddleware, ProfileStore
+from middleware.request_context import RequestContextMiddleware
+from middleware.tenant import TenantMiddleware
+from middleware.admission import AdmissionMiddleware, AdmissionController
+from logging_config import configure_logging
+from services.autosave_service import AutosaveBuffer
+from services.revocation_service import RevocationList
+from services.event_broadcaster import EventBroadcaster
+from services.snapshot_store import LocalSnapshotStore, SharedSnapshotStore, TenantSnapshotStores
+from services.tenant_service import TenantRegistry
+from services.social_feed_service import SocialFeedService
+from services.audit_service import AuditLog
+from services.page_renderer import PageTemplate
+from services.content_service import ContentService
+from services.status_rollup_service import StatusRollupService
+from services.retention_service import RetentionService, RetentionPolicy
+from services.publish_scheduler import PublishScheduler
+from routers.admin_router import get_platform_admin_user
+from models.content_models import AdminUser
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# Configure logging (queue-based, formatted off the event loop)
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# MongoDB connection, created per process in startup: run.py imports this
+# module before forking workers, and a client must not cross a fork
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+client = pool_metrics = db = public_db = None
+
+def connect_database() -> None:
+    """Create this process's Mongo client and database handles"""
+    global client, pool_metrics, db, public_db
+    client, pool_metrics = create_mongo_client(mongo_url)
+    db = get_primary_database(client, os.environ['DB_NAME'])
+    public_db = get_public_database(client, os.environ['DB_NAME'])
 
 # Create the main app without a prefix
 app = FastAPI(
@@ -40,6 +71,11 @@ class StatusCheck(BaseModel):
 class StatusCheckCreate(BaseModel):
     client_name: str
 
+class StatusRollupBucket(BaseModel):
+    client_name: str
+    bucket: datetime
+    count: int
+
 # Original routes for backwards compatibility
 @api_router.get("/")
 async def root():
@@ -49,7 +85,12 @@ async def root():
 async def create_status_check(input: StatusCheckCreate):
     status_dict = input.dict()
     status_obj = StatusCheck(**status_dict)
-    _ = await db.status_checks.insert_one(status_obj.dict())
+    await db.status_checks.insert_one(status_obj.dict())
+    # Counted only once stored; a missed increment is fixed by a rebuild
+    try:
+        await StatusRollupService(db).record(status_obj.client_name, status_obj.timestamp)
+    except Exception as e:
+        logger.error("Failed to update status rollup: %s", e)
     return status_obj
 
 @api_router.get("/status", response_model=List[StatusCheck])
@@ -57,12 +98,58 @@ async def get_status_checks():
     status_checks = await db.status_checks.find().to_list(1000)
     return [StatusCheck(**status_check) for status_check in status_checks]
 
+@api_router.get("/status/rollups", response_model=List[StatusRollupBucket])
+async def get_status_rollups(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    granularity: str = "hour",
+    client_name: Optional[str] = None
+):
+    end = end or datetime.utcnow()
+    start = start or end - timedelta(days=7)
+    try:
+        return await StatusRollupService(public_db).query(start, end, granularity, client_name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@api_router.post("/status/rollups/rebuild")
+async def rebuild_status_rollups(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    current_user: AdminUser = Depends(get_platform_admin_user)
+):
+    buckets = await StatusRollupService(db).rebuild(start, end)
+    return {"success": True, "buckets": buckets}
+
 # Include the original router
 app.include_router(api_router)
 
 # Include new routers
 app.include_router(admin_router.router)
 app.include_router(content_router.router)
+app.include_router(health_router.router)
+
+# Server-rendered landing page; the build's assets are served alongside it
+FRONTEND_BUILD_DIR = Path(os.environ.get('FRONTEND_BUILD_DIR', ROOT_DIR.parent / 'frontend' / 'build'))
+app.include_router(page_router.router)
+if (FRONTEND_BUILD_DIR / 'static').is_dir():
+    app.mount("/static", StaticFiles(directory=FRONTEND_BUILD_DIR / 'static'), name="static")
+
+# On-demand request profiling (admin header or sampling)
+profile_store = ProfileStore(maxlen=int(os.environ.get('PROFILE_BUFFER_SIZE', '50')))
+app.add_middleware(
+    ProfilingMiddleware,
+    store=profile_store,
+    sample_rate=float(os.environ.get('PROFILE_SAMPLE_RATE', '0')),
+    interval=float(os.environ.get('PROFILE_INTERVAL_MS', '5')) / 1000
+)
+
+# Admission control: shed overload before it reaches handlers. Off unless
+# enabled; behind the ingress set ADMISSION_PROXY_HOPS so rate limits key
+# on the visitor rather than the proxy
+admission = AdmissionController.from_env()
+if os.environ.get('ADMISSION_ENABLED', '').lower() in ('1', 'true', 'yes'):
+    app.add_middleware(AdmissionMiddleware, controller=admission)
 
 # Add CORS middleware
 app.add_middleware(
@@ -73,21 +160,146 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+# Tenant from the /t/<tenant> prefix or Host header
+app.add_middleware(TenantMiddleware)
+
+# Outermost: request id for logs and responses
+app.add_middleware(RequestContextMiddleware)
+
+def create_snapshot_stores() -> TenantSnapshotStores:
+    """Per-tenant snapshot stores (mmap-shared when SNAPSHOT_DIR is set)"""
+    
+    snapshot_dir = os.environ.get('SNAPSHOT_DIR')
+    if snapshot_dir:
+        factory = lambda tenant_id: SharedSnapshotStore(os.path.join(snapshot_dir, tenant_id))
+    else:
+        ttl = float(os.environ.get('PUBLISHED_CACHE_TTL_SECONDS', '5'))
+        factory = lambda tenant_id: LocalSnapshotStore(ttl=ttl)
+    
+    return TenantSnapshotStores(
+        factory,
+        max_tenants=int(os.environ.get('TENANT_CACHE_MAX_TENANTS', '100')),
+        max_bytes=int(os.environ.get('TENANT_CACHE_MAX_MB', '64')) * 1024 * 1024
+    )
 
 # App state management
 @app.on_event("startup")
 async def startup_event():
     """Initialize application state"""
+    connect_database()
     app.state.db = db
+    app.state.public_db = public_db
+    app.state.mongo_client = client
+    app.state.pool_metrics = pool_metrics
+    app.state.profile_store = profile_store
+    app.state.admission = admission
+    
+    try:
+        await ContentService(db).ensure_indexes()
+        await StatusRollupService(db).ensure_indexes()
+    except Exception as e:
+        logger.error("Failed to create indexes: %s", e)
+    
+    app.state.tenants = TenantRegistry(
+        db, refresh_interval=float(os.environ.get('TENANT_REFRESH_SECONDS', '60'))
+    )
+    try:
+        await app.state.tenants.start()
+    except Exception as e:
+        logger.error("Failed to load tenants: %s", e)
+    
+    try:
+        await ContentService(db, tenant_id=None).backfill_change_seq()
+    except Exception as e:
+        logger.error("Failed to backfill content change sequence: %s", e)
+    
+    # Audit trail: written in batches off the request path
+    app.state.audit = AuditLog(
+        db,
+        batch_size=int(os.environ.get('AUDIT_BATCH_SIZE', '200')),
+        flush_interval=float(os.environ.get('AUDIT_FLUSH_SECONDS', '1')),
+        queue_size=int(os.environ.get('AUDIT_QUEUE_SIZE', '10000')),
+        capped_bytes=int(os.environ.get('AUDIT_CAPPED_MB', '0')) * 1024 * 1024
+    )
+    try:
+        await app.state.audit.start()
+    except Exception as e:
+        logger.error("Failed to start audit log: %s", e)
+    
+    # Published snapshots per tenant: shared across workers when launched via run.py
+    app.state.snapshot_stores = create_snapshot_stores()
+    
+    # Landing page bootstrap: cached payloads per tenant, validated by version
+    app.state.bootstrap_stores = TenantSnapshotStores(
+        lambda tenant_id: LocalSnapshotStore(ttl=float('inf')),
+        max_tenants=int(os.environ.get('TENANT_CACHE_MAX_TENANTS', '100'))
+    )
+    # Rendered landing pages per tenant, validated by snapshot ETag
+    app.state.page_template = PageTemplate.load(FRONTEND_BUILD_DIR)
+    app.state.page_stores = TenantSnapshotStores(
+        lambda tenant_id: LocalSnapshotStore(ttl=float('inf')),
+        max_tenants=int(os.environ.get('TENANT_CACHE_MAX_TENANTS', '100'))
+    )
+    app.state.social_feed = SocialFeedService(
+        cache_seconds=float(os.environ.get('INSTAGRAM_CACHE_SECONDS', '3600')),
+        request_timeout=float(os.environ.get('INSTAGRAM_TIMEOUT_SECONDS', '5')),
+        limit=int(os.environ.get('INSTAGRAM_POST_LIMIT', '9')),
+        max_tenants=int(os.environ.get('TENANT_CACHE_MAX_TENANTS', '100'))
+    )
+    app.state.broadcaster = EventBroadcaster(
+        max_connections=int(os.environ.get('SSE_MAX_CONNECTIONS', '200')),
+        max_admin_connections=int(os.environ.get('SSE_MAX_ADMIN_CONNECTIONS', '20')),
+        queue_size=int(os.environ.get('SSE_QUEUE_SIZE', '32')),
+        heartbeat_interval=float(os.environ.get('SSE_HEARTBEAT_SECONDS', '15')),
+        # Relay events between workers through Mongo
+        db=db,
+        poll_interval=float(os.environ.get('SSE_RELAY_POLL_SECONDS', '1'))
+    )
+    try:
+        await app.state.broadcaster.start()
+    except Exception as e:
+        logger.error("Failed to start event relay: %s", e)
+    app.state.autosave = AutosaveBuffer(
+        db,
+        flush_interval=float(os.environ.get('AUTOSAVE_FLUSH_SECONDS', '10')),
+        broadcaster=app.state.broadcaster,
+        snapshot_stores=app.state.snapshot_stores,
+        audit=app.state.audit
+    )
+    app.state.autosave.start()
+    app.state.retention = RetentionService(db, RetentionPolicy.from_env())
+    app.state.retention.start()
+    app.state.scheduler = PublishScheduler(
+        db,
+        broadcaster=app.state.broadcaster,
+        snapshot_stores=app.state.snapshot_stores,
+        prewarm_seconds=float(os.environ.get('SCHEDULER_PREWARM_SECONDS', '60')),
+        poll_interval=float(os.environ.get('SCHEDULER_POLL_SECONDS', '5')),
+        lease_seconds=float(os.environ.get('SCHEDULER_LEASE_SECONDS', '30')),
+        audit=app.state.audit
+    )
+    app.state.scheduler.start()
+    
+    # Stateless JWT mode keeps the auth path off the database
+    app.state.revocation_list = None
+    if os.environ.get('AUTH_STATELESS', '').lower() in ('1', 'true', 'yes'):
+        app.state.revocation_list = RevocationList(
+            db, sync_interval=float(os.environ.get('AUTH_REVOCATION_SYNC_SECONDS', '30'))
+        )
+        await app.state.revocation_list.start()
     logger.info("Architecture Studio CMS started successfully")
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await app.state.autosave.stop()
+    await app.state.retention.stop()
+    await app.state.scheduler.stop()
+    await app.state.audit.stop()
+    await app.state.broadcaster.stop()
+    await app.state.tenants.stop()
+    await app.state.social_feed.stop()
+    if app.state.revocation_list:
+        await app.state.revocation_list.stop()
+    app.state.snapshot_stores.close()
     client.close()
     logger.info("Database connection closed")
\ No newline at end of file
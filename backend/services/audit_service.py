@@ -0,0 +1,200 @@
+import asyncio
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import BulkWriteError
+from models.content_models import AuditEntry, AuditPage
+import logging
+
+logger = logging.getLogger(__name__)
+
+AUDIT_COLLECTION = "content_audit"
+
+class AuditLog:
+    """Append-only audit trail written in the background
+
+    ``record`` only appends to an in-memory queue; a flush loop drains it
+    with batched unordered ``insert_many`` calls at most every
+    ``flush_interval`` seconds (sooner when a batch fills up). A batch
+    that could not be sent is kept and retried. When the queue is full new
+    entries are dropped and counted rather than blocking a request.
+    """
+
+    def __init__(self,
+                 db: AsyncIOMotorDatabase,
+                 batch_size: int = 200,
+                 flush_interval: float = 1.0,
+                 queue_size: int = 10000,
+                 capped_bytes: int = 0):
+        self.db = db
+        self.collection = db[AUDIT_COLLECTION]
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue_size = queue_size
+        self.capped_bytes = capped_bytes
+        self._queue: Optional[asyncio.Queue] = None
+        self._pending: List[Dict[str, Any]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.written = 0
+        self.dropped = 0
+        self.failed_batches = 0
+
+    async def start(self) -> None:
+        """Create the collection (capped if configured), indexes and flush loop"""
+
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+
+        if self.capped_bytes:
+            existing = await self.db.list_collection_names(filter={"name": AUDIT_COLLECTION})
+            if not existing:
+                await self.db.create_collection(AUDIT_COLLECTION, capped=True, size=self.capped_bytes)
+
+        await self.collection.create_index([("tenant_id", 1), ("at", -1), ("id", -1)])
+        await self.collection.create_index([("tenant_id", 1), ("actor", 1), ("at", -1)])
+        await self.collection.create_index([("tenant_id", 1), ("content_id", 1), ("at", -1)])
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write everything still queued"""
+
+        # Before 3.12, wait_for can swallow a cancel that races a queue.get
+        self._stopping = True
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._queue:
+            while not self._queue.empty():
+                self._pending.append(self._queue.get_nowait())
+            await self._flush()
+
+    def record(self,
+               action: str,
+               actor: str,
+               tenant_id: str,
+               content_id: Optional[str] = None,
+               **details: Any) -> None:
+        """Queue an audit entry without waiting"""
+
+        if self._queue is None:
+            return
+
+        entry = AuditEntry(
+            tenant_id=tenant_id,
+            action=action,
+            actor=actor,
+            content_id=content_id,
+            details=details
+        )
+        try:
+            self._queue.put_nowait(entry.dict())
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning("Audit queue full, dropped %s entry", action)
+
+    async def query(self,
+                    tenant_id: str,
+                    actor: Optional[str] = None,
+                    content_id: Optional[str] = None,
+                    action: Optional[str] = None,
+                    start: Optional[datetime] = None,
+                    end: Optional[datetime] = None,
+                    limit: int = 50,
+                    cursor: Optional[str] = None) -> AuditPage:
+        """Page through entries newest first; ``cursor`` continues a previous page"""
+
+        query: Dict[str, Any] = {"tenant_id": tenant_id}
+        if actor:
+            query["actor"] = actor
+        if content_id:
+            query["content_id"] = content_id
+        if action:
+            query["action"] = action
+        if start or end:
+            query["at"] = {}
+            if start:
+                query["at"]["$gte"] = start
+            if end:
+                query["at"]["$lte"] = end
+        if cursor:
+            # Keyset pagination on (at, id): stable while new entries arrive
+            at, _, entry_id = cursor.partition("|")
+            at = datetime.fromisoformat(at)
+            query["$or"] = [{"at": {"$lt": at}}, {"at": at, "id": {"$lt": entry_id}}]
+
+        documents = self.collection.find(query, projection={"_id": 0})
+        documents = documents.sort([("at", -1), ("id", -1)]).limit(limit + 1)
+        entries = [AuditEntry(**doc) async for doc in documents]
+
+        next_cursor = None
+        if len(entries) > limit:
+            entries = entries[:limit]
+            last = entries[-1]
+            next_cursor = f"{last.at.isoformat()}|{last.id}"
+
+        return AuditPage(entries=entries, next_cursor=next_cursor)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "pending": len(self._pending),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed_batches": self.failed_batches
+        }
+
+    async def _flush(self) -> None:
+        while self._pending:
+            batch = self._pending[:self.batch_size]
+            try:
+                await self.collection.insert_many(batch, ordered=False)
+            except BulkWriteError as e:
+                # Reached the server: the rest were written or are duplicates of a retry
+                self.failed_batches += 1
+                self.written += e.details.get("nInserted", 0)
+                del self._pending[:len(batch)]
+                logger.error("Audit batch partially written: %s", e.details.get("writeErrors", [])[:1])
+                continue
+            except Exception as e:
+                self.failed_batches += 1
+                logger.error("Audit flush failed (%s entries kept): %s", len(self._pending), e)
+                return
+            del self._pending[:len(batch)]
+            self.written += len(batch)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                # Block for the first entry, then collect whatever arrives within the window
+                if not self._pending:
+                    self._pending.append(await self._queue.get())
+                deadline = asyncio.get_running_loop().time() + self.flush_interval
+                while len(self._pending) < self.batch_size:
+                    timeout = deadline - asyncio.get_running_loop().time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        self._pending.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._flush()
+
+                if len(self._pending) > self.queue_size:
+                    # The database has been down for a while; shed the oldest
+                    overflow = len(self._pending) - self.queue_size
+                    del self._pending[:overflow]
+                    self.dropped += overflow
+                if self._pending:
+                    await asyncio.sleep(self.flush_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Audit flush loop error: %s", e)
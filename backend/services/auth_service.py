@@ -1,10 +1,14 @@
+import asyncio
 import hashlib
 import secrets
+import uuid
 import jwt
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from models.content_models import AdminUser, AdminSession, LoginRequest, LoginResponse
+from services.revocation_service import RevocationList
+from services.tenant_service import DEFAULT_TENANT
 from passlib.context import CryptContext
 import os
 import logging
@@ -12,28 +16,48 @@ import logging
 logger = logging.getLogger(__name__)
 
 class AdminAuthService:
-    """Admin authentication service"""
+    """Admin authentication service
     
-    def __init__(self, db: AsyncIOMotorDatabase):
+    Users, sessions and tokens belong to ``tenant_id``; a token issued for
+    one tenant is rejected by every other.
+    """
+    
+    def __init__(self,
+                 db: AsyncIOMotorDatabase,
+                 revocation_list: Optional[RevocationList] = None,
+                 tenant_id: str = DEFAULT_TENANT,
+                 audit=None):
         self.db = db
+        self.tenant_id = tenant_id
+        self.audit = audit
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
         self.secret_key = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-production")
         self.algorithm = "HS256"
         self.access_token_expire_hours = 24
+        
+        # Stateless mode: short-lived access tokens verified by signature only,
+        # refresh tokens are the only tokens backed by admin_sessions
+        self.revocation_list = revocation_list
+        self.stateless = revocation_list is not None
+        self.stateless_access_token_minutes = int(os.getenv("AUTH_ACCESS_TOKEN_MINUTES", "15"))
+        self.refresh_token_expire_hours = int(os.getenv("AUTH_REFRESH_TOKEN_HOURS", "24"))
     
     async def create_admin_user(self, username: str, password: str) -> AdminUser:
         """Create new admin user"""
         
         # Check if user already exists
-        existing_user = await self.db.admin_users.find_one({"username": username})
+        existing_user = await self.db.admin_users.find_one(
+            {"username": username, "tenant_id": self.tenant_id}
+        )
         if existing_user:
             raise ValueError("Admin user already exists")
         
-        # Hash password
-        password_hash = self.pwd_context.hash(password)
+        # Hash password (bcrypt is CPU-bound; keep it off the event loop)
+        password_hash = await asyncio.to_thread(self.pwd_context.hash, password)
         
         # Create user
         admin_user = AdminUser(
+            tenant_id=self.tenant_id,
             username=username,
             password_hash=password_hash
         )
@@ -41,7 +65,7 @@ class AdminAuthService:
         # Insert to database
         await self.db.admin_users.insert_one(admin_user.dict())
         
-        logger.info(f"Created admin user: {username}")
+        logger.info("Created admin user: %s", username)
         return admin_user
     
     async def authenticate_user(self, username: str, password: str) -> Optional[AdminUser]:
@@ -49,14 +73,20 @@ class AdminAuthService:
         
         try:
             # Find user
-            user_data = await self.db.admin_users.find_one({"username": username, "is_active": True})
+            user_data = await self.db.admin_users.find_one({
+                "username": username,
+                "tenant_id": self.tenant_id,
+                "is_active": True
+            })
             if not user_data:
+                self._audit("auth.login_failed", "anonymous", username=username, reason="unknown_user")
                 return None
             
             user = AdminUser(**user_data)
             
             # Verify password
-            if not self.pwd_context.verify(password, user.password_hash):
+            if not await asyncio.to_thread(self.pwd_context.verify, password, user.password_hash):
+                self._audit("auth.login_failed", "anonymous", username=username, reason="bad_password")
                 return None
             
             # Update last login
@@ -65,20 +95,25 @@ class AdminAuthService:
                 {"$set": {"last_login": datetime.utcnow()}}
             )
             
+            self._audit("auth.login", user.username)
             return user
             
         except Exception as e:
-            logger.error(f"Authentication error: {str(e)}")
+            logger.error("Authentication error: %s", e)
             return None
     
     async def create_access_token(self, user: AdminUser) -> LoginResponse:
         """Create JWT access token"""
         
+        if self.stateless:
+            return await self._create_stateless_tokens(user)
+        
         expires_at = datetime.utcnow() + timedelta(hours=self.access_token_expire_hours)
         
         payload = {
             "sub": user.id,
             "username": user.username,
+            "tenant": self.tenant_id,
             "exp": expires_at,
             "iat": datetime.utcnow(),
             "type": "access_token"
@@ -88,6 +123,7 @@ class AdminAuthService:
         
         # Store session in database
         session = AdminSession(
+            tenant_id=self.tenant_id,
             user_id=user.id,
             token=token,
             expires_at=expires_at
@@ -113,13 +149,17 @@ class AdminAuthService:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             user_id = payload.get("sub")
             
-            if not user_id:
+            if not user_id or not self._same_tenant(payload):
                 return None
             
+            if self.stateless:
+                return self._user_from_access_claims(payload)
+            
             # Check session in database
             session_data = await self.db.admin_sessions.find_one({
                 "token": token,
                 "user_id": user_id,
+                "tenant_id": self.tenant_id,
                 "expires_at": {"$gt": datetime.utcnow()}
             })
             
@@ -129,6 +169,7 @@ class AdminAuthService:
             # Get user
             user_data = await self.db.admin_users.find_one({
                 "id": user_id,
+                "tenant_id": self.tenant_id,
                 "is_active": True
             })
             
@@ -146,21 +187,85 @@ class AdminAuthService:
         except jwt.ExpiredSignatureError:
             logger.warning("Token expired")
             return None
-        except jwt.JWTError as e:
-            logger.warning(f"JWT error: {str(e)}")
+        except jwt.PyJWTError as e:
+            logger.warning("JWT error: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Token verification error: {str(e)}")
+            logger.error("Token verification error: %s", e)
+            return None
+    
+    async def refresh_access_token(self, refresh_token: str) -> Optional[LoginResponse]:
+        """Issue a new access token for a valid refresh token (stateless mode)"""
+        
+        try:
+            payload = jwt.decode(refresh_token, self.secret_key, algorithms=[self.algorithm])
+            user_id = payload.get("sub")
+            
+            if payload.get("type") != "refresh_token" or not user_id or not self._same_tenant(payload):
+                return None
+            
+            session_data = await self.db.admin_sessions.find_one({
+                "token": refresh_token,
+                "user_id": user_id,
+                "tenant_id": self.tenant_id,
+                "expires_at": {"$gt": datetime.utcnow()}
+            })
+            
+            if not session_data:
+                return None
+            
+            user_data = await self.db.admin_users.find_one({
+                "id": user_id,
+                "tenant_id": self.tenant_id,
+                "is_active": True
+            })
+            
+            if not user_data:
+                return None
+            
+            await self.db.admin_sessions.update_one(
+                {"id": session_data["id"]},
+                {"$set": {"last_accessed": datetime.utcnow()}}
+            )
+            
+            user = AdminUser(**user_data)
+            access_token, expires_at = self._encode_access_token(user, session_data["id"])
+            
+            return LoginResponse(
+                access_token=access_token,
+                expires_at=expires_at,
+                refresh_token=refresh_token,
+                refresh_expires_at=session_data["expires_at"],
+                user_info={
+                    "id": user.id,
+                    "username": user.username,
+                    "last_login": user.last_login
+                }
+            )
+            
+        except jwt.PyJWTError as e:
+            logger.warning("Refresh token error: %s", e)
+            return None
+        except Exception as e:
+            logger.error("Token refresh error: %s", e)
             return None
     
     async def logout(self, token: str) -> bool:
         """Logout user by invalidating token"""
         
+        if self.stateless:
+            return await self._logout_stateless(token)
+        
         try:
-            result = await self.db.admin_sessions.delete_one({"token": token})
-            return result.deleted_count > 0
+            result = await self.db.admin_sessions.delete_one({"token": token, "tenant_id": self.tenant_id})
+            if result.deleted_count > 0:
+                payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm],
+                                     options={"verify_exp": False})
+                self._audit("auth.logout", payload.get("username", payload.get("sub")))
+                return True
+            return False
         except Exception as e:
-            logger.error(f"Logout error: {str(e)}")
+            logger.error("Logout error: %s", e)
             return False
     
     async def cleanup_expired_sessions(self) -> int:
@@ -172,7 +277,7 @@ class AdminAuthService:
             })
             return result.deleted_count
         except Exception as e:
-            logger.error(f"Session cleanup error: {str(e)}")
+            logger.error("Session cleanup error: %s", e)
             return 0
     
     async def change_password(self, user_id: str, old_password: str, new_password: str) -> bool:
@@ -180,27 +285,165 @@ class AdminAuthService:
         
         try:
             # Get current user
-            user_data = await self.db.admin_users.find_one({"id": user_id})
+            user_data = await self.db.admin_users.find_one({"id": user_id, "tenant_id": self.tenant_id})
             if not user_data:
                 return False
             
             user = AdminUser(**user_data)
             
             # Verify old password
-            if not self.pwd_context.verify(old_password, user.password_hash):
+            if not await asyncio.to_thread(self.pwd_context.verify, old_password, user.password_hash):
                 return False
             
             # Hash new password
-            new_password_hash = self.pwd_context.hash(new_password)
+            new_password_hash = await asyncio.to_thread(self.pwd_context.hash, new_password)
             
             # Update password
             await self.db.admin_users.update_one(
                 {"id": user_id},
                 {"$set": {"password_hash": new_password_hash}}
             )
+            self._audit("auth.password_changed", user.username)
+            
+            if self.stateless:
+                # Kill refresh sessions and every access token issued so far
+                await self.db.admin_sessions.delete_many({"user_id": user_id})
+                not_before = datetime.utcnow().replace(microsecond=0) + timedelta(seconds=1)
+                await self.revocation_list.revoke_user(
+                    user_id,
+                    not_before,
+                    not_before + timedelta(minutes=self.stateless_access_token_minutes)
+                )
             
             return True
             
         except Exception as e:
-            logger.error(f"Password change error: {str(e)}")
+            logger.error("Password change error: %s", e)
+            return False
+    
+    def _audit(self, action: str, actor: str, **details: Any) -> None:
+        """Queue an audit entry (no-op without an audit log)"""
+        if self.audit:
+            self.audit.record(action, actor, self.tenant_id, **details)
+    
+    def _same_tenant(self, payload: Dict[str, Any]) -> bool:
+        """Whether a token was issued for this tenant (pre-tenant tokens are the default's)"""
+        return payload.get("tenant", DEFAULT_TENANT) == self.tenant_id
+    
+    def _encode_access_token(self, user: AdminUser, session_id: str):
+        """Encode a short-lived stateless access token"""
+        
+        now = datetime.utcnow()
+        expires_at = now + timedelta(minutes=self.stateless_access_token_minutes)
+        
+        payload = {
+            "sub": user.id,
+            "username": user.username,
+            "sid": session_id,
+            "tenant": self.tenant_id,
+            "jti": str(uuid.uuid4()),
+            "created_at": user.created_at.isoformat(),
+            "exp": expires_at,
+            "iat": now,
+            "type": "access_token"
+        }
+        
+        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm), expires_at
+    
+    async def _create_stateless_tokens(self, user: AdminUser) -> LoginResponse:
+        """Create an access/refresh token pair (stateless mode)"""
+        
+        now = datetime.utcnow()
+        refresh_expires_at = now + timedelta(hours=self.refresh_token_expire_hours)
+        session_id = str(uuid.uuid4())
+        
+        refresh_token = jwt.encode(
+            {
+                "sub": user.id,
+                "sid": session_id,
+                "tenant": self.tenant_id,
+                "exp": refresh_expires_at,
+                "iat": now,
+                "type": "refresh_token"
+            },
+            self.secret_key,
+            algorithm=self.algorithm
+        )
+        
+        # Only the refresh token is backed by a session document
+        session = AdminSession(
+            id=session_id,
+            tenant_id=self.tenant_id,
+            user_id=user.id,
+            token=refresh_token,
+            expires_at=refresh_expires_at
+        )
+        await self.db.admin_sessions.insert_one(session.dict())
+        
+        access_token, expires_at = self._encode_access_token(user, session_id)
+        
+        return LoginResponse(
+            access_token=access_token,
+            expires_at=expires_at,
+            refresh_token=refresh_token,
+            refresh_expires_at=refresh_expires_at,
+            user_info={
+                "id": user.id,
+                "username": user.username,
+                "last_login": user.last_login
+            }
+        )
+    
+    def _user_from_access_claims(self, payload: Dict[str, Any]) -> Optional[AdminUser]:
+        """Build the admin user from verified access token claims (no database)"""
+        
+        if payload.get("type") != "access_token":
+            return None
+        
+        issued_at = datetime.utcfromtimestamp(payload["iat"])
+        if self.revocation_list.is_revoked(payload.get("jti"), payload["sub"], issued_at, payload.get("sid")):
+            return None
+        
+        return AdminUser(
+            id=payload["sub"],
+            tenant_id=self.tenant_id,
+            username=payload["username"],
+            password_hash="",
+            created_at=datetime.fromisoformat(payload["created_at"])
+        )
+    
+    async def _logout_stateless(self, token: str) -> bool:
+        """Revoke every access token of the session and drop its refresh session"""
+        
+        try:
+            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            if not self._same_tenant(payload):
+                return False
+            
+            if payload.get("sid"):
+                # Tokens refreshed earlier in the session are revoked too; a
+                # sibling issued just now expires at most one token lifetime out
+                latest_expiry = datetime.utcnow() + timedelta(minutes=self.stateless_access_token_minutes)
+                await self.revocation_list.revoke_session(
+                    payload["sid"],
+                    payload["sub"],
+                    max(latest_expiry, datetime.utcfromtimestamp(payload["exp"]))
+                )
+            elif payload.get("jti"):
+                await self.revocation_list.revoke_token(
+                    payload["jti"],
+                    payload["sub"],
+                    datetime.utcfromtimestamp(payload["exp"])
+                )
+            
+            result = await self.db.admin_sessions.delete_one({"id": payload.get("sid")})
+            self._audit("auth.logout", payload.get("username", payload["sub"]))
+            
+            return result.deleted_count > 0
+            
+        except jwt.PyJWTError as e:
+            logger.warning("Logout with invalid token: %s", e)
+            return False
+        except Exception as e:
+            logger.error("Logout error: %s", e)
             return False
\ No newline at end of file
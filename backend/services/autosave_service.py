@@ -0,0 +1,220 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from models.content_models import ContentUpdateRequest, AutosaveResponse
+from services.content_service import ContentService
+from services.event_broadcaster import EventBroadcaster
+from services.tenant_service import DEFAULT_TENANT
+import logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PendingDraft:
+    """Buffered autosave state for a single draft"""
+    content_id: str
+    tenant_id: str
+    persisted_revision: int
+    sections: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    updated_by: str = "admin"
+    last_flush: datetime = field(default_factory=datetime.utcnow)
+    last_edit: datetime = field(default_factory=datetime.utcnow)
+    # Serializes flushes of this draft only; edits never wait on it
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+class AutosaveBuffer:
+    """Coalesces frequent editor autosaves into periodic writes
+
+    Edits are merged per draft in memory and persisted at most once per
+    flush window (or immediately on explicit save). The buffer lives on
+    ``app.state`` so it is shared by all requests (and tenants) of one
+    worker; ``snapshot_stores`` is the per-tenant store registry.
+
+    Merging an edit never waits on database I/O; a flush takes the
+    buffered sections and writes them under a per-draft lock, so one
+    draft's write does not hold up edits or flushes of any other. The
+    stored document stays the only source of ``revision``: each flush
+    increments it like a regular update does.
+    """
+
+    def __init__(self,
+                 db: AsyncIOMotorDatabase,
+                 flush_interval: float = 10.0,
+                 broadcaster: Optional[EventBroadcaster] = None,
+                 snapshot_stores=None,
+                 audit=None):
+        self.db = db
+        self.audit = audit
+        self.broadcaster = broadcaster
+        self.snapshot_stores = snapshot_stores
+        self.flush_interval = flush_interval
+        self.idle_eviction = timedelta(seconds=max(flush_interval * 10, 60))
+        self._drafts: Dict[str, PendingDraft] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.writes = 0
+        self.edits = 0
+
+    def start(self) -> None:
+        """Start the background flush loop"""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop and persist all unsaved edits"""
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush_all()
+
+    async def record_edit(self,
+                          content_id: str,
+                          updates: ContentUpdateRequest,
+                          updated_by: str = "admin",
+                          tenant_id: str = DEFAULT_TENANT) -> Optional[AutosaveResponse]:
+        """Merge an edit into the draft's buffer (returns None if draft is missing)"""
+
+        sections = updates.dict(exclude_none=True)
+
+        draft = self._drafts.get(content_id)
+        if draft is None:
+            content = await ContentService(self.db, tenant_id=tenant_id).get_content_by_id(content_id)
+            if not content:
+                return None
+            # Another edit may have created it while we were reading
+            draft = self._drafts.setdefault(content_id, PendingDraft(
+                content_id=content_id,
+                tenant_id=tenant_id,
+                persisted_revision=content.revision
+            ))
+        if draft.tenant_id != tenant_id:
+            return None
+
+        # Later edits replace earlier ones section by section
+        draft.sections.update(sections)
+        draft.updated_by = updated_by
+        draft.last_edit = datetime.utcnow()
+        self.edits += 1
+
+        return self._response(draft)
+
+    async def flush(self, content_id: str, tenant_id: str = DEFAULT_TENANT) -> bool:
+        """Persist buffered edits for one draft immediately
+
+        Returns False only when buffered edits could not be written (or the
+        draft no longer exists); nothing buffered counts as persisted.
+        """
+
+        draft = self._drafts.get(content_id)
+        if not draft or draft.tenant_id != tenant_id:
+            return True
+        return await self._flush_draft(draft)
+
+    async def flush_all(self) -> int:
+        """Persist every draft with unsaved edits"""
+
+        flushed = 0
+        for draft in list(self._drafts.values()):
+            if draft.sections and await self._flush_draft(draft):
+                flushed += 1
+        return flushed
+
+    def discard(self, content_id: str) -> None:
+        """Drop buffered state for a draft (e.g. after it was deleted)"""
+
+        self._drafts.pop(content_id, None)
+
+    def get_state(self, content_id: str) -> Optional[AutosaveResponse]:
+        """Get the current autosave state of a draft"""
+
+        draft = self._drafts.get(content_id)
+        return self._response(draft) if draft else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get buffer statistics"""
+
+        return {
+            "flush_interval_seconds": self.flush_interval,
+            "buffered_drafts": len(self._drafts),
+            "pending_drafts": sum(1 for d in self._drafts.values() if d.sections),
+            "edits": self.edits,
+            "writes": self.writes
+        }
+
+    def _response(self, draft: PendingDraft) -> AutosaveResponse:
+        pending = bool(draft.sections)
+        return AutosaveResponse(
+            content_id=draft.content_id,
+            # Revision the draft gets once buffered edits are written
+            revision=draft.persisted_revision + (1 if pending else 0),
+            persisted_revision=draft.persisted_revision,
+            pending=pending,
+            flush_due_at=(
+                draft.last_flush + timedelta(seconds=self.flush_interval)
+                if pending else None
+            )
+        )
+
+    async def _flush_draft(self, draft: PendingDraft) -> bool:
+        async with draft.lock:
+            if not draft.sections:
+                return True
+            sections = draft.sections
+            draft.sections = {}
+
+            try:
+                content_service = ContentService(
+                    self.db,
+                    self.broadcaster,
+                    self.snapshot_stores.get(draft.tenant_id) if self.snapshot_stores else None,
+                    tenant_id=draft.tenant_id,
+                    audit=self.audit
+                )
+                revision = await content_service.apply_autosave(
+                    draft.content_id, sections, draft.updated_by
+                )
+            except Exception as e:
+                # Put the edits back underneath anything newer and retry next window
+                sections.update(draft.sections)
+                draft.sections = sections
+                logger.error("Autosave flush failed for %s: %s", draft.content_id, e)
+                return False
+
+            draft.last_flush = datetime.utcnow()
+            self.writes += 1
+
+            if revision is None:
+                logger.warning("Autosave target no longer exists: %s", draft.content_id)
+                self._drafts.pop(draft.content_id, None)
+                return False
+
+            draft.persisted_revision = revision
+            return True
+
+    async def _run(self) -> None:
+        tick = min(1.0, self.flush_interval)
+        while True:
+            await asyncio.sleep(tick)
+            try:
+                await self._flush_due()
+            except Exception as e:
+                logger.error("Autosave flush loop error: %s", e)
+
+    async def _flush_due(self) -> None:
+        now = datetime.utcnow()
+        window = timedelta(seconds=self.flush_interval)
+
+        for draft in list(self._drafts.values()):
+            if draft.sections:
+                if now - draft.last_flush >= window:
+                    await self._flush_draft(draft)
+            elif now - draft.last_edit >= self.idle_eviction and not draft.lock.locked():
+                self._drafts.pop(draft.content_id, None)
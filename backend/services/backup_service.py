@@ -0,0 +1,153 @@
+import zlib
+from typing import Optional, Dict, List, AsyncIterator, Callable
+from bson import json_util
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReplaceOne, InsertOne
+from services.content_service import ContentService
+from services.change_log import ContentChangeLog
+import logging
+
+logger = logging.getLogger(__name__)
+
+BACKUP_COLLECTIONS = ["tenants", "landing_page_content", "admin_users", "status_checks"]
+
+# Password hashes; only exported over HTTP when asked for by name
+SENSITIVE_COLLECTIONS = ["admin_users"]
+
+# Longest NDJSON line accepted on import (a document is at most 16MB of BSON)
+MAX_LINE_BYTES = 64 * 1024 * 1024
+
+_JSON_OPTIONS = json_util.RELAXED_JSON_OPTIONS
+
+async def iter_gzip_lines(read: Callable,
+                          chunk_size: int = 64 * 1024,
+                          max_line_bytes: int = MAX_LINE_BYTES) -> AsyncIterator[bytes]:
+    """Decompress a gzip stream incrementally and yield its lines
+
+    Each ``decompress`` call inflates at most ``chunk_size`` bytes, so a
+    small, highly compressed upload cannot expand all at once. Corrupt,
+    truncated or over-long lines raise ``ValueError``.
+    """
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    pending = b""
+    while True:
+        chunk = await read(chunk_size)
+        if not chunk:
+            break
+        while chunk:
+            try:
+                pending += decompressor.decompress(chunk, chunk_size)
+            except zlib.error as e:
+                raise ValueError(f"Corrupt backup archive: {e}")
+            chunk = decompressor.unconsumed_tail
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield line
+            if len(pending) > max_line_bytes:
+                raise ValueError(f"Backup line longer than {max_line_bytes} bytes")
+    try:
+        pending += decompressor.flush()
+    except zlib.error as e:
+        raise ValueError(f"Corrupt backup archive: {e}")
+    if not decompressor.eof:
+        raise ValueError("Truncated backup archive")
+    for line in pending.split(b"\n"):
+        if line.strip():
+            yield line
+
+class BackupService:
+    """Streaming NDJSON export/import of CMS collections
+
+    Each line is ``{"collection": ..., "doc": ...}`` in relaxed Extended
+    JSON, gzip-compressed as a whole. Memory is bounded by the batch size
+    in both directions.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase, batch_size: int = 1000):
+        self.db = db
+        self.batch_size = batch_size
+
+    async def export_stream(self, collections: Optional[List[str]] = None) -> AsyncIterator[bytes]:
+        """Yield gzip-compressed NDJSON chunks, one cursor batch at a time"""
+
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+        for name in collections or BACKUP_COLLECTIONS:
+            cursor = self.db[name].find({}, projection={"_id": 0}).batch_size(self.batch_size)
+            lines = []
+            async for doc in cursor:
+                lines.append(json_util.dumps({"collection": name, "doc": doc}, json_options=_JSON_OPTIONS))
+                if len(lines) >= self.batch_size:
+                    chunk = compressor.compress(("\n".join(lines) + "\n").encode())
+                    lines = []
+                    if chunk:
+                        yield chunk
+            if lines:
+                chunk = compressor.compress(("\n".join(lines) + "\n").encode())
+                if chunk:
+                    yield chunk
+
+        yield compressor.flush()
+
+    async def import_lines(self,
+                           lines: AsyncIterator[bytes],
+                           progress: Optional[Callable[[Dict[str, int]], None]] = None) -> Dict[str, int]:
+        """Upsert documents by ``id`` with batched unordered bulk writes
+
+        Imported content versions get fresh change sequence numbers and
+        their tombstones are dropped, so syncing clients pick them up.
+        """
+
+        counts: Dict[str, int] = {}
+        batches: Dict[str, list] = {}
+        # Content versions in the current batch, whose tombstones must go
+        restored: List[str] = []
+
+        async def flush(name: str) -> None:
+            operations = batches.pop(name, [])
+            if not operations:
+                return
+            await self.db[name].bulk_write(operations, ordered=False)
+            if name == "landing_page_content":
+                await ContentChangeLog(self.db).forget_deletes(restored)
+                restored.clear()
+            counts[name] = counts.get(name, 0) + len(operations)
+            if progress:
+                progress(dict(counts))
+
+        async for line in lines:
+            try:
+                entry = json_util.loads(line, json_options=_JSON_OPTIONS)
+                name, doc = entry["collection"], entry["doc"]
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Malformed backup line: {e!r}")
+            if name not in BACKUP_COLLECTIONS:
+                raise ValueError(f"Unexpected collection in backup: {name}")
+            if not isinstance(doc, dict):
+                raise ValueError(f"Malformed backup line: {name} document is not an object")
+            doc.pop("_id", None)
+            if name == "landing_page_content":
+                # Restamped after the import, so syncing clients see it as a change
+                doc["change_seq"] = 0
+                if "id" in doc:
+                    restored.append(doc["id"])
+
+            operation = (
+                ReplaceOne({"id": doc["id"]}, doc, upsert=True) if "id" in doc
+                else InsertOne(doc)
+            )
+            batches.setdefault(name, []).append(operation)
+            if len(batches[name]) >= self.batch_size:
+                await flush(name)
+
+        for name in list(batches):
+            await flush(name)
+
+        if "landing_page_content" in counts:
+            # Fresh sequence numbers, above anything a client has seen
+            await ContentService(self.db, tenant_id=None).backfill_change_seq()
+
+        logger.info("Imported backup: %s", counts)
+        return counts
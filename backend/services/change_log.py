@@ -0,0 +1,86 @@
+from datetime import datetime
+from typing import Dict, Any, List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+import logging
+
+logger = logging.getLogger(__name__)
+
+TOMBSTONE_COLLECTION = "content_tombstones"
+
+class ContentChangeLog:
+    """Per-tenant change sequence for content versions
+
+    Every content write takes the next number from a counter document in
+    ``counters`` and stamps it on the version as ``change_seq``. Deleted
+    versions leave a tombstone carrying the sequence of the delete, so
+    clients can sync with "everything after N" instead of re-reading the
+    whole history.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.counters = db.counters
+        self.tombstones = db[TOMBSTONE_COLLECTION]
+
+    async def ensure_indexes(self) -> None:
+        await self.tombstones.create_index([("tenant_id", 1), ("change_seq", 1)])
+
+    async def next_seq(self, tenant_id: str, count: int = 1) -> int:
+        """Reserve ``count`` sequence numbers; returns the last of them"""
+
+        counter = await self.counters.find_one_and_update(
+            {"_id": self._counter_id(tenant_id)},
+            {"$inc": {"seq": count}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return counter["seq"]
+
+    async def current_seq(self, tenant_id: str) -> int:
+        counter = await self.counters.find_one({"_id": self._counter_id(tenant_id)})
+        return counter["seq"] if counter else 0
+
+    async def advance_to(self, tenant_id: str, seq: int) -> None:
+        """Move the counter forward to at least ``seq`` (e.g. after a restore)"""
+
+        await self.counters.update_one(
+            {"_id": self._counter_id(tenant_id)},
+            {"$max": {"seq": seq}},
+            upsert=True
+        )
+
+    async def record_deletes(self, tenant_id: str, content_ids: List[str], deleted_by: str) -> None:
+        """Leave tombstones for deleted versions"""
+
+        if not content_ids:
+            return
+        last = await self.next_seq(tenant_id, len(content_ids))
+        now = datetime.utcnow()
+        await self.tombstones.insert_many([
+            {
+                "tenant_id": tenant_id,
+                "content_id": content_id,
+                "change_seq": last - len(content_ids) + 1 + i,
+                "changed_at": now,
+                "deleted_by": deleted_by
+            }
+            for i, content_id in enumerate(content_ids)
+        ], ordered=False)
+
+    async def forget_deletes(self, content_ids: List[str]) -> None:
+        """Drop tombstones of versions that exist again (restored from a backup)"""
+
+        if content_ids:
+            await self.tombstones.delete_many({"content_id": {"$in": content_ids}})
+
+    async def get_tombstones(self, tenant_id: str, since: int, limit: int) -> List[Dict[str, Any]]:
+        cursor = self.tombstones.find(
+            {"tenant_id": tenant_id, "change_seq": {"$gt": since}},
+            projection={"_id": 0}
+        ).sort("change_seq", 1).limit(limit)
+        return [doc async for doc in cursor]
+
+    @staticmethod
+    def _counter_id(tenant_id: str) -> str:
+        return f"content_changes:{tenant_id}"
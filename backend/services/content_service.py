@@ -11,19 +11,184 @@ from models.content_models import (
     FooterSection,
     ContactInfo,
     StudioAddress,
-    SocialMediaLinks
+    SocialMediaLinks,
+    ContentSearchHit,
+    SearchHighlight,
+    ContentChanges
 )
-from datetime import datetime
+from services.event_broadcaster import EventBroadcaster
+from services.snapshot_store import build_snapshot
+from services.tenant_service import DEFAULT_TENANT
+from services.change_log import ContentChangeLog
+from datetime import datetime, timedelta
+from pymongo import UpdateOne, ReturnDocument
+from pymongo.errors import OperationFailure
+import html
+import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Section text fields covered by the full-text index
+SEARCH_FIELDS = [
+    "hero.main_title",
+    "hero.subtitle",
+    "hero.description",
+    "hero.launch_message",
+    "about.title",
+    "about.description",
+    "expectations.title",
+    "expectations.items",
+    "footer.studio_name",
+    "footer.tagline",
+    "footer.copyright_text",
+    "contact_info.email",
+    "contact_info.phone",
+    "contact_info.working_hours",
+    "studio_address.line1",
+    "studio_address.line2",
+    "studio_address.line3",
+]
+
+# Writes younger than this may still be racing one with a lower change_seq
+CHANGE_SETTLE_SECONDS = 5.0
+
+# Indexes superseded by their tenant-prefixed versions
+LEGACY_INDEXES = ["is_published_1_updated_at_-1", "updated_by_1_updated_at_-1", "content_text"]
+
+# Lease a scheduler worker holds on a schedule between claim and publish
+SCHEDULE_CLAIM = {"claimed_by": "", "claim_expires_at": ""}
+
+def _unclaimed() -> List[Dict[str, Any]]:
+    """``$or`` clauses matching schedules without a live claim"""
+    return [{"claim_expires_at": None}, {"claim_expires_at": {"$lt": datetime.utcnow()}}]
+
+def _field_values(doc: Dict[str, Any], path: str) -> List[str]:
+    value: Any = doc
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return []
+        value = value.get(key)
+    if isinstance(value, list):
+        return [v for v in value if isinstance(v, str)]
+    return [value] if isinstance(value, str) else []
+
+def _highlight(text: str, pattern: "re.Pattern", width: int = 60) -> Optional[str]:
+    match = pattern.search(text)
+    if not match:
+        return None
+    start = max(0, match.start() - width)
+    end = min(len(text), match.end() + width)
+    # Match on the raw text and escape around the marks, so a term can
+    # never land inside an entity the escaping introduced
+    window = text[start:end]
+    parts = []
+    position = 0
+    for found in pattern.finditer(window):
+        if found.end() == found.start():
+            continue
+        parts.append(html.escape(window[position:found.start()]))
+        parts.append(f"<mark>{html.escape(found.group(0))}</mark>")
+        position = found.end()
+    parts.append(html.escape(window[position:]))
+    return ("…" if start > 0 else "") + "".join(parts) + ("…" if end < len(text) else "")
+
 class ContentService:
-    """Content management service"""
+    """Content management service
+    
+    Every query is scoped to ``tenant_id``; ``None`` spans all tenants and
+    is only meant for background jobs such as the publish scheduler.
+    """
     
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self,
+                 db: AsyncIOMotorDatabase,
+                 broadcaster: Optional[EventBroadcaster] = None,
+                 snapshot_store=None,
+                 tenant_id: Optional[str] = DEFAULT_TENANT,
+                 audit=None):
         self.db = db
         self.collection = db.landing_page_content
+        self.broadcaster = broadcaster
+        self.snapshot_store = snapshot_store
+        self.tenant_id = tenant_id
+        self.audit = audit
+        self.changes = ContentChangeLog(db)
+    
+    async def ensure_indexes(self) -> None:
+        """Create indexes used by content queries"""
+        
+        for name in LEGACY_INDEXES:
+            try:
+                await self.collection.drop_index(name)
+            except OperationFailure:
+                pass
+        
+        indexes = [
+            ("id", {"unique": True}),
+            ([("tenant_id", 1), ("is_published", 1), ("updated_at", -1)], {}),
+            ([("tenant_id", 1), ("updated_by", 1), ("updated_at", -1)], {}),
+            ("publish_at", {"sparse": True}),
+            ([("tenant_id", 1), ("change_seq", 1)], {}),
+            (
+                [("tenant_id", 1)] + [(field, "text") for field in SEARCH_FIELDS],
+                {"name": "content_text_by_tenant", "default_language": "english"}
+            )
+        ]
+        # One conflicting index must not leave the others uncreated
+        for keys, options in indexes:
+            try:
+                await self.collection.create_index(keys, **options)
+            except OperationFailure as e:
+                logger.error("Failed to create content index %s: %s", options.get("name", keys), e)
+        
+        try:
+            await self.changes.ensure_indexes()
+        except OperationFailure as e:
+            logger.error("Failed to create change log indexes: %s", e)
+    
+    def _scoped(self, query: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Restrict a query to this service's tenant"""
+        query = dict(query or {})
+        if self.tenant_id is not None:
+            query["tenant_id"] = self.tenant_id
+        return query
+    
+    def _emit(self, event_type: str, data: Dict[str, Any], public_fields: Optional[List[str]] = None) -> None:
+        """Notify connected event streams (no-op without a broadcaster)
+        
+        Only ``public_fields`` of events that change the live page reach
+        the public stream; admin streams get everything.
+        """
+        if self.broadcaster:
+            self.broadcaster.publish(event_type, data, tenant_id=self.tenant_id, public_fields=public_fields)
+    
+    def _audit(self, action: str, actor: str, content_id: str, **details: Any) -> None:
+        """Queue an audit entry (no-op without an audit log)"""
+        if self.audit:
+            self.audit.record(action, actor, self.tenant_id or DEFAULT_TENANT, content_id, **details)
+    
+    async def _change_stamp(self) -> Dict[str, Any]:
+        """Fields marking a write with this tenant's next change sequence"""
+        return {
+            "change_seq": await self.changes.next_seq(self.tenant_id or DEFAULT_TENANT),
+            "changed_at": datetime.utcnow()
+        }
+    
+    async def refresh_published_snapshot(self) -> None:
+        """Re-serialize the published content into the snapshot store"""
+        
+        if not self.snapshot_store:
+            return
+        
+        try:
+            content = await self.get_published_content()
+            if content:
+                self.snapshot_store.set(build_snapshot(content))
+            else:
+                self.snapshot_store.clear()
+        except Exception as e:
+            logger.error("Failed to refresh published snapshot: %s", e)
+            self.snapshot_store.clear()
     
     async def initialize_default_content(self) -> LandingPageContent:
         """Initialize default content if none exists"""
@@ -36,9 +201,11 @@ class ContentService:
             
             # Create default content
             default_content = LandingPageContent(
+                tenant_id=self.tenant_id or DEFAULT_TENANT,
                 is_published=True,
                 created_by="system",
-                updated_by="system"
+                updated_by="system",
+                **await self._change_stamp()
             )
             
             # Insert to database
@@ -48,7 +215,7 @@ class ContentService:
             return default_content
             
         except Exception as e:
-            logger.error(f"Failed to initialize default content: {str(e)}")
+            logger.error("Failed to initialize default content: %s", e)
             raise
     
     async def get_published_content(self) -> Optional[LandingPageContent]:
@@ -56,7 +223,7 @@ class ContentService:
         
         try:
             content_data = await self.collection.find_one(
-                {"is_published": True},
+                self._scoped({"is_published": True}),
                 sort=[("updated_at", -1)]
             )
             
@@ -65,27 +232,27 @@ class ContentService:
             return None
             
         except Exception as e:
-            logger.error(f"Failed to get published content: {str(e)}")
+            logger.error("Failed to get published content: %s", e)
             return None
     
     async def get_content_by_id(self, content_id: str) -> Optional[LandingPageContent]:
         """Get content by ID"""
         
         try:
-            content_data = await self.collection.find_one({"id": content_id})
+            content_data = await self.collection.find_one(self._scoped({"id": content_id}))
             if content_data:
                 return LandingPageContent(**content_data)
             return None
             
         except Exception as e:
-            logger.error(f"Failed to get content by ID: {str(e)}")
+            logger.error("Failed to get content by ID: %s", e)
             return None
     
     async def get_all_content_versions(self) -> List[LandingPageContent]:
         """Get all content versions"""
         
         try:
-            cursor = self.collection.find().sort("updated_at", -1)
+            cursor = self.collection.find(self._scoped()).sort("updated_at", -1)
             content_versions = []
             
             async for doc in cursor:
@@ -94,9 +261,78 @@ class ContentService:
             return content_versions
             
         except Exception as e:
-            logger.error(f"Failed to get content versions: {str(e)}")
+            logger.error("Failed to get content versions: %s", e)
             return []
     
+    async def search_content(self,
+                           query: str,
+                           updated_by: Optional[str] = None,
+                           start: Optional[datetime] = None,
+                           end: Optional[datetime] = None,
+                           limit: int = 20) -> List[ContentSearchHit]:
+        """Full-text search across content versions, ranked by relevance"""
+        
+        try:
+            mongo_query: Dict[str, Any] = self._scoped({"$text": {"$search": query}})
+            if updated_by:
+                mongo_query["updated_by"] = updated_by
+            if start or end:
+                mongo_query["updated_at"] = {}
+                if start:
+                    mongo_query["updated_at"]["$gte"] = start
+                if end:
+                    mongo_query["updated_at"]["$lte"] = end
+            
+            projection = {
+                "_id": 0,
+                "score": {"$meta": "textScore"},
+                "id": 1,
+                "version": 1,
+                "is_published": 1,
+                "updated_at": 1,
+                "updated_by": 1
+            }
+            # Only the searchable sections travel back, for snippets
+            for field in SEARCH_FIELDS:
+                projection[field] = 1
+            
+            cursor = self.collection.find(mongo_query, projection=projection)
+            cursor = cursor.sort([("score", {"$meta": "textScore"})]).limit(limit)
+            
+            terms = [
+                re.escape(term) for term in re.findall(r"[\w@.+-]+", query)
+                if not term.startswith("-")
+            ]
+            pattern = re.compile("|".join(terms), re.IGNORECASE) if terms else None
+            
+            hits = []
+            async for doc in cursor:
+                highlights = []
+                if pattern:
+                    for field in SEARCH_FIELDS:
+                        for value in _field_values(doc, field):
+                            snippet = _highlight(value, pattern)
+                            if snippet:
+                                highlights.append(SearchHighlight(field=field, snippet=snippet))
+                        if len(highlights) >= 3:
+                            break
+                
+                hits.append(ContentSearchHit(
+                    id=doc["id"],
+                    version=doc["version"],
+                    is_published=doc["is_published"],
+                    updated_at=doc["updated_at"],
+                    updated_by=doc["updated_by"],
+                    score=doc["score"],
+                    highlights=highlights[:3]
+                ))
+            
+            return hits
+            
+        except Exception as e:
+            logger.error("Failed to search content: %s", e)
+            raise
+    
     async def create_content_draft(self, 
                                  base_content_id: Optional[str] = None, 
                                  updated_by: str = "admin") -> LandingPageContent:
@@ -114,6 +350,7 @@ class ContentService:
             
             # Create new draft
             draft_content = LandingPageContent(
+                tenant_id=self.tenant_id or DEFAULT_TENANT,
                 version=f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
                 is_published=False,
                 hero=base_content.hero,
@@ -126,17 +363,20 @@ class ContentService:
                 studio_address=base_content.studio_address,
                 social_links=base_content.social_links,
                 created_by=updated_by,
-                updated_by=updated_by
+                updated_by=updated_by,
+                **await self._change_stamp()
             )
             
             # Insert to database
             await self.collection.insert_one(draft_content.dict())
             
-            logger.info(f"Created content draft: {draft_content.id}")
+            self._audit("content.draft_created", updated_by, draft_content.id,
+                        base_content_id=base_content_id or base_content.id)
+            logger.info("Created content draft: %s", draft_content.id)
             return draft_content
             
         except Exception as e:
-            logger.error(f"Failed to create content draft: {str(e)}")
+            logger.error("Failed to create content draft: %s", e)
             raise
     
     async def update_content(self, 
@@ -154,7 +394,8 @@ class ContentService:
             # Prepare update data
             update_data = {
                 "updated_at": datetime.utcnow(),
-                "updated_by": updated_by
+                "updated_by": updated_by,
+                **await self._change_stamp()
             }
             
             # Update sections if provided
@@ -179,55 +420,249 @@ class ContentService:
             
             # Update in database
             result = await self.collection.update_one(
-                {"id": content_id},
-                {"$set": update_data}
+                self._scoped({"id": content_id}),
+                {"$set": update_data, "$inc": {"revision": 1}}
             )
             
             if result.modified_count > 0:
+                self._emit("content.updated", {
+                    "content_id": content_id,
+                    "updated_by": updated_by,
+                    "updated_at": update_data["updated_at"]
+                }, public_fields=["content_id", "updated_at"] if existing_content.is_published else None)
+                self._audit("content.updated", updated_by, content_id,
+                            sections=sorted(set(update_data) & set(ContentUpdateRequest.model_fields)))
+                if existing_content.is_published:
+                    await self.refresh_published_snapshot()
                 # Return updated content
                 return await self.get_content_by_id(content_id)
             else:
-                logger.warning(f"No content was updated for ID: {content_id}")
+                logger.warning("No content was updated for ID: %s", content_id)
                 return existing_content
             
         except Exception as e:
-            logger.error(f"Failed to update content: {str(e)}")
+            logger.error("Failed to update content: %s", e)
+            raise
+    
+    async def apply_autosave(self,
+                           content_id: str,
+                           sections: Dict[str, Dict[str, Any]],
+                           updated_by: str = "admin") -> Optional[int]:
+        """Persist coalesced autosave edits in a single write
+        
+        Returns the stored revision after the write (None if the content
+        no longer exists).
+        """
+        
+        try:
+            update_data = dict(sections)
+            update_data["updated_at"] = datetime.utcnow()
+            update_data["updated_by"] = updated_by
+            update_data.update(await self._change_stamp())
+            
+            result = await self.collection.find_one_and_update(
+                self._scoped({"id": content_id}),
+                {"$set": update_data, "$inc": {"revision": 1}},
+                projection={"_id": 0, "is_published": 1, "revision": 1},
+                return_document=ReturnDocument.AFTER
+            )
+            
+            if not result:
+                return None
+            revision = result["revision"]
+            
+            self._emit("content.updated", {
+                "content_id": content_id,
+                "revision": revision,
+                "updated_by": updated_by,
+                "updated_at": update_data["updated_at"]
+            }, public_fields=["content_id", "updated_at"] if result.get("is_published") else None)
+            self._audit("content.autosaved", updated_by, content_id,
+                        sections=sorted(sections), revision=revision)
+            if result.get("is_published"):
+                await self.refresh_published_snapshot()
+            
+            return revision
+            
+        except Exception as e:
+            logger.error("Failed to apply autosave: %s", e)
             raise
     
-    async def publish_content(self, content_id: str, published_by: str = "admin") -> bool:
-        """Publish content (unpublish others)"""
+    async def publish_content(self,
+                            content_id: str,
+                            published_by: str = "admin",
+                            published_at: Optional[datetime] = None,
+                            prepared_snapshot=None,
+                            claimed_by: Optional[str] = None) -> bool:
+        """Publish content (unpublish others)
+        
+        ``published_at`` pins the publish timestamp (used by scheduled
+        publishing so a pre-built snapshot matches the stored document);
+        ``prepared_snapshot`` is swapped into the snapshot store instead of
+        re-serializing the content. With ``claimed_by`` the publish only
+        happens while that owner still holds the schedule's claim.
+        """
+        
+        published_at = published_at or datetime.utcnow()
+        target = self._scoped({"id": content_id})
+        if claimed_by:
+            target["claimed_by"] = claimed_by
         
         try:
-            # Unpublish all current published content
+            if claimed_by and not await self.collection.find_one(target, {"_id": 1}):
+                logger.warning("Claim on scheduled publish of %s was lost", content_id)
+                return False
+            
+            # Unpublish all current published content of this tenant
             await self.collection.update_many(
-                {"is_published": True},
-                {"$set": {"is_published": False}}
+                self._scoped({"is_published": True}),
+                {"$set": {"is_published": False, **await self._change_stamp()}}
             )
             
             # Publish the specified content
             result = await self.collection.update_one(
-                {"id": content_id},
+                target,
                 {
                     "$set": {
                         "is_published": True,
-                        "updated_at": datetime.utcnow(),
-                        "updated_by": published_by
-                    }
+                        "updated_at": published_at,
+                        "updated_by": published_by,
+                        **await self._change_stamp()
+                    },
+                    "$unset": {"publish_at": "", **SCHEDULE_CLAIM}
                 }
             )
             
             if result.modified_count > 0:
-                logger.info(f"Published content: {content_id}")
+                logger.info("Published content: %s", content_id)
+                if prepared_snapshot is not None and self.snapshot_store:
+                    self.snapshot_store.activate(prepared_snapshot)
+                else:
+                    await self.refresh_published_snapshot()
+                self._emit("content.published", {
+                    "content_id": content_id,
+                    "published_by": published_by,
+                    "published_at": published_at
+                }, public_fields=["content_id", "published_at"])
+                self._audit("content.published", published_by, content_id, published_at=published_at)
                 return True
             else:
-                logger.warning(f"Failed to publish content: {content_id}")
+                logger.warning("Failed to publish content: %s", content_id)
                 return False
             
         except Exception as e:
-            logger.error(f"Failed to publish content: {str(e)}")
+            logger.error("Failed to publish content: %s", e)
             return False
     
-    async def delete_content(self, content_id: str) -> bool:
+    async def schedule_publish(self,
+                             content_id: str,
+                             publish_at: datetime,
+                             scheduled_by: str = "admin") -> bool:
+        """Schedule an unpublished version to go live at ``publish_at`` (UTC)"""
+        
+        # Mongo stores milliseconds; match it so pre-built snapshots line up
+        publish_at = publish_at.replace(microsecond=publish_at.microsecond // 1000 * 1000)
+        
+        try:
+            result = await self.collection.update_one(
+                self._scoped({"id": content_id, "is_published": False}),
+                {
+                    "$set": {"publish_at": publish_at, "updated_by": scheduled_by, **await self._change_stamp()},
+                    # A new schedule voids any claim on the old one
+                    "$unset": SCHEDULE_CLAIM
+                }
+            )
+            if result.matched_count > 0:
+                self._audit("content.scheduled", scheduled_by, content_id, publish_at=publish_at)
+                return True
+            return False
+            
+        except Exception as e:
+            logger.error("Failed to schedule publish: %s", e)
+            raise
+    
+    async def cancel_scheduled_publish(self, content_id: str, cancelled_by: str = "admin") -> bool:
+        """Remove a pending publish schedule"""
+        
+        try:
+            result = await self.collection.update_one(
+                self._scoped({"id": content_id, "publish_at": {"$ne": None}}),
+                {"$set": await self._change_stamp(), "$unset": {"publish_at": "", **SCHEDULE_CLAIM}}
+            )
+            if result.modified_count > 0:
+                self._audit("content.schedule_cancelled", cancelled_by, content_id)
+                return True
+            return False
+            
+        except Exception as e:
+            logger.error("Failed to cancel scheduled publish: %s", e)
+            raise
+    
+    async def get_scheduled_content(self,
+                                  until: Optional[datetime] = None,
+                                  claimable: bool = False) -> List[LandingPageContent]:
+        """Get unpublished versions with a pending schedule, soonest first
+        
+        ``claimable`` leaves out schedules another worker is publishing
+        right now; ones whose claim expired are included again.
+        """
+        
+        query: Dict[str, Any] = self._scoped({"publish_at": {"$ne": None}, "is_published": False})
+        if until:
+            query["publish_at"]["$lte"] = until
+        if claimable:
+            query["$or"] = _unclaimed()
+        
+        cursor = self.collection.find(query).sort("publish_at", 1).limit(100)
+        return [LandingPageContent(**doc) async for doc in cursor]
+    
+    async def claim_scheduled_publish(self,
+                                    content_id: str,
+                                    publish_at: datetime,
+                                    owner: str,
+                                    lease: timedelta) -> Optional[LandingPageContent]:
+        """Atomically take ownership of a due schedule (exactly one caller wins)
+        
+        The claim is a lease on the document; ``publish_at`` stays set
+        until the publish write clears it, so a worker that dies between
+        claim and publish leaves the schedule to be claimed again once the
+        lease expires.
+        """
+        
+        query = self._scoped({"id": content_id, "publish_at": publish_at, "is_published": False})
+        query["$or"] = _unclaimed()
+        content_data = await self.collection.find_one_and_update(
+            query,
+            {"$set": {"claimed_by": owner, "claim_expires_at": datetime.utcnow() + lease}}
+        )
+        return LandingPageContent(**content_data) if content_data else None
+    
+    async def release_scheduled_claim(self, content_id: str, owner: str) -> None:
+        """Give up a claim so the next poll can retry the schedule"""
+        
+        await self.collection.update_one(
+            self._scoped({"id": content_id, "claimed_by": owner}),
+            {"$unset": SCHEDULE_CLAIM}
+        )
+    
+    async def set_pinned(self, content_id: str, pinned: bool, updated_by: str = "admin") -> bool:
+        """Pin or unpin a version so retention never removes it"""
+        
+        try:
+            result = await self.collection.update_one(
+                self._scoped({"id": content_id}),
+                {"$set": {"pinned": pinned, **await self._change_stamp()}}
+            )
+            if result.matched_count > 0:
+                self._audit("content.pinned" if pinned else "content.unpinned", updated_by, content_id)
+                return True
+            return False
+            
+        except Exception as e:
+            logger.error("Failed to update pin: %s", e)
+            raise
+    
+    async def delete_content(self, content_id: str, deleted_by: str = "admin") -> bool:
         """Delete content (cannot delete published content)"""
         
         try:
@@ -240,25 +675,110 @@ class ContentService:
                 raise ValueError("Cannot delete published content")
             
             # Delete content
-            result = await self.collection.delete_one({"id": content_id})
+            result = await self.collection.delete_one(self._scoped({"id": content_id}))
             
             if result.deleted_count > 0:
-                logger.info(f"Deleted content: {content_id}")
+                await self.changes.record_deletes(content.tenant_id, [content_id], deleted_by)
+                self._audit("content.deleted", deleted_by, content_id, version=content.version)
+                logger.info("Deleted content: %s", content_id)
                 return True
             else:
                 return False
             
         except Exception as e:
-            logger.error(f"Failed to delete content: {str(e)}")
+            logger.error("Failed to delete content: %s", e)
             raise
     
+    async def get_changes(self, since: int = 0, limit: int = 100) -> ContentChanges:
+        """Versions written or deleted after change ``since`` (0 for a full sync)
+        
+        Changes are returned in sequence order. ``next_since`` stops short of
+        writes younger than ``CHANGE_SETTLE_SECONDS``, which are sent again on
+        the next sync, so a slower write that took a lower sequence number is
+        not skipped. ``reset`` tells the client its position is unknown (e.g.
+        after a restore) and it should start over from 0.
+        """
+        
+        tenant_id = self.tenant_id or DEFAULT_TENANT
+        if since > await self.changes.current_seq(tenant_id):
+            return ContentChanges(next_since=0, reset=True)
+        
+        cursor = self.collection.find(self._scoped({"change_seq": {"$gt": since}}))
+        cursor = cursor.sort("change_seq", 1).limit(limit + 1)
+        versions = [LandingPageContent(**doc) async for doc in cursor]
+        entries = [(content.change_seq, content.changed_at or datetime.min, content) for content in versions]
+        for tombstone in await self.changes.get_tombstones(tenant_id, since, limit + 1):
+            entries.append((tombstone["change_seq"], tombstone["changed_at"], tombstone["content_id"]))
+        entries.sort(key=lambda entry: entry[0])
+        
+        has_more = len(entries) > limit
+        page = entries[:limit]
+        
+        # First sequence the client has not fully seen yet
+        boundary = None
+        if has_more:
+            # Never split versions sharing a sequence across pages
+            boundary = page[-1][0] if entries[limit][0] == page[-1][0] else page[-1][0] + 1
+        settle_cutoff = datetime.utcnow() - timedelta(seconds=CHANGE_SETTLE_SECONDS)
+        unsettled = [seq for seq, changed_at, _ in page if changed_at > settle_cutoff]
+        if unsettled:
+            boundary = min(boundary or unsettled[0], unsettled[0])
+            has_more = False
+        
+        if boundary is not None:
+            next_since = max(since, boundary - 1)
+        else:
+            next_since = page[-1][0] if page else since
+        
+        return ContentChanges(
+            changed=[item for _, _, item in page if isinstance(item, LandingPageContent)],
+            deleted=[item for _, _, item in page if isinstance(item, str)],
+            next_since=next_since,
+            has_more=has_more
+        )
+    
+    async def backfill_change_seq(self) -> int:
+        """Stamp versions written before change tracking and realign counters
+        
+        Counters are moved past the highest stamped sequence first, so a
+        restored backup never hands out numbers its documents already use.
+        """
+        
+        stamped = 0
+        latest = self.collection.aggregate([
+            {"$match": self._scoped()},
+            {"$group": {"_id": "$tenant_id", "seq": {"$max": "$change_seq"}}}
+        ])
+        async for group in latest:
+            if group["seq"]:
+                await self.changes.advance_to(group["_id"], group["seq"])
+        
+        legacy = self._scoped({"change_seq": {"$in": [None, 0]}})
+        for tenant_id in await self.collection.distinct("tenant_id", legacy):
+            cursor = self.collection.find({**legacy, "tenant_id": tenant_id}, projection={"_id": 0, "id": 1})
+            ids = [doc["id"] async for doc in cursor.sort("updated_at", 1)]
+            last = await self.changes.next_seq(tenant_id, len(ids))
+            now = datetime.utcnow()
+            await self.collection.bulk_write([
+                UpdateOne(
+                    {"id": content_id, "change_seq": {"$in": [None, 0]}},
+                    {"$set": {"change_seq": last - len(ids) + 1 + i, "changed_at": now}}
+                )
+                for i, content_id in enumerate(ids)
+            ], ordered=False)
+            stamped += len(ids)
+        
+        if stamped:
+            logger.info("Stamped %s content versions with change sequence numbers", stamped)
+        return stamped
+    
     async def get_content_summary(self) -> Dict[str, Any]:
         """Get content management summary"""
         
         try:
-            total_versions = await self.collection.count_documents({})
+            total_versions = await self.collection.count_documents(self._scoped())
             published_content = await self.get_published_content()
-            draft_count = await self.collection.count_documents({"is_published": False})
+            draft_count = await self.collection.count_documents(self._scoped({"is_published": False}))
             
             return {
                 "total_versions": total_versions,
@@ -272,7 +792,7 @@ class ContentService:
             }
             
         except Exception as e:
-            logger.error(f"Failed to get content summary: {str(e)}")
+            logger.error("Failed to get content summary: %s", e)
             return {
                 "total_versions": 0,
                 "draft_count": 0,
@@ -0,0 +1,238 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, AsyncIterator, Set, List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Subscription:
+    """A single connected event stream"""
+
+    def __init__(self, queue_size: int, tenant_id: Optional[str] = None, admin: bool = False):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.tenant_id = tenant_id
+        self.admin = admin
+        self.resyncs = 0
+
+class EventBroadcaster:
+    """In-process fan-out of content events to Server-Sent Events streams
+
+    There is one broadcaster per worker. Each connection gets a small
+    bounded queue; a client that falls behind has its backlog replaced by
+    a single ``resync`` event telling it to re-fetch, so a slow reader
+    never holds memory or blocks publishers.
+
+    Admin streams receive every event. Public streams only receive events
+    published with ``public_fields``, reduced to those fields, so drafts
+    and editor names never reach anonymous clients. Each kind has its own
+    connection cap, so a flood of public streams cannot lock editors out.
+
+    With ``db`` set, events are also relayed through ``content_events``:
+    each worker writes the events it publishes and polls for those of the
+    others every ``poll_interval`` seconds (overlapping two intervals and
+    de-duplicating by id, like the revocation list sync).
+    """
+
+    def __init__(self,
+                 max_connections: int = 200,
+                 max_admin_connections: int = 20,
+                 queue_size: int = 32,
+                 heartbeat_interval: float = 15.0,
+                 db: Optional[AsyncIOMotorDatabase] = None,
+                 poll_interval: float = 1.0,
+                 retention_seconds: int = 300):
+        self.max_connections = max_connections
+        self.max_admin_connections = max_admin_connections
+        self.queue_size = queue_size
+        self.heartbeat_interval = heartbeat_interval
+        self.collection = db.content_events if db is not None else None
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self.origin = uuid.uuid4().hex
+        self._subscribers: Set[Subscription] = set()
+        self._outbox: List[Dict[str, Any]] = []
+        self._relayed: Dict[str, datetime] = {}
+        self._last_seen: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self._next_id = 0
+        self.published = 0
+        self.relayed = 0
+        self.rejected = 0
+
+    async def start(self) -> None:
+        """Create the relay collection indexes and start polling (no-op without db)"""
+
+        if self.collection is None:
+            return
+        await self.collection.create_index("created_at", expireAfterSeconds=self.retention_seconds)
+        self._last_seen = datetime.utcnow()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop relaying (events still in the outbox are written first)"""
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            await self._flush_outbox()
+
+    def subscribe(self, tenant_id: Optional[str] = None, admin: bool = False) -> Optional[Subscription]:
+        """Register a new stream (None when the cap for its kind is reached)"""
+
+        limit = self.max_admin_connections if admin else self.max_connections
+        if sum(1 for s in self._subscribers if s.admin == admin) >= limit:
+            self.rejected += 1
+            return None
+
+        subscription = Subscription(self.queue_size, tenant_id, admin)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a stream"""
+
+        self._subscribers.discard(subscription)
+
+    def publish(self,
+                event_type: str,
+                data: Dict[str, Any],
+                tenant_id: Optional[str] = None,
+                public_fields: Optional[List[str]] = None) -> None:
+        """Queue an event for every connected stream of the tenant without waiting
+
+        ``public_fields`` makes the event visible to public streams, with
+        only those keys of ``data``; without it only admin streams get it.
+        """
+
+        self.published += 1
+        self._deliver(event_type, data, tenant_id, public_fields)
+
+        if self.collection is not None:
+            self._outbox.append({
+                "id": uuid.uuid4().hex,
+                "origin": self.origin,
+                "type": event_type,
+                "data": data,
+                "tenant_id": tenant_id,
+                "public_fields": public_fields
+            })
+
+    async def stream(self, subscription: Subscription) -> AsyncIterator[str]:
+        """Yield SSE frames for a subscription, with heartbeats when idle"""
+
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(
+                        subscription.queue.get(),
+                        timeout=self.heartbeat_interval
+                    )
+                    yield message
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get broadcaster statistics"""
+
+        admin_connections = sum(1 for s in self._subscribers if s.admin)
+        return {
+            "connections": len(self._subscribers) - admin_connections,
+            "max_connections": self.max_connections,
+            "admin_connections": admin_connections,
+            "max_admin_connections": self.max_admin_connections,
+            "published": self.published,
+            "relayed": self.relayed,
+            "rejected": self.rejected,
+            "resyncs": sum(s.resyncs for s in self._subscribers)
+        }
+
+    def _deliver(self,
+                 event_type: str,
+                 data: Dict[str, Any],
+                 tenant_id: Optional[str],
+                 public_fields: Optional[List[str]]) -> None:
+        self._next_id += 1
+        admin_message = self._format(self._next_id, event_type, data)
+        public_message = None
+        if public_fields is not None:
+            public_data = {key: data[key] for key in public_fields if key in data}
+            public_message = self._format(self._next_id, event_type, public_data)
+
+        for subscription in list(self._subscribers):
+            if tenant_id is not None and subscription.tenant_id != tenant_id:
+                continue
+            message = admin_message if subscription.admin else public_message
+            if message is None:
+                continue
+            try:
+                subscription.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self._resync(subscription)
+
+    async def _flush_outbox(self) -> None:
+        if not self._outbox:
+            return
+        events, self._outbox = self._outbox, []
+        # Stamped at write time so pollers' overlap only has to cover write latency
+        now = datetime.utcnow()
+        for event in events:
+            event["created_at"] = now
+        try:
+            await self.collection.insert_many(events, ordered=False)
+        except Exception as e:
+            # Only clients of other workers miss these
+            logger.error("Event relay write failed (%s events): %s", len(events), e)
+
+    async def _poll(self) -> None:
+        overlap = timedelta(seconds=self.poll_interval * 2)
+        cursor = self.collection.find(
+            {"created_at": {"$gte": self._last_seen - overlap}, "origin": {"$ne": self.origin}},
+            projection={"_id": 0}
+        ).sort("created_at", 1)
+
+        async for event in cursor:
+            self._last_seen = max(self._last_seen, event["created_at"])
+            if event["id"] in self._relayed:
+                continue
+            self._relayed[event["id"]] = event["created_at"]
+            self.relayed += 1
+            self._deliver(event["type"], event["data"], event["tenant_id"], event.get("public_fields"))
+
+        horizon = self._last_seen - overlap * 2
+        self._relayed = {
+            event_id: at for event_id, at in self._relayed.items() if at >= horizon
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self._flush_outbox()
+                await self._poll()
+            except Exception as e:
+                logger.error("Event relay failed: %s", e)
+
+    def _resync(self, subscription: Subscription) -> None:
+        # Drop the backlog; the client only needs to know it must re-fetch
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.resyncs += 1
+        subscription.queue.put_nowait(
+            self._format(self._next_id, "resync", {"at": datetime.utcnow().isoformat()})
+        )
+
+    @staticmethod
+    def _format(event_id: int, event_type: str, data: Dict[str, Any]) -> str:
+        payload = json.dumps(data, default=str)
+        return f"id: {event_id}\nevent: {event_type}\ndata: {payload}\n\n"
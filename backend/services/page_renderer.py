@@ -0,0 +1,126 @@
+import hashlib
+import html
+import re
+from pathlib import Path
+from typing import Optional, List
+from models.content_models import PublishedContent
+import logging
+
+logger = logging.getLogger(__name__)
+
+ROOT_MARKER = '<div id="root"></div>'
+
+STATE_SCRIPT_ID = "landing-page-state"
+
+# Used when no frontend build is deployed next to the backend
+MINIMAL_SHELL = """<!DOCTYPE html>
+<html lang="en">
+  <head>
+    <meta charset="utf-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1" />
+    <title>Architecture Studio</title>
+  </head>
+  <body>
+    <div id="root"></div>
+  </body>
+</html>
+"""
+
+# Slot delimiter; cannot occur in an HTML document we would serve
+_SLOT = "\x00"
+
+_TITLE = re.compile(r"<title>.*?</title>", re.S | re.I)
+_DESCRIPTION = re.compile(r'<meta\s+name="description"[^>]*>', re.I)
+
+class PageTemplate:
+    """The landing page shell, compiled once into static byte segments
+
+    The title, meta description and root element of ``index.html`` become
+    slots; rendering only joins pre-encoded segments with the escaped
+    content, the hero markup and a JSON state blob the bundle can hydrate
+    from instead of fetching ``/api/content/landing-page``.
+    """
+
+    def __init__(self, source: str):
+        if ROOT_MARKER not in source:
+            raise ValueError(f"Template has no {ROOT_MARKER}")
+
+        marked = _TITLE.sub(f"<title>{_SLOT}title{_SLOT}</title>", source, count=1)
+        if _SLOT not in marked:
+            marked = marked.replace("</head>", f"<title>{_SLOT}title{_SLOT}</title></head>", 1)
+        description = f'<meta name="description" content="{_SLOT}description{_SLOT}" />'
+        if _DESCRIPTION.search(marked):
+            marked = _DESCRIPTION.sub(description, marked, count=1)
+        else:
+            marked = marked.replace("</head>", description + "</head>", 1)
+        marked = marked.replace(
+            ROOT_MARKER,
+            f'<div id="root">{_SLOT}root{_SLOT}</div>'
+            f'<script id="{STATE_SCRIPT_ID}" type="application/json">{_SLOT}state{_SLOT}</script>',
+            1
+        )
+
+        # Even positions are static text, odd positions slot names
+        self._segments: List[object] = [
+            part if i % 2 else part.encode() for i, part in enumerate(marked.split(_SLOT))
+        ]
+        self.digest = hashlib.sha1(source.encode()).hexdigest()[:12]
+
+    @classmethod
+    def load(cls, build_dir: Optional[Path]) -> "PageTemplate":
+        """Template from ``<build_dir>/index.html``, or the minimal shell"""
+
+        index = build_dir / "index.html" if build_dir else None
+        if index and index.is_file():
+            try:
+                return cls(index.read_text(encoding="utf-8"))
+            except ValueError as e:
+                logger.error("Unusable page template %s: %s", index, e)
+        else:
+            logger.warning("No frontend build at %s; the landing page is served without its bundle", build_dir)
+        return cls(MINIMAL_SHELL)
+
+    def render(self, content: PublishedContent, state: bytes) -> bytes:
+        """Render the page for ``content``; ``state`` is its JSON serialization"""
+
+        hero = content.hero
+        values = {
+            "title": html.escape(f"{content.footer.studio_name} - {hero.main_title} {hero.subtitle}").encode(),
+            "description": html.escape(hero.description).encode(),
+            "root": render_hero(content).encode(),
+            # "</script>" inside a string must not end the element
+            "state": bytes(state).replace(b"<", b"\\u003c")
+        }
+        return b"".join(values[part] if isinstance(part, str) else part for part in self._segments)
+
+def render_hero(content: PublishedContent) -> str:
+    """Critical above-the-fold markup
+
+    Must match the first client render of ``App`` when hydrating (see
+    ``frontend/src/index.js``): the App and LandingPage wrappers around
+    HeroSection, with the other sections mounted only after hydration.
+    """
+
+    hero = content.hero
+    escape = html.escape
+    return (
+        '<div class="App">'
+        '<div class="min-h-screen bg-stone-50">'
+        '<section class="relative min-h-screen flex items-center justify-center bg-stone-50 px-8 md:px-16 lg:px-24">'
+        '<div class="absolute inset-0 bg-gradient-to-br from-stone-100 to-stone-200 opacity-30"></div>'
+        '<div class="relative z-10 max-w-4xl mx-auto text-center space-y-12">'
+        '<h1 class="font-serif text-5xl md:text-7xl lg:text-8xl font-light text-stone-900 leading-[1.1] tracking-tight">'
+        f'{escape(hero.main_title)}<br /><span class="text-sage-600">{escape(hero.subtitle)}</span>'
+        '</h1>'
+        '<div class="space-y-8">'
+        '<p class="text-xl md:text-2xl font-light text-stone-700 leading-relaxed max-w-2xl mx-auto">'
+        f'{escape(hero.description)}'
+        '</p>'
+        '<div class="inline-block">'
+        '<div class="bg-white/80 backdrop-blur-sm px-8 py-4 rounded-sm border border-stone-200">'
+        f'<p class="text-base text-stone-600 font-medium tracking-wide">{escape(hero.launch_message)}</p>'
+        '</div></div></div></div>'
+        '</section>'
+        '</div>'
+        '</div>'
+    )
@@ -0,0 +1,190 @@
+import asyncio
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from models.content_models import LandingPageContent
+from services.content_service import ContentService
+from services.event_broadcaster import EventBroadcaster
+from services.snapshot_store import build_snapshot
+import logging
+
+logger = logging.getLogger(__name__)
+
+LEASE_ID = "publish_scheduler"
+
+class PublishScheduler:
+    """Publishes scheduled versions at their ``publish_at`` instant
+
+    One worker across the deployment holds a lease in ``scheduler_leases``
+    and plans cutovers. Within ``prewarm_seconds`` of a schedule the
+    version is serialized, compressed and staged in the snapshot store,
+    so the cutover itself is a claim, a publish write and a pointer swap.
+    The claim is an atomic ``find_one_and_update`` that leases the schedule
+    to one worker, and only the publish write (which must still find that
+    lease) clears ``publish_at``, so a version is published exactly once
+    even if leadership changes hands. Schedules live on the documents and
+    survive restarts; overdue ones, and ones whose claim expired because
+    the claiming worker died, are published on the next poll. Schedules of all tenants are planned
+    together; each cutover runs against its own tenant's snapshot store.
+    """
+
+    def __init__(self,
+                 db: AsyncIOMotorDatabase,
+                 broadcaster: Optional[EventBroadcaster] = None,
+                 snapshot_stores=None,
+                 prewarm_seconds: float = 60.0,
+                 poll_interval: float = 5.0,
+                 lease_seconds: float = 30.0,
+                 audit=None):
+        self.db = db
+        self.audit = audit
+        self.broadcaster = broadcaster
+        self.snapshot_stores = snapshot_stores
+        self.prewarm = timedelta(seconds=prewarm_seconds)
+        self.poll_interval = poll_interval
+        self.lease = timedelta(seconds=lease_seconds)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._cutovers: Dict[str, Tuple[datetime, asyncio.Task]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the scheduler loop"""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the loop, pending cutovers and release the lease"""
+
+        tasks = [task for _, task in self._cutovers.values()]
+        if self._task:
+            tasks.append(self._task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._cutovers.clear()
+        self._task = None
+
+        if self.is_leader:
+            try:
+                await self.db.scheduler_leases.delete_one({"_id": LEASE_ID, "owner": self.owner})
+            except Exception as e:
+                logger.warning("Failed to release scheduler lease: %s", e)
+            self.is_leader = False
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get scheduler status"""
+
+        return {
+            "owner": self.owner,
+            "is_leader": self.is_leader,
+            "prewarmed": {
+                content_id: publish_at for content_id, (publish_at, _) in self._cutovers.items()
+            }
+        }
+
+    def _content_service(self, tenant_id: Optional[str], snapshot_store=None) -> ContentService:
+        return ContentService(self.db, self.broadcaster, snapshot_store, tenant_id=tenant_id, audit=self.audit)
+
+    async def _acquire_lease(self) -> bool:
+        now = datetime.utcnow()
+        try:
+            lease = await self.db.scheduler_leases.find_one_and_update(
+                {"_id": LEASE_ID, "$or": [{"owner": self.owner}, {"expires_at": {"$lt": now}}]},
+                {"$set": {"owner": self.owner, "expires_at": now + self.lease}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            return lease is not None and lease["owner"] == self.owner
+        except DuplicateKeyError:
+            # Someone else holds a live lease
+            return False
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                self.is_leader = await self._acquire_lease()
+                if self.is_leader:
+                    await self._plan()
+            except Exception as e:
+                logger.error("Publish scheduler error: %s", e)
+            await asyncio.sleep(self.poll_interval)
+
+    async def _plan(self) -> None:
+        horizon = datetime.utcnow() + self.prewarm
+        due = await self._content_service(None).get_scheduled_content(until=horizon, claimable=True)
+
+        for content in due:
+            planned = self._cutovers.get(content.id)
+            if planned and planned[0] == content.publish_at:
+                continue
+            if planned:
+                # Rescheduled: drop the stale cutover
+                planned[1].cancel()
+            task = asyncio.create_task(self._cutover(content))
+            self._cutovers[content.id] = (content.publish_at, task)
+
+    def _render(self, content: LandingPageContent):
+        # Exactly what the document will look like once published
+        live = content.model_copy(update={
+            "is_published": True,
+            "publish_at": None,
+            "updated_at": content.publish_at
+        })
+        return build_snapshot(live)
+
+    async def _cutover(self, content: LandingPageContent) -> None:
+        publish_at = content.publish_at
+        snapshot_store = self.snapshot_stores.get(content.tenant_id) if self.snapshot_stores else None
+        prepared = None
+        try:
+            if snapshot_store:
+                prepared = snapshot_store.prepare(self._render(content))
+
+            delay = (publish_at - datetime.utcnow()).total_seconds()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            service = self._content_service(content.tenant_id, snapshot_store)
+            claimed = await service.claim_scheduled_publish(content.id, publish_at, self.owner, self.lease)
+            if not claimed:
+                logger.info("Scheduled publish of %s was cancelled or already done", content.id)
+                return
+
+            if snapshot_store and (
+                claimed.revision != content.revision or claimed.updated_at != content.updated_at
+            ):
+                # Edited after prewarm; render what is actually stored
+                snapshot_store.discard(prepared)
+                prepared = snapshot_store.prepare(self._render(claimed))
+
+            published = await service.publish_content(
+                content.id,
+                published_by=claimed.updated_by,
+                published_at=publish_at,
+                prepared_snapshot=prepared,
+                claimed_by=self.owner
+            )
+            if published:
+                prepared = None
+                lag = (datetime.utcnow() - publish_at).total_seconds()
+                logger.info("Scheduled publish of %s done (%.3fs after target)", content.id, lag)
+            else:
+                # The schedule is still set; let the next poll retry it
+                await service.release_scheduled_claim(content.id, self.owner)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Scheduled publish of %s failed: %s", content.id, e)
+        finally:
+            if prepared is not None and snapshot_store:
+                snapshot_store.discard(prepared)
+            current = self._cutovers.get(content.id)
+            if current and current[0] == publish_at:
+                self._cutovers.pop(content.id, None)
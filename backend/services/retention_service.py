@@ -0,0 +1,143 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from services.change_log import ContentChangeLog
+import logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class RetentionPolicy:
+    """Which content versions survive compaction
+
+    A version is deleted only when it is outside its tenant's newest
+    ``keep_last``, older than ``keep_days``, not published, not pinned and
+    not scheduled to publish.
+    """
+    keep_last: int = 50
+    keep_days: int = 90
+    batch_size: int = 100
+    interval_seconds: float = 3600.0
+    enabled: bool = False
+
+    @classmethod
+    def from_env(cls) -> "RetentionPolicy":
+        return cls(
+            keep_last=int(os.environ.get("CONTENT_RETENTION_KEEP_LAST", "50")),
+            keep_days=int(os.environ.get("CONTENT_RETENTION_KEEP_DAYS", "90")),
+            batch_size=int(os.environ.get("CONTENT_RETENTION_BATCH_SIZE", "100")),
+            interval_seconds=float(os.environ.get("CONTENT_RETENTION_INTERVAL_SECONDS", "3600")),
+            enabled=os.environ.get("CONTENT_RETENTION_ENABLED", "").lower() in ("1", "true", "yes")
+        )
+
+class RetentionService:
+    """Deletes content versions outside the retention policy in batches"""
+
+    def __init__(self, db: AsyncIOMotorDatabase, policy: RetentionPolicy):
+        self.db = db
+        self.collection = db.landing_page_content
+        self.changes = ContentChangeLog(db)
+        self.policy = policy
+        self.last_report: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    def start(self) -> None:
+        """Start the periodic compaction job (if enabled)"""
+
+        if self.policy.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the compaction job"""
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def enforce(self) -> Dict[str, Any]:
+        """Run one compaction pass and report what was reclaimed"""
+
+        async with self._lock:
+            started = time.perf_counter()
+            cutoff = datetime.utcnow() - timedelta(days=self.policy.keep_days)
+
+            # Re-checked on every delete so a publish/pin/schedule in between wins
+            guard = {"is_published": {"$ne": True}, "pinned": {"$ne": True}, "publish_at": None}
+            avg_size = await self._average_document_size()
+            deleted = 0
+            batches = 0
+            tenants = await self.collection.distinct("tenant_id")
+
+            # keep_last applies to each tenant's own history
+            for tenant_id in tenants:
+                tenant_guard = {**guard, "tenant_id": tenant_id}
+                recent = self.collection.find({"tenant_id": tenant_id}, projection={"_id": 0, "id": 1})
+                recent = recent.sort("updated_at", -1).limit(self.policy.keep_last)
+                keep_ids = [doc["id"] async for doc in recent]
+
+                candidates = self.collection.find(
+                    {**tenant_guard, "updated_at": {"$lt": cutoff}, "id": {"$nin": keep_ids}},
+                    projection={"_id": 0, "id": 1}
+                ).batch_size(self.policy.batch_size)
+
+                batch = []
+                async for doc in candidates:
+                    batch.append(doc["id"])
+                    if len(batch) >= self.policy.batch_size:
+                        deleted += await self._delete_batch(batch, tenant_guard)
+                        batches += 1
+                        batch = []
+                        # Let request handlers run between batches
+                        await asyncio.sleep(0)
+
+                if batch:
+                    deleted += await self._delete_batch(batch, tenant_guard)
+                    batches += 1
+
+            self.last_report = {
+                "run_at": datetime.utcnow(),
+                "policy": asdict(self.policy),
+                "tenants": len(tenants),
+                "deleted": deleted,
+                "batches": batches,
+                "reclaimed_bytes_estimate": int(deleted * avg_size),
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1)
+            }
+
+            if deleted:
+                logger.info("Retention removed %s content versions", deleted)
+            return self.last_report
+
+    async def _delete_batch(self, ids, guard: Dict[str, Any]) -> int:
+        result = await self.collection.delete_many({**guard, "id": {"$in": ids}})
+        if result.deleted_count:
+            # Whatever the guard kept is still there; the rest needs tombstones
+            kept = set(await self.collection.distinct("id", {"id": {"$in": ids}}))
+            await self.changes.record_deletes(
+                guard["tenant_id"], [i for i in ids if i not in kept], "retention"
+            )
+        return result.deleted_count
+
+    async def _average_document_size(self) -> float:
+        try:
+            stats = await self.db.command("collStats", self.collection.name)
+            return float(stats.get("avgObjSize", 0))
+        except Exception:
+            return 0.0
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.enforce()
+            except Exception as e:
+                logger.error("Retention run failed: %s", e)
+            await asyncio.sleep(self.policy.interval_seconds)
@@ -0,0 +1,171 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional, Dict
+from motor.motor_asyncio import AsyncIOMotorDatabase
+import logging
+
+logger = logging.getLogger(__name__)
+
+class RevocationList:
+    """In-memory revocation set for stateless access tokens
+
+    Revocations are written to ``admin_revocations`` and every worker pulls
+    new entries on a fixed interval, so a logout or password change takes
+    effect everywhere within one sync interval (immediately on the worker
+    that handled it). Entries carry the expiry of the token they revoke and
+    are dropped from memory once that token could no longer verify anyway.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase, sync_interval: float = 30.0):
+        self.db = db
+        self.collection = db.admin_revocations
+        self.sync_interval = sync_interval
+        self._revoked_jtis: Dict[str, datetime] = {}
+        self._revoked_sids: Dict[str, datetime] = {}
+        self._user_not_before: Dict[str, datetime] = {}
+        self._user_expires: Dict[str, datetime] = {}
+        self._last_seen: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+        self.last_sync: Optional[datetime] = None
+
+    async def start(self) -> None:
+        """Create indexes, load current revocations and start syncing"""
+
+        await self.collection.create_index("created_at")
+        # Mongo drops revocations once the revoked tokens have expired
+        await self.collection.create_index("expires_at", expireAfterSeconds=0)
+        await self.sync()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the sync loop"""
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def is_revoked(self,
+                   jti: Optional[str],
+                   user_id: str,
+                   issued_at: datetime,
+                   sid: Optional[str] = None) -> bool:
+        """Check a token against the in-memory revocation set"""
+
+        if jti and jti in self._revoked_jtis:
+            return True
+        if sid and sid in self._revoked_sids:
+            return True
+        not_before = self._user_not_before.get(user_id)
+        return not_before is not None and issued_at < not_before
+
+    async def revoke_token(self, jti: str, user_id: str, expires_at: datetime) -> None:
+        """Revoke a single access token"""
+
+        self._revoked_jtis[jti] = expires_at
+        await self.collection.insert_one({
+            "id": str(uuid.uuid4()),
+            "jti": jti,
+            "user_id": user_id,
+            "expires_at": expires_at,
+            "created_at": datetime.utcnow()
+        })
+
+    async def revoke_session(self, sid: str, user_id: str, expires_at: datetime) -> None:
+        """Revoke every access token issued for a login session
+
+        ``expires_at`` must cover the longest-lived token of the session.
+        """
+
+        self._revoked_sids[sid] = expires_at
+        await self.collection.insert_one({
+            "id": str(uuid.uuid4()),
+            "jti": None,
+            "sid": sid,
+            "user_id": user_id,
+            "expires_at": expires_at,
+            "created_at": datetime.utcnow()
+        })
+
+    async def revoke_user(self, user_id: str, not_before: datetime, expires_at: datetime) -> None:
+        """Revoke every token of a user issued before ``not_before``"""
+
+        self._apply_user(user_id, not_before, expires_at)
+        await self.collection.insert_one({
+            "id": str(uuid.uuid4()),
+            "jti": None,
+            "user_id": user_id,
+            "not_before": not_before,
+            "expires_at": expires_at,
+            "created_at": datetime.utcnow()
+        })
+
+    async def sync(self) -> None:
+        """Pull revocations created since the last sync"""
+
+        query = {"expires_at": {"$gt": datetime.utcnow()}}
+        if self._last_seen:
+            # Overlap one interval to tolerate clock skew between workers
+            overlap = timedelta(seconds=self.sync_interval)
+            query["created_at"] = {"$gte": self._last_seen - overlap}
+
+        cursor = self.collection.find(
+            query,
+            projection={"_id": 0, "jti": 1, "sid": 1, "user_id": 1, "not_before": 1,
+                        "expires_at": 1, "created_at": 1}
+        ).sort("created_at", 1)
+
+        async for doc in cursor:
+            if doc.get("jti"):
+                self._revoked_jtis[doc["jti"]] = doc["expires_at"]
+            elif doc.get("sid"):
+                self._revoked_sids[doc["sid"]] = doc["expires_at"]
+            elif doc.get("not_before"):
+                self._apply_user(doc["user_id"], doc["not_before"], doc["expires_at"])
+            self._last_seen = doc["created_at"]
+
+        self._prune()
+        self.last_sync = datetime.utcnow()
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get revocation list statistics"""
+
+        return {
+            "revoked_tokens": len(self._revoked_jtis),
+            "revoked_sessions": len(self._revoked_sids),
+            "revoked_users": len(self._user_not_before),
+            "sync_interval_seconds": self.sync_interval,
+            "last_sync": self.last_sync
+        }
+
+    def _apply_user(self, user_id: str, not_before: datetime, expires_at: datetime) -> None:
+        current = self._user_not_before.get(user_id)
+        if current is None or not_before > current:
+            self._user_not_before[user_id] = not_before
+        self._user_expires[user_id] = max(expires_at, self._user_expires.get(user_id, expires_at))
+
+    def _prune(self) -> None:
+        now = datetime.utcnow()
+        self._revoked_jtis = {
+            jti: expires for jti, expires in self._revoked_jtis.items() if expires > now
+        }
+        self._revoked_sids = {
+            sid: expires for sid, expires in self._revoked_sids.items() if expires > now
+        }
+        for user_id, expires in list(self._user_expires.items()):
+            if expires <= now:
+                self._user_expires.pop(user_id, None)
+                self._user_not_before.pop(user_id, None)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.error("Revocation sync failed: %s", e)
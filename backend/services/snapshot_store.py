@@ -0,0 +1,361 @@
+import asyncio
+import fcntl
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import struct
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Union, Callable, Dict, Any
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from models.content_models import LandingPageContent, PublishedContent
+import logging
+
+logger = logging.getLogger(__name__)
+
+Buffer = Union[bytes, memoryview]
+
+@dataclass
+class PublishedSnapshot:
+    """Serialized published content, ready to be written to the wire"""
+    content_id: str
+    version: str
+    etag: str
+    plain: Buffer
+    compressed: Buffer
+    generation: int = 0
+
+def public_content(content: LandingPageContent) -> PublishedContent:
+    """Public projection of stored content (no tenant, scheduling or sync fields)"""
+
+    return PublishedContent.model_validate(content.model_dump(include=set(PublishedContent.model_fields)))
+
+def build_snapshot(content: LandingPageContent) -> PublishedSnapshot:
+    """Serialize and gzip the public projection once for all readers
+
+    Only public fields go into the body, so pinning, change stamps and
+    other bookkeeping writes leave the ETag unchanged.
+    """
+
+    body = public_content(content).model_dump_json().encode()
+    return snapshot_from_bytes(content.id, content.version, body)
+
+def snapshot_from_bytes(content_id: str, version: str, plain: bytes) -> PublishedSnapshot:
+    """Wrap an already serialized body (ETag from its hash)"""
+
+    return PublishedSnapshot(
+        content_id=content_id,
+        version=version,
+        etag='"' + hashlib.sha1(plain).hexdigest()[:20] + '"',
+        plain=plain,
+        compressed=gzip.compress(plain, compresslevel=6)
+    )
+
+class LocalSnapshotStore:
+    """Per-process published snapshot with a short TTL
+
+    Used when workers do not share a snapshot segment; the TTL bounds how
+    long a worker that did not handle a publish keeps serving the old one.
+    """
+
+    def __init__(self, ttl: float = 5.0):
+        self.ttl = ttl
+        self._snapshot: Optional[PublishedSnapshot] = None
+        self._loaded_at = 0.0
+
+    def current(self) -> Optional[PublishedSnapshot]:
+        if self._snapshot and time.monotonic() - self._loaded_at < self.ttl:
+            return self._snapshot
+        return None
+
+    def set(self, snapshot: PublishedSnapshot) -> None:
+        self._snapshot = snapshot
+        self._loaded_at = time.monotonic()
+
+    def prepare(self, snapshot: PublishedSnapshot) -> PublishedSnapshot:
+        """Stage a snapshot for a later ``activate`` (nothing to write locally)"""
+        return snapshot
+
+    def activate(self, prepared: PublishedSnapshot) -> None:
+        self.set(prepared)
+
+    def discard(self, prepared: PublishedSnapshot) -> None:
+        pass
+
+    def clear(self) -> None:
+        self._snapshot = None
+
+    def close(self) -> None:
+        self.clear()
+
+    @property
+    def nbytes(self) -> int:
+        if not self._snapshot:
+            return 0
+        return len(self._snapshot.plain) + len(self._snapshot.compressed)
+
+class SharedSnapshotStore:
+    """Published snapshot shared by all workers through mmap-ed files
+
+    ``control`` holds the current generation number; each generation's
+    snapshot lives in its own immutable ``snapshot-<gen>.bin``. Readers
+    compare the control word on every request and re-map only when it
+    changes, then serve zero-copy views of the mapping. Writers serialize
+    on an flock, write the new file, and flip the generation, so every
+    worker switches on its next request after the flip.
+    """
+
+    _CONTROL = struct.Struct("<Q")
+    _HEADER = struct.Struct("<III")
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._control: Optional[mmap.mmap] = None
+        self._open()
+        self._generation = 0
+        self._snapshot: Optional[PublishedSnapshot] = None
+
+    def _open(self) -> None:
+        control_path = os.path.join(self.directory, "control")
+        self._control_fd = os.open(control_path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._control_fd).st_size < self._CONTROL.size:
+            os.ftruncate(self._control_fd, self._CONTROL.size)
+        self._control = mmap.mmap(self._control_fd, self._CONTROL.size)
+        # Also runs when the last reference goes away without a close()
+        self._release = weakref.finalize(self, _close_control, self._control, self._control_fd)
+
+    def current(self) -> Optional[PublishedSnapshot]:
+        if self._control is None:
+            return None
+        generation = self._CONTROL.unpack_from(self._control, 0)[0]
+        if generation == 0:
+            return None
+        if generation != self._generation:
+            try:
+                self._snapshot = self._load(generation)
+            except FileNotFoundError:
+                # Superseded twice while we looked; take the newest one
+                generation = self._CONTROL.unpack_from(self._control, 0)[0]
+                self._snapshot = self._load(generation)
+            self._generation = generation
+        return self._snapshot
+
+    def set(self, snapshot: PublishedSnapshot) -> None:
+        self.activate(self.prepare(snapshot))
+
+    def prepare(self, snapshot: PublishedSnapshot) -> str:
+        """Write a snapshot file ahead of time; returns a token for ``activate``"""
+
+        meta = json.dumps({
+            "content_id": snapshot.content_id,
+            "version": snapshot.version,
+            "etag": snapshot.etag
+        }).encode()
+
+        path = os.path.join(self.directory, f"prepared-{uuid.uuid4().hex}.bin")
+        with open(path, "wb") as f:
+            f.write(self._HEADER.pack(len(meta), len(snapshot.plain), len(snapshot.compressed)))
+            f.write(meta)
+            f.write(snapshot.plain)
+            f.write(snapshot.compressed)
+        return path
+
+    def activate(self, prepared: str) -> None:
+        """Make a prepared snapshot current: one rename and a generation flip"""
+
+        if self._control is None:
+            # Closed on shutdown; nothing reads from us any more
+            self.discard(prepared)
+            return
+        fcntl.flock(self._control_fd, fcntl.LOCK_EX)
+        try:
+            generation = self._CONTROL.unpack_from(self._control, 0)[0] + 1
+            os.replace(prepared, self._path(generation))
+            self._CONTROL.pack_into(self._control, 0, generation)
+        finally:
+            fcntl.flock(self._control_fd, fcntl.LOCK_UN)
+
+        # Mapped files stay valid after unlink, so old generations can go
+        stale = self._path(generation - 2)
+        if os.path.exists(stale):
+            os.unlink(stale)
+
+    def discard(self, prepared: str) -> None:
+        """Drop a prepared snapshot that will not be activated"""
+        if os.path.exists(prepared):
+            os.unlink(prepared)
+
+    def clear(self) -> None:
+        """Publish "no snapshot": every reader returns None until the next activate"""
+
+        # An empty generation rather than a reset to 0, so readers holding
+        # an old generation number can never mistake a reused one for theirs
+        path = os.path.join(self.directory, f"prepared-{uuid.uuid4().hex}.bin")
+        with open(path, "wb") as f:
+            f.write(self._HEADER.pack(0, 0, 0))
+        self.activate(path)
+
+    def close(self) -> None:
+        """Unmap the control word and forget the current mapping"""
+        self._snapshot = None
+        self._generation = 0
+        if self._control is not None:
+            self._release()
+            self._control = None
+
+    @property
+    def nbytes(self) -> int:
+        if not self._snapshot:
+            return 0
+        return len(self._snapshot.plain) + len(self._snapshot.compressed)
+
+    def _path(self, generation: int) -> str:
+        return os.path.join(self.directory, f"snapshot-{generation}.bin")
+
+    def _load(self, generation: int) -> Optional[PublishedSnapshot]:
+        with open(self._path(generation), "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(mapped)
+        meta_len, plain_len, compressed_len = self._HEADER.unpack_from(view, 0)
+        if meta_len == 0:
+            # Written by ``clear``
+            view.release()
+            mapped.close()
+            return None
+        offset = self._HEADER.size
+        meta = json.loads(bytes(view[offset:offset + meta_len]))
+        offset += meta_len
+
+        return PublishedSnapshot(
+            content_id=meta["content_id"],
+            version=meta["version"],
+            etag=meta["etag"],
+            plain=view[offset:offset + plain_len],
+            compressed=view[offset + plain_len:offset + plain_len + compressed_len],
+            generation=generation
+        )
+
+def _close_control(control: mmap.mmap, fd: int) -> None:
+    control.close()
+    os.close(fd)
+
+class TenantSnapshotStores:
+    """One snapshot store per tenant, bounded by an LRU over tenants
+
+    Stores are created on first use by ``factory(tenant_id)``. When more
+    than ``max_tenants`` are open, or their snapshots together exceed
+    ``max_bytes``, the least recently used tenants are dropped; their next
+    request opens a new store. A dropped store is not closed, since an
+    in-flight request or a pending cutover may still hold it; it releases
+    its resources once the last holder lets go.
+    """
+
+    def __init__(self,
+                 factory: Callable[[str], Any],
+                 max_tenants: int = 100,
+                 max_bytes: int = 64 * 1024 * 1024):
+        self.factory = factory
+        self.max_tenants = max_tenants
+        self.max_bytes = max_bytes
+        self._stores: "OrderedDict[str, Any]" = OrderedDict()
+        self.evictions = 0
+
+    def get(self, tenant_id: str):
+        """Get (or open) the snapshot store of a tenant"""
+
+        store = self._stores.get(tenant_id)
+        if store is not None:
+            self._stores.move_to_end(tenant_id)
+            return store
+
+        store = self.factory(tenant_id)
+        self._stores[tenant_id] = store
+        self._evict()
+        return store
+
+    def close(self) -> None:
+        for store in self._stores.values():
+            store.close()
+        self._stores.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "tenants": len(self._stores),
+            "max_tenants": self.max_tenants,
+            "bytes": sum(store.nbytes for store in self._stores.values()),
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions
+        }
+
+    def _evict(self) -> None:
+        # Sizes only change on publish, so checking on open is enough
+        total = sum(store.nbytes for store in self._stores.values())
+        while len(self._stores) > 1 and (
+            len(self._stores) > self.max_tenants or total > self.max_bytes
+        ):
+            tenant_id, store = self._stores.popitem(last=False)
+            total -= store.nbytes
+            self.evictions += 1
+            logger.debug("Evicted snapshot store of tenant %s", tenant_id)
+
+class SnapshotPublisher:
+    """Keeps per-tenant snapshot stores in sync with the published documents
+
+    Runs in its own process next to the workers and catches publishes that did not go
+    through a worker of this deployment (other instances, manual edits).
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase, stores: TenantSnapshotStores, interval: float = 2.0):
+        self.db = db
+        self.stores = stores
+        self.interval = interval
+        self._last_seen: Dict[str, Any] = {}
+
+    async def refresh(self) -> int:
+        """Rebuild the snapshots whose published document changed"""
+
+        markers = self.db.landing_page_content.find(
+            {"is_published": True},
+            projection={"_id": 0, "id": 1, "tenant_id": 1, "updated_at": 1, "revision": 1}
+        ).sort("updated_at", 1)
+
+        # Ascending, so the newest published version of a tenant wins
+        latest: Dict[str, Any] = {}
+        async for marker in markers:
+            latest[marker.get("tenant_id", "default")] = marker
+
+        refreshed = 0
+        for tenant_id, marker in latest.items():
+            key = (marker["id"], marker.get("updated_at"), marker.get("revision"))
+            if key == self._last_seen.get(tenant_id):
+                continue
+
+            content_data = await self.db.landing_page_content.find_one({"id": marker["id"]})
+            if not content_data:
+                continue
+
+            store = self.stores.get(tenant_id)
+            snapshot = build_snapshot(LandingPageContent(**content_data))
+            current = store.current()
+            if not current or current.etag != snapshot.etag:
+                store.set(snapshot)
+                refreshed += 1
+                logger.info("Published snapshot refreshed: %s/%s", tenant_id, snapshot.content_id)
+
+            self._last_seen[tenant_id] = key
+        return refreshed
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error("Snapshot refresh failed: %s", e)
+            await asyncio.sleep(self.interval)
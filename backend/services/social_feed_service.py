@@ -0,0 +1,146 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+import requests
+from models.content_models import SocialFeed, SocialPost
+from services.tenant_service import DEFAULT_TENANT
+import logging
+
+logger = logging.getLogger(__name__)
+
+INSTAGRAM_MEDIA_URL = "https://graph.instagram.com/me/media"
+INSTAGRAM_FIELDS = "id,caption,media_type,media_url,thumbnail_url,permalink,timestamp"
+
+@dataclass
+class FeedEntry:
+    """Last good feed of a tenant"""
+    posts: List[Dict[str, Any]] = field(default_factory=list)
+    fetched_at: Optional[datetime] = None
+    fetched_monotonic: float = 0.0
+    failed_monotonic: Optional[float] = None
+    digest: str = "none"
+
+class SocialFeedService:
+    """Cached Instagram feed per tenant
+
+    Posts are cached for ``cache_seconds`` (one hour by default, per the
+    API contract). Refreshes run in the background, one per tenant at a
+    time; a caller waits at most ``timeout`` for one and otherwise gets
+    the last good posts (``stale``) or none (``empty``). A failed fetch is
+    not retried for ``error_backoff`` seconds.
+
+    The access token comes from ``INSTAGRAM_ACCESS_TOKEN`` for the default
+    tenant and ``INSTAGRAM_ACCESS_TOKEN_<TENANT>`` for others.
+    """
+
+    def __init__(self,
+                 cache_seconds: float = 3600.0,
+                 error_backoff: float = 60.0,
+                 request_timeout: float = 5.0,
+                 limit: int = 9,
+                 max_tenants: int = 100):
+        self.cache_seconds = cache_seconds
+        self.error_backoff = error_backoff
+        self.request_timeout = request_timeout
+        self.limit = limit
+        self.max_tenants = max_tenants
+        self._entries: "OrderedDict[str, FeedEntry]" = OrderedDict()
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+    async def get_feed(self, tenant_id: str, timeout: float) -> SocialFeed:
+        """Get the tenant's feed, waiting at most ``timeout`` seconds for a refresh"""
+
+        token = self._token(tenant_id)
+        if not token:
+            return SocialFeed(status="empty")
+
+        entry = self._entry(tenant_id)
+        now = time.monotonic()
+        fresh = entry.fetched_at and now - entry.fetched_monotonic < self.cache_seconds
+        backing_off = entry.failed_monotonic is not None and now - entry.failed_monotonic < self.error_backoff
+
+        if not fresh and not backing_off:
+            task = self._refreshing.get(tenant_id)
+            if task is None:
+                task = asyncio.create_task(self._refresh(tenant_id, token))
+                self._refreshing[tenant_id] = task
+                task.add_done_callback(lambda _: self._refreshing.pop(tenant_id, None))
+            try:
+                # Shielded: a slow API delays the next page view, not this one
+                await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            fresh = entry.fetched_at and time.monotonic() - entry.fetched_monotonic < self.cache_seconds
+
+        return SocialFeed(
+            status="fresh" if fresh else ("stale" if entry.fetched_at else "empty"),
+            posts=[SocialPost(**post) for post in entry.posts],
+            fetched_at=entry.fetched_at
+        )
+
+    async def stop(self) -> None:
+        """Cancel in-flight refreshes"""
+
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def version(self, tenant_id: str, feed: SocialFeed) -> str:
+        """Short version of a feed for composite ETags"""
+        digest = self._entries[tenant_id].digest if tenant_id in self._entries else "none"
+        return f"{feed.status}:{digest}"
+
+    def _token(self, tenant_id: str) -> Optional[str]:
+        suffix = tenant_id.upper().replace("-", "_")
+        token = os.environ.get(f"INSTAGRAM_ACCESS_TOKEN_{suffix}")
+        if not token and tenant_id == DEFAULT_TENANT:
+            token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
+        return token
+
+    def _entry(self, tenant_id: str) -> FeedEntry:
+        entry = self._entries.get(tenant_id)
+        if entry is None:
+            entry = FeedEntry()
+            self._entries[tenant_id] = entry
+            if len(self._entries) > self.max_tenants:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(tenant_id)
+        return entry
+
+    async def _refresh(self, tenant_id: str, token: str) -> None:
+        entry = self._entry(tenant_id)
+        try:
+            posts = await asyncio.to_thread(self._fetch, token)
+        except Exception as e:
+            entry.failed_monotonic = time.monotonic()
+            # requests errors embed the URL, and with it the access token
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            logger.warning("Instagram feed refresh failed for %s: %s", tenant_id, status or type(e).__name__)
+            return
+
+        entry.posts = posts
+        entry.fetched_at = datetime.utcnow()
+        entry.fetched_monotonic = time.monotonic()
+        entry.digest = hashlib.sha1(json.dumps(posts, sort_keys=True).encode()).hexdigest()[:12]
+
+    def _fetch(self, token: str) -> List[Dict[str, Any]]:
+        # Runs in a worker thread
+        response = requests.get(
+            INSTAGRAM_MEDIA_URL,
+            params={"fields": INSTAGRAM_FIELDS, "limit": self.limit, "access_token": token},
+            timeout=self.request_timeout
+        )
+        response.raise_for_status()
+        posts = response.json().get("data", [])
+        return [
+            {key: post.get(key) for key in INSTAGRAM_FIELDS.split(",")}
+            for post in posts[:self.limit]
+        ]
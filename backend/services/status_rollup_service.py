@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+import uuid
+import logging
+
+logger = logging.getLogger(__name__)
+
+GRANULARITIES = {"hour": "h", "day": "D", "week": "W"}
+
+def hour_bucket(timestamp: datetime) -> datetime:
+    """Start of the hour containing ``timestamp``"""
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+def merge_buckets(rows: List[Dict[str, Any]], granularity: str) -> List[Dict[str, Any]]:
+    """Merge hourly rollup rows into coarser buckets with pandas"""
+
+    if granularity == "hour" or not rows:
+        return rows
+
+    # pandas is only needed for coarse queries; keep it off the import path
+    import pandas as pd
+
+    frame = pd.DataFrame(rows)
+    buckets = frame["bucket"].dt.to_period(GRANULARITIES[granularity]).dt.start_time
+    merged = frame.groupby(["client_name", buckets], sort=True)["count"].sum().reset_index()
+
+    return [
+        {"client_name": client_name, "bucket": bucket.to_pydatetime(), "count": int(count)}
+        for client_name, bucket, count in merged.itertuples(index=False, name=None)
+    ]
+
+class StatusRollupService:
+    """Hourly per-client status check counts, maintained on ingest"""
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+        self.collection = db.status_check_rollups
+        self.raw_collection = db.status_checks
+
+    async def ensure_indexes(self) -> None:
+        """Create rollup indexes"""
+
+        await self.collection.create_index([("client_name", 1), ("bucket", 1)], unique=True)
+        await self.collection.create_index("bucket")
+        await self.raw_collection.create_index("timestamp")
+
+    async def record(self, client_name: str, timestamp: datetime) -> None:
+        """Count one status check into its hourly bucket"""
+
+        await self.collection.update_one(
+            {"client_name": client_name, "bucket": hour_bucket(timestamp)},
+            {"$inc": {"count": 1}},
+            upsert=True
+        )
+
+    async def query(self,
+                    start: datetime,
+                    end: datetime,
+                    granularity: str = "hour",
+                    client_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Counts per client and bucket over [start, end)"""
+
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unsupported granularity: {granularity}")
+
+        query: Dict[str, Any] = {"bucket": {"$gte": hour_bucket(start), "$lt": end}}
+        if client_name:
+            query["client_name"] = client_name
+
+        cursor = self.collection.find(
+            query,
+            projection={"_id": 0, "client_name": 1, "bucket": 1, "count": 1}
+        ).sort([("bucket", 1), ("client_name", 1)])
+
+        rows = [row async for row in cursor]
+        return merge_buckets(rows, granularity)
+
+    async def rebuild(self,
+                      start: Optional[datetime] = None,
+                      end: Optional[datetime] = None) -> int:
+        """Recompute hourly buckets from raw status checks with an aggregation pipeline
+
+        Buckets in the range that no longer have raw checks are removed.
+        """
+
+        window: Dict[str, Any] = {}
+        if start:
+            window["$gte"] = hour_bucket(start)
+        if end:
+            window["$lt"] = hour_bucket(end) + timedelta(hours=1)
+        match: Dict[str, Any] = {"timestamp": window} if window else {}
+
+        pipeline = [
+            {"$match": match},
+            {"$group": {
+                "_id": {
+                    "client_name": "$client_name",
+                    "bucket": {"$dateFromParts": {
+                        "year": {"$year": "$timestamp"},
+                        "month": {"$month": "$timestamp"},
+                        "day": {"$dayOfMonth": "$timestamp"},
+                        "hour": {"$hour": "$timestamp"}
+                    }}
+                },
+                "count": {"$sum": 1}
+            }}
+        ]
+
+        # Rewritten buckets carry this rebuild's id; the rest of the range is stale
+        rebuild_id = uuid.uuid4().hex
+        operations = []
+        buckets = 0
+        async for row in self.raw_collection.aggregate(pipeline, allowDiskUse=True):
+            operations.append(UpdateOne(
+                {"client_name": row["_id"]["client_name"], "bucket": row["_id"]["bucket"]},
+                {"$set": {"count": row["count"], "rebuild_id": rebuild_id}},
+                upsert=True
+            ))
+            if len(operations) >= 1000:
+                await self.collection.bulk_write(operations, ordered=False)
+                buckets += len(operations)
+                operations = []
+
+        if operations:
+            await self.collection.bulk_write(operations, ordered=False)
+            buckets += len(operations)
+
+        stale: Dict[str, Any] = {"rebuild_id": {"$ne": rebuild_id}}
+        if window:
+            stale["bucket"] = window
+        removed = await self.collection.delete_many(stale)
+
+        logger.info("Rebuilt %s status rollup buckets, removed %s", buckets, removed.deleted_count)
+        return buckets
@@ -0,0 +1,132 @@
+import asyncio
+import re
+from typing import Optional, Dict, Any, List
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
+from models.content_models import Tenant
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT = "default"
+
+# Tenant ids appear in URLs and snapshot directory names
+TENANT_ID_PATTERN = re.compile(r"^[a-z0-9][a-z0-9-]{0,62}$")
+
+# Collections whose documents belong to a tenant
+TENANT_COLLECTIONS = ["landing_page_content", "admin_users", "admin_sessions"]
+
+def normalize_host(host: str) -> str:
+    """Lower-case a Host header value and strip the port"""
+    host = host.strip().lower()
+    if host.startswith("["):
+        # IPv6 literal
+        return host.split("]")[0] + "]"
+    return host.split(":")[0]
+
+class TenantRegistry:
+    """Known tenants and the host names they are served on
+
+    The host map is held in memory and reloaded every ``refresh_interval``
+    seconds, so tenant resolution never touches the database on the
+    request path. Requests for unknown hosts are served as the default
+    tenant, which keeps single-site deployments working unchanged.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase, refresh_interval: float = 60.0):
+        self.db = db
+        self.collection = db.tenants
+        self.refresh_interval = refresh_interval
+        self._hosts: Dict[str, str] = {}
+        self._tenants = {DEFAULT_TENANT}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Create indexes, migrate untagged documents, load and keep refreshing"""
+
+        await self.collection.create_index("id", unique=True)
+        await self.collection.create_index("hosts")
+        await self.migrate_legacy_documents()
+        await self.refresh()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the refresh loop"""
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def migrate_legacy_documents(self) -> Dict[str, int]:
+        """Assign documents created before multi-tenancy to the default tenant"""
+
+        migrated = {}
+        for name in TENANT_COLLECTIONS:
+            result = await self.db[name].update_many(
+                {"tenant_id": {"$exists": False}},
+                {"$set": {"tenant_id": DEFAULT_TENANT}}
+            )
+            if result.modified_count:
+                migrated[name] = result.modified_count
+        if migrated:
+            logger.info("Assigned legacy documents to the default tenant: %s", migrated)
+        return migrated
+
+    async def refresh(self) -> None:
+        """Reload the tenant list and host map"""
+
+        hosts: Dict[str, str] = {}
+        tenants = {DEFAULT_TENANT}
+        async for doc in self.collection.find({}, projection={"_id": 0, "id": 1, "hosts": 1}):
+            tenants.add(doc["id"])
+            for host in doc.get("hosts", []):
+                hosts[normalize_host(host)] = doc["id"]
+        self._hosts = hosts
+        self._tenants = tenants
+
+    def resolve_host(self, host: str) -> str:
+        """Tenant serving ``host`` (the default tenant when unmapped)"""
+        return self._hosts.get(normalize_host(host), DEFAULT_TENANT)
+
+    def is_known(self, tenant_id: str) -> bool:
+        return tenant_id in self._tenants
+
+    async def create_tenant(self, tenant_id: str, name: str, hosts: List[str]) -> Tenant:
+        """Register a tenant and the hosts it is served on"""
+
+        if not TENANT_ID_PATTERN.match(tenant_id):
+            raise ValueError("Tenant id must be lower-case letters, digits and dashes")
+
+        tenant = Tenant(id=tenant_id, name=name, hosts=[normalize_host(h) for h in hosts])
+        if tenant.hosts and await self.collection.find_one({"hosts": {"$in": tenant.hosts}}):
+            raise ValueError("Host already registered to another tenant")
+        try:
+            await self.collection.insert_one(tenant.dict())
+        except DuplicateKeyError:
+            raise ValueError("Tenant id already registered")
+
+        await self.refresh()
+        logger.info("Registered tenant %s for hosts %s", tenant.id, tenant.hosts)
+        return tenant
+
+    async def list_tenants(self) -> List[Tenant]:
+        """Get all registered tenants"""
+
+        cursor = self.collection.find({}, projection={"_id": 0}).sort("id", 1)
+        return [Tenant(**doc) async for doc in cursor]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"tenants": len(self._tenants), "hosts": len(self._hosts)}
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error("Tenant refresh failed: %s", e)
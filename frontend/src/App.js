@@ -7,7 +7,10 @@ import LandingPage from "./components/LandingPage";
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
 
-function App() {
+// The landing page is also server-rendered at /api/page (see backend page_router)
+const LANDING_PAGE_PATHS = ["/", "/api/page", "/t/:tenant/api/page"];
+
+function App({ initialContent = null }) {
   const helloWorldApi = async () => {
     try {
       const response = await axios.get(`${API}/`);
@@ -25,7 +28,9 @@ function App() {
     <div className="App">
       <BrowserRouter>
         <Routes>
-          <Route path="/" element={<LandingPage />} />
+          {LANDING_PAGE_PATHS.map((path) => (
+            <Route key={path} path={path} element={<LandingPage initialContent={initialContent} />} />
+          ))}
         </Routes>
       </BrowserRouter>
     </div>
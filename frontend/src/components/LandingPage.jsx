@@ -1,4 +1,4 @@
-import React from 'react';
+import React, { useEffect, useState } from 'react';
 import HeroSection from './HeroSection';
 import AboutSection from './AboutSection';
 import SocialMediaSection from './SocialMediaSection';
@@ -6,15 +6,27 @@ import WhatToExpectSection from './WhatToExpectSection';
 import ContactPreviewSection from './ContactPreviewSection';
 import Footer from './Footer';
 
-const LandingPage = () => {
+const LandingPage = ({ initialContent = null }) => {
+  // When hydrating server markup, the first render must be exactly the
+  // server-rendered hero; the other sections mount right after
+  const [hydrated, setHydrated] = useState(!initialContent);
+
+  useEffect(() => {
+    setHydrated(true);
+  }, []);
+
   return (
     <div className="min-h-screen bg-stone-50">
-      <HeroSection />
-      <AboutSection />
-      <SocialMediaSection />
-      <WhatToExpectSection />
-      <ContactPreviewSection />
-      <Footer />
+      <HeroSection hero={initialContent?.hero} />
+      {hydrated && (
+        <>
+          <AboutSection />
+          <SocialMediaSection />
+          <WhatToExpectSection />
+          <ContactPreviewSection />
+          <Footer />
+        </>
+      )}
     </div>
   );
 };
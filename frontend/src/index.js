@@ -3,9 +3,20 @@ import ReactDOM from "react-dom/client";
 import "@/index.css";
 import App from "@/App";
 
-const root = ReactDOM.createRoot(document.getElementById("root"));
-root.render(
+// Served by /api/page, the markup already holds the hero and the content
+// comes inline, so hydrate it instead of rendering from scratch
+const container = document.getElementById("root");
+const state = document.getElementById("landing-page-state");
+const initialContent = state ? JSON.parse(state.textContent) : null;
+
+const app = (
   <React.StrictMode>
-    <App />
-  </React.StrictMode>,
+    <App initialContent={initialContent} />
+  </React.StrictMode>
 );
+
+if (initialContent && container.hasChildNodes()) {
+  ReactDOM.hydrateRoot(container, app);
+} else {
+  ReactDOM.createRoot(container).render(app);
+}
@@ -0,0 +1,26 @@
+import asyncio
+import inspect
+import sys
+from pathlib import Path
+
+import pytest
+
+# Backend modules import each other as top-level packages (services, models, ...)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Run ``async def`` tests, each in a fresh event loop"""
+
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    arguments = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    asyncio.run(pyfuncitem.obj(**arguments))
+    return True
+
+@pytest.fixture
+def new_db():
+    """Factory for an empty in-memory Motor database"""
+
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    return lambda: mongomock_motor.AsyncMongoMockClient()["test"]
@@ -0,0 +1,95 @@
+import json
+
+from middleware.admission import (
+    AdmissionController, AdmissionMiddleware, RouteClass, TokenBucket, classify
+)
+
+def controller(**options):
+    classes = {
+        "public_read": RouteClass("public_read"),
+        "auth": RouteClass("auth", max_concurrency=2, rate=1.0, burst=2),
+        "admin": RouteClass("admin", max_concurrency=8),
+    }
+    return AdmissionController(classes, **options)
+
+def scope(forwarded=(), peer="10.0.0.1"):
+    headers = [(b"x-forwarded-for", value.encode()) for value in forwarded]
+    return {"headers": headers, "client": (peer, 1234)}
+
+def test_token_bucket_allows_a_burst_then_reports_the_wait():
+    bucket = TokenBucket(burst=2)
+    assert bucket.take(rate=1.0, burst=2) == 0
+    assert bucket.take(rate=1.0, burst=2) == 0
+    wait = bucket.take(rate=1.0, burst=2)
+    assert 0 < wait <= 1.0
+
+def test_rate_limits_are_per_client():
+    admission = controller()
+    for _ in range(2):
+        assert admission.admit("auth", "1.1.1.1") is None
+        admission.release("auth")
+    status, retry_after = admission.admit("auth", "1.1.1.1")
+    assert status == 429 and retry_after > 0
+    assert admission.admit("auth", "2.2.2.2") is None
+
+def test_class_concurrency_limit_sheds_with_503():
+    admission = controller()
+    assert admission.admit("auth", "a") is None
+    assert admission.admit("auth", "b") is None
+    assert admission.admit("auth", "c") == (503, 1.0)
+    admission.release("auth")
+    assert admission.get_stats()["classes"]["auth"]["in_flight"] == 1
+
+def test_reserved_slots_are_kept_for_public_reads():
+    admission = controller(max_in_flight=3, reserved_public=2)
+    assert admission.admit("admin", "a") is None
+    assert admission.admit("admin", "a") == (503, 1.0)
+    assert admission.admit("public_read", "a") is None
+    assert admission.admit("public_read", "a") is None
+    assert admission.admit("public_read", "a") == (503, 1.0)
+
+def test_forwarded_for_is_ignored_without_proxy_hops():
+    assert controller().client_ip(scope(["6.6.6.6"])) == "10.0.0.1"
+
+def test_client_ip_is_the_entry_added_by_the_trusted_proxy():
+    admission = controller(proxy_hops=1)
+    # A client-supplied entry comes first; the ingress appends the real peer
+    assert admission.client_ip(scope(["6.6.6.6, 203.0.113.7"])) == "203.0.113.7"
+    assert admission.client_ip(scope(["6.6.6.6", "203.0.113.7"])) == "203.0.113.7"
+    assert admission.client_ip(scope()) == "10.0.0.1"
+
+    two_hops = controller(proxy_hops=2)
+    assert two_hops.client_ip(scope(["6.6.6.6, 203.0.113.7, 10.1.0.5"])) == "203.0.113.7"
+    assert two_hops.client_ip(scope(["203.0.113.7"])) == "203.0.113.7"
+
+def test_probes_and_event_streams_are_exempt():
+    assert classify("GET", "/api/health/ready") is None
+    assert classify("GET", "/api/content/events") is None
+    assert classify("GET", "/api/content/landing-page") == "public_read"
+    assert classify("GET", "/api/page") == "public_read"
+    assert classify("POST", "/api/admin/auth/login") == "auth"
+
+async def test_middleware_rejects_with_retry_after():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = AdmissionMiddleware(app, controller())
+    request = {
+        "type": "http", "method": "POST", "path": "/api/admin/auth/login",
+        "headers": [], "client": ("1.1.1.1", 1)
+    }
+    statuses = []
+    for _ in range(3):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await middleware(request, None, send)
+        statuses.append(sent[0]["status"])
+
+    assert statuses == [200, 200, 429]
+    headers = dict(sent[0]["headers"])
+    assert int(headers[b"retry-after"]) >= 1
+    assert json.loads(sent[1]["body"])["route_class"] == "auth"
@@ -0,0 +1,53 @@
+
+from services.audit_service import AuditLog
+from services.auth_service import AdminAuthService
+
+async def test_pages_cover_every_entry_once_newest_first(new_db):
+    audit = AuditLog(new_db(), batch_size=3)
+    await audit.start()
+    for i in range(7):
+        audit.record("content.updated", "editor", "acme", content_id=f"c{i}")
+    audit.record("content.updated", "editor", "other", content_id="x")
+    await audit.stop()
+    assert audit.written == 8
+
+    seen, cursor = [], None
+    while True:
+        page = await audit.query("acme", limit=3, cursor=cursor)
+        seen += [entry.content_id for entry in page.entries]
+        cursor = page.next_cursor
+        if not cursor:
+            break
+    assert sorted(seen) == [f"c{i}" for i in range(7)]
+    assert len(set(seen)) == 7
+
+async def test_full_queue_drops_instead_of_blocking(new_db):
+    audit = AuditLog(new_db(), queue_size=2)
+    await audit.start()
+    # No await in between: the flush loop has not taken anything yet
+    for _ in range(5):
+        audit.record("auth.login", "admin", "default")
+    assert audit.dropped == 3
+    await audit.stop()
+    assert audit.written == 2
+
+async def test_failed_logins_are_attributed_to_nobody(new_db):
+    db = new_db()
+    audit = AuditLog(db)
+    await audit.start()
+    auth = AdminAuthService(db, audit=audit)
+    await auth.create_admin_user("admin", "right")
+
+    assert await auth.authenticate_user("admin", "wrong") is None
+    assert await auth.authenticate_user("ghost", "x") is None
+    assert await auth.authenticate_user("admin", "right")
+    await audit.stop()
+
+    failed = (await audit.query("default", action="auth.login_failed")).entries
+    assert {entry.actor for entry in failed} == {"anonymous"}
+    assert sorted((e.details["username"], e.details["reason"]) for e in failed) == [
+        ("admin", "bad_password"), ("ghost", "unknown_user")
+    ]
+    # Nothing is filed under the attacked account except its real login
+    actions = [entry.action for entry in (await audit.query("default", actor="admin")).entries]
+    assert actions == ["auth.login"]
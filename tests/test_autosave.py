@@ -0,0 +1,79 @@
+import asyncio
+
+from models.content_models import ContentUpdateRequest, HeroSection
+from services.autosave_service import AutosaveBuffer
+from services.content_service import ContentService
+
+def hero_edit(title: str) -> ContentUpdateRequest:
+    return ContentUpdateRequest(hero=HeroSection(main_title=title))
+
+async def draft_with_buffer(db):
+    content = await ContentService(db).create_content_draft()
+    return content, AutosaveBuffer(db, flush_interval=60)
+
+async def test_edits_are_coalesced_into_one_write(new_db):
+    db = new_db()
+    content, buffer = await draft_with_buffer(db)
+
+    for title in ("a", "b", "c"):
+        state = await buffer.record_edit(content.id, hero_edit(title))
+    assert state.pending and state.revision == 1 and state.persisted_revision == 0
+
+    assert await buffer.flush(content.id)
+    stored = await ContentService(db).get_content_by_id(content.id)
+    assert stored.hero.main_title == "c"
+    assert stored.revision == 1
+    assert buffer.writes == 1
+    assert not buffer.get_state(content.id).pending
+
+async def test_revision_comes_from_the_stored_document(new_db):
+    db = new_db()
+    content, buffer = await draft_with_buffer(db)
+    service = ContentService(db)
+
+    await buffer.record_edit(content.id, hero_edit("buffered"))
+    # A regular update lands while edits are buffered
+    await service.update_content(content.id, hero_edit("direct"))
+    await buffer.flush(content.id)
+    await buffer.record_edit(content.id, hero_edit("again"))
+    await buffer.flush(content.id)
+
+    stored = await service.get_content_by_id(content.id)
+    assert stored.revision == 3
+    assert buffer.get_state(content.id).persisted_revision == 3
+
+async def test_edit_does_not_wait_for_a_running_flush(new_db):
+    db = new_db()
+    content, buffer = await draft_with_buffer(db)
+    await buffer.record_edit(content.id, hero_edit("first"))
+
+    draft = buffer._drafts[content.id]
+    async with draft.lock:
+        state = await asyncio.wait_for(buffer.record_edit(content.id, hero_edit("second")), 1)
+    assert state.pending
+
+async def test_failed_flush_keeps_edits_and_reports_failure(new_db, monkeypatch):
+    db = new_db()
+    content, buffer = await draft_with_buffer(db)
+    await buffer.record_edit(content.id, hero_edit("kept"))
+
+    async def broken(*args, **kwargs):
+        raise RuntimeError("primary stepped down")
+    monkeypatch.setattr(ContentService, "apply_autosave", broken)
+
+    assert not await buffer.flush(content.id)
+    assert buffer.get_state(content.id).pending
+
+    monkeypatch.undo()
+    assert await buffer.flush(content.id)
+    stored = await ContentService(db).get_content_by_id(content.id)
+    assert stored.hero.main_title == "kept"
+
+async def test_flush_without_buffered_edits_succeeds(new_db):
+    db = new_db()
+    _, buffer = await draft_with_buffer(db)
+    assert await buffer.flush("unknown")
+
+async def test_missing_draft_is_not_buffered(new_db):
+    buffer = AutosaveBuffer(new_db())
+    assert await buffer.record_edit("missing", hero_edit("x")) is None
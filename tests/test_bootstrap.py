@@ -0,0 +1,97 @@
+import asyncio
+import json
+import threading
+
+from starlette.requests import Request
+
+from routers.content_router import get_bootstrap
+from services.content_service import ContentService
+from services.snapshot_store import LocalSnapshotStore
+from services.social_feed_service import SocialFeedService
+
+POST = {
+    "id": "1", "caption": "Site visit", "media_type": "IMAGE", "media_url": "https://cdn/1.jpg",
+    "thumbnail_url": None, "permalink": "https://instagram.com/p/1", "timestamp": "2024-05-01T10:00:00+0000"
+}
+
+def feed_service(monkeypatch, fetch, **options):
+    monkeypatch.setenv("INSTAGRAM_ACCESS_TOKEN", "token")
+    service = SocialFeedService(**options)
+    service._fetch = fetch
+    return service
+
+async def test_no_token_means_an_empty_feed(monkeypatch):
+    monkeypatch.delenv("INSTAGRAM_ACCESS_TOKEN", raising=False)
+    feed = await SocialFeedService().get_feed("default", timeout=0.1)
+    assert feed.status == "empty" and feed.posts == []
+
+async def test_slow_refresh_does_not_hold_the_caller(monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def fetch(token):
+        calls.append(token)
+        release.wait(5)
+        return [POST]
+
+    service = feed_service(monkeypatch, fetch)
+    first, second = await asyncio.gather(
+        service.get_feed("default", timeout=0.05),
+        service.get_feed("default", timeout=0.05)
+    )
+    assert first.status == second.status == "empty"
+    # Both callers share one refresh
+    assert calls == ["token"]
+
+    release.set()
+    await asyncio.gather(*service._refreshing.values())
+    feed = await service.get_feed("default", timeout=0.05)
+    assert feed.status == "fresh"
+    assert feed.posts[0].permalink == POST["permalink"]
+
+async def test_failed_refresh_keeps_the_last_posts_and_backs_off(monkeypatch):
+    results = [[POST], RuntimeError("boom")]
+    calls = []
+
+    def fetch(token):
+        calls.append(token)
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    service = feed_service(monkeypatch, fetch, cache_seconds=0, error_backoff=60)
+    assert (await service.get_feed("default", timeout=1)).posts
+
+    stale = await service.get_feed("default", timeout=1)
+    assert stale.status == "stale" and stale.posts
+    again = await service.get_feed("default", timeout=1)
+    assert again.status == "stale"
+    assert len(calls) == 2
+
+def request(headers=()):
+    return Request({"type": "http", "method": "GET", "path": "/api/content/bootstrap", "headers": list(headers)})
+
+async def test_bootstrap_combines_content_and_feed_and_is_cached(new_db, monkeypatch):
+    db = new_db()
+    social = feed_service(monkeypatch, lambda token: [POST])
+    stores = {"snapshot": LocalSnapshotStore(), "bootstrap": LocalSnapshotStore(ttl=float("inf"))}
+
+    async def bootstrap(headers=()):
+        return await get_bootstrap(
+            request(headers), ContentService(db), ContentService(db),
+            stores["snapshot"], stores["bootstrap"], social, "default"
+        )
+
+    response = await bootstrap()
+    payload = json.loads(bytes(response.body))
+    assert payload["content"]["is_published"] is True
+    assert payload["studio"]["name"] == payload["content"]["footer"]["studio_name"]
+    assert payload["social_feed"]["status"] == "fresh"
+
+    cached = stores["bootstrap"].current()
+    assert (await bootstrap()).headers["etag"] == cached.etag
+    assert stores["bootstrap"].current() is cached
+
+    not_modified = await bootstrap([(b"if-none-match", cached.etag.encode())])
+    assert not_modified.status_code == 304
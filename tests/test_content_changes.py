@@ -0,0 +1,102 @@
+import gzip
+import io
+import json
+from datetime import datetime, timedelta
+
+from services.backup_service import BackupService, iter_gzip_lines
+from services.change_log import ContentChangeLog
+from services.content_service import ContentService
+from models.content_models import LandingPageContent
+
+SETTLED = datetime.utcnow() - timedelta(minutes=5)
+
+async def seed(db, seqs, changed_at=SETTLED):
+    """One version per entry of ``seqs``; returns their ids"""
+    ids = []
+    for i, seq in enumerate(seqs):
+        content = LandingPageContent(change_seq=seq, changed_at=changed_at)
+        await db.landing_page_content.insert_one(content.model_dump())
+        ids.append(content.id)
+    await ContentChangeLog(db).advance_to("default", max(seqs))
+    return ids
+
+async def sync(service, since=0, limit=2):
+    seen, pages = [], 0
+    while True:
+        page = await service.get_changes(since, limit)
+        pages += 1
+        seen += [(content.change_seq, content.id) for content in page.changed]
+        seen += [("deleted", content_id) for content_id in page.deleted]
+        since = page.next_since
+        if not page.has_more:
+            return seen, since, pages
+
+async def test_paging_returns_every_change_once(new_db):
+    db = new_db()
+    ids = await seed(db, [1, 2, 3, 4, 5])
+    await ContentChangeLog(db).record_deletes("default", ["gone"], "admin")
+
+    seen, since, pages = await sync(ContentService(db))
+    assert [content_id for _, content_id in seen] == ids + ["gone"]
+    assert pages == 3
+    # The tombstone was just written, so it is sent again next time
+    assert since == 5
+    page = await ContentService(db).get_changes(since)
+    assert page.deleted == ["gone"] and page.next_since == 5
+
+async def test_versions_sharing_a_sequence_are_not_split(new_db):
+    db = new_db()
+    await seed(db, [1, 2, 2, 3])
+    service = ContentService(db)
+
+    first = await service.get_changes(0, limit=2)
+    assert [content.change_seq for content in first.changed] == [1, 2]
+    assert first.next_since == 1 and first.has_more
+
+    seen, since, _ = await sync(service, first.next_since, limit=2)
+    assert sorted(seq for seq, _ in seen) == [2, 2, 3]
+    assert since == 3
+
+async def test_recent_writes_are_sent_again_until_they_settle(new_db):
+    db = new_db()
+    await seed(db, [1])
+    await seed(db, [2], changed_at=datetime.utcnow())
+
+    page = await ContentService(db).get_changes(0)
+    assert [content.change_seq for content in page.changed] == [1, 2]
+    assert page.next_since == 1 and not page.has_more
+
+async def test_position_past_the_counter_means_reset(new_db):
+    db = new_db()
+    await seed(db, [1, 2])
+    page = await ContentService(db).get_changes(10)
+    assert page.reset and page.next_since == 0
+
+async def test_restored_versions_get_fresh_sequences_and_lose_tombstones(new_db):
+    db = new_db()
+    ids = await seed(db, [1, 2])
+    backup = [json.loads(LandingPageContent(**await db.landing_page_content.find_one(
+        {"id": content_id}, projection={"_id": 0}
+    )).model_dump_json()) for content_id in ids]
+
+    # Delete one version; a synced client has seen everything up to here
+    await db.landing_page_content.delete_one({"id": ids[0]})
+    await ContentChangeLog(db).record_deletes("default", [ids[0]], "admin")
+    seen, since, _ = await sync(ContentService(db))
+    assert ("deleted", ids[0]) in seen
+
+    archive = gzip.compress("".join(
+        json.dumps({"collection": "landing_page_content", "doc": doc}) + "\n" for doc in backup
+    ).encode())
+    stream = io.BytesIO(archive)
+
+    async def read(size):
+        return stream.read(size)
+
+    await BackupService(db).import_lines(iter_gzip_lines(read))
+
+    page = await ContentService(db).get_changes(since)
+    assert sorted(content.id for content in page.changed) == sorted(ids)
+    assert all(content.change_seq > since for content in page.changed)
+    assert page.deleted == []
+    assert await ContentChangeLog(db).get_tombstones("default", 0, 10) == []
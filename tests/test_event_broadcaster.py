@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+from services.event_broadcaster import EventBroadcaster
+
+def drain(subscription):
+    messages = []
+    while not subscription.queue.empty():
+        frame = subscription.queue.get_nowait()
+        lines = dict(line.split(": ", 1) for line in frame.strip().split("\n"))
+        messages.append((lines["event"], json.loads(lines["data"])))
+    return messages
+
+async def test_public_streams_only_get_public_fields():
+    broadcaster = EventBroadcaster()
+    public = broadcaster.subscribe("default")
+    admin = broadcaster.subscribe("default", admin=True)
+
+    broadcaster.publish("content.updated", {"content_id": "draft", "updated_by": "alice"}, "default")
+    broadcaster.publish(
+        "content.published",
+        {"content_id": "live", "published_by": "alice", "published_at": "now"},
+        "default",
+        public_fields=["content_id", "published_at"]
+    )
+
+    assert drain(public) == [("content.published", {"content_id": "live", "published_at": "now"})]
+    assert [event for event, _ in drain(admin)] == ["content.updated", "content.published"]
+
+async def test_events_stay_within_their_tenant():
+    broadcaster = EventBroadcaster()
+    acme = broadcaster.subscribe("acme", admin=True)
+    broadcaster.publish("content.updated", {"content_id": "x"}, "default")
+    assert drain(acme) == []
+
+async def test_slow_reader_gets_a_single_resync():
+    broadcaster = EventBroadcaster(queue_size=2)
+    reader = broadcaster.subscribe("default", admin=True)
+    for i in range(5):
+        broadcaster.publish("content.updated", {"n": i}, "default")
+    events = [event for event, _ in drain(reader)]
+    assert "resync" in events and len(events) <= 2
+
+async def test_connection_cap():
+    broadcaster = EventBroadcaster(max_connections=1)
+    assert broadcaster.subscribe("default")
+    assert broadcaster.subscribe("default") is None
+    assert broadcaster.get_stats()["rejected"] == 1
+
+async def test_public_streams_cannot_take_admin_slots():
+    broadcaster = EventBroadcaster(max_connections=2, max_admin_connections=1)
+    assert broadcaster.subscribe("default") and broadcaster.subscribe("default")
+    assert broadcaster.subscribe("default") is None
+
+    admin = broadcaster.subscribe("default", admin=True)
+    assert admin
+    assert broadcaster.subscribe("default", admin=True) is None
+    stats = broadcaster.get_stats()
+    assert stats["connections"] == 2 and stats["admin_connections"] == 1
+    assert stats["rejected"] == 2
+
+    broadcaster.unsubscribe(admin)
+    assert broadcaster.subscribe("default", admin=True)
+
+async def test_events_are_relayed_to_other_workers_once(new_db):
+    db = new_db()
+    worker_a = EventBroadcaster(db=db, poll_interval=0.05)
+    worker_b = EventBroadcaster(db=db, poll_interval=0.05)
+    await worker_a.start()
+    await worker_b.start()
+    try:
+        local = worker_a.subscribe("default", admin=True)
+        remote = worker_b.subscribe("default")
+
+        worker_a.publish("content.published", {"content_id": "c1", "published_by": "alice"},
+                         "default", public_fields=["content_id"])
+        await asyncio.sleep(0.3)
+
+        assert drain(remote) == [("content.published", {"content_id": "c1"})]
+        # The origin worker delivered locally and does not receive its own event again
+        assert len(drain(local)) == 1
+        await asyncio.sleep(0.2)
+        assert drain(remote) == []
+    finally:
+        await worker_a.stop()
+        await worker_b.stop()
@@ -0,0 +1,45 @@
+import json
+import logging
+import queue
+
+from logging_config import DeferredQueueHandler, JsonFormatter, RateLimitFilter
+
+def record(level=logging.WARNING, msg="db slow: %s", args=("x",)):
+    return logging.LogRecord("app", level, __file__, 1, msg, args, None)
+
+def test_repeated_warnings_are_rate_limited_and_counted():
+    limiter = RateLimitFilter(window=60, burst=2, sample_every=5)
+    passed = [limiter.filter(record()) for _ in range(10)]
+    # Burst of two, then every fifth record in the window
+    assert passed == [True, True, False, False, True, False, False, False, False, True]
+
+    last = record()
+    limiter.filter(last)
+    assert not hasattr(last, "suppressed") or last.suppressed == 0
+
+def test_suppressed_count_is_reported_on_the_next_emitted_record():
+    limiter = RateLimitFilter(window=60, burst=1, sample_every=3)
+    for _ in range(2):
+        limiter.filter(record())
+    emitted = record()
+    assert limiter.filter(emitted)
+    assert emitted.suppressed == 1
+
+def test_info_records_are_never_limited():
+    limiter = RateLimitFilter(window=60, burst=0, sample_every=1000)
+    assert all(limiter.filter(record(level=logging.INFO)) for _ in range(5))
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = DeferredQueueHandler(queue.Queue(maxsize=1))
+    handler.enqueue(record())
+    handler.enqueue(record())
+    assert handler.dropped == 1
+
+def test_json_formatter_emits_one_object_with_context():
+    entry = record()
+    entry.request_id = "req-1"
+    entry.tenant_id = "acme"
+    line = json.loads(JsonFormatter().format(entry))
+    assert line["message"] == "db slow: x"
+    assert line["request_id"] == "req-1"
+    assert line["tenant_id"] == "acme"
@@ -0,0 +1,115 @@
+import json
+
+import pytest
+from starlette.requests import Request
+
+from models.content_models import LandingPageContent
+from routers.page_router import get_landing_page
+from services.content_service import ContentService
+from services.page_renderer import MINIMAL_SHELL, PageTemplate, render_hero
+from services.snapshot_store import LocalSnapshotStore
+
+BUILD_INDEX = (
+    '<!doctype html><html><head><meta charset="utf-8">'
+    '<meta name="description" content="Coming soon"><title>Studio</title>'
+    '<script defer src="/static/js/main.1234.js"></script></head>'
+    '<body><div id="root"></div></body></html>'
+)
+
+def content(**hero):
+    page = LandingPageContent()
+    page.hero = page.hero.model_copy(update=hero)
+    return page
+
+def render(template, page):
+    return template.render(page, page.model_dump_json().encode()).decode()
+
+def test_render_fills_title_description_root_and_state():
+    page = content(main_title="Hello", subtitle="World", description="A studio")
+    html = render(PageTemplate(BUILD_INDEX), page)
+
+    assert f"<title>{page.footer.studio_name} - Hello World</title>" in html
+    assert '<meta name="description" content="A studio" />' in html
+    assert "Coming soon" not in html
+    assert '<div id="root"><div class="App">' in html
+    assert '<script defer src="/static/js/main.1234.js"></script>' in html
+
+    state = html.split('<script id="landing-page-state" type="application/json">')[1].split("</script>")[0]
+    assert json.loads(state)["hero"]["main_title"] == "Hello"
+
+def test_content_is_escaped_everywhere():
+    page = content(main_title='<img src=x onerror="alert(1)">', description='"quoted" & <b>')
+    html = render(PageTemplate(BUILD_INDEX), page)
+
+    assert "<img" not in html
+    assert "&lt;img src=x onerror=&quot;alert(1)&quot;&gt;" in html
+    assert 'content="&quot;quoted&quot; &amp; &lt;b&gt;"' in html
+
+def test_state_cannot_close_its_script_element():
+    page = content(subtitle="</script><script>alert(1)</script>")
+    html = render(PageTemplate(BUILD_INDEX), page)
+
+    state = html.split('<script id="landing-page-state" type="application/json">')[1]
+    state = state.split("</script>")[0]
+    assert "\\u003c/script>" in state
+    # Still the same content once parsed
+    assert json.loads(state)["hero"]["subtitle"] == "</script><script>alert(1)</script>"
+
+def test_hero_markup_matches_the_client_tree():
+    html = render_hero(content(main_title="A", subtitle="B"))
+    assert html.startswith('<div class="App"><div class="min-h-screen bg-stone-50"><section')
+    assert 'A<br /><span class="text-sage-600">B</span></h1>' in html
+
+def test_template_without_root_falls_back_to_the_minimal_shell(tmp_path):
+    with pytest.raises(ValueError):
+        PageTemplate("<html><body></body></html>")
+
+    (tmp_path / "index.html").write_text("<html><body></body></html>")
+    assert PageTemplate.load(tmp_path).digest == PageTemplate(MINIMAL_SHELL).digest
+    assert PageTemplate.load(None).digest == PageTemplate(MINIMAL_SHELL).digest
+
+    (tmp_path / "index.html").write_text(BUILD_INDEX)
+    assert PageTemplate.load(tmp_path).digest == PageTemplate(BUILD_INDEX).digest
+
+async def test_page_is_cached_until_the_snapshot_changes(new_db):
+    db = new_db()
+    snapshot_store, page_store = LocalSnapshotStore(ttl=60), LocalSnapshotStore(ttl=float("inf"))
+    template = PageTemplate(BUILD_INDEX)
+
+    async def get(headers=()):
+        request = Request({"type": "http", "method": "GET", "path": "/api/page", "headers": list(headers)})
+        return await get_landing_page(
+            request, ContentService(db), ContentService(db), snapshot_store, page_store, template
+        )
+
+    response = await get()
+    assert response.media_type.startswith("text/html")
+    assert b"Something Extraordinary" in bytes(response.body)
+    page = page_store.current()
+
+    assert (await get([(b"if-none-match", page.etag.encode())])).status_code == 304
+    assert page_store.current() is page
+
+    # A publish swaps the snapshot; the page is rendered again
+    service = ContentService(db, snapshot_store=snapshot_store)
+    draft = await service.create_content_draft(updated_by="editor")
+    await db.landing_page_content.update_one({"id": draft.id}, {"$set": {"hero.main_title": "Now open"}})
+    await service.publish_content(draft.id)
+
+    response = await get()
+    assert b"Now open" in bytes(response.body)
+    assert page_store.current() is not page
+
+async def test_render_failure_is_a_500(new_db):
+    class BrokenStore:
+        def current(self):
+            raise RuntimeError("boom")
+
+    from fastapi import HTTPException
+    request = Request({"type": "http", "method": "GET", "path": "/api/page", "headers": []})
+    with pytest.raises(HTTPException) as error:
+        await get_landing_page(
+            request, ContentService(new_db()), ContentService(new_db()),
+            BrokenStore(), LocalSnapshotStore(), PageTemplate(BUILD_INDEX)
+        )
+    assert error.value.status_code == 500
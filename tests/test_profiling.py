@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+from middleware.profiling import ProfileStore, ProfilingMiddleware, RequestProfile, TaskSampler
+
+def test_store_keeps_only_the_most_recent_profiles():
+    store = ProfileStore(maxlen=2)
+    profiles = [RequestProfile("GET", f"/{i}", "sampled") for i in range(3)]
+    for profile in profiles:
+        store.add(profile)
+    assert [p["path"] for p in store.list()] == ["/2", "/1"]
+    assert store.get(profiles[0].id) is None
+
+def test_collapsed_output_is_folded_stacks():
+    profile = RequestProfile("GET", "/", "sampled")
+    profile.stacks["a;b"] += 3
+    profile.stacks["a;c"] += 1
+    assert profile.collapsed() == "a;b 3\na;c 1\n"
+    assert profile.samples == 4
+
+def busy_handler(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+async def test_sampler_records_the_running_stack():
+    profile = RequestProfile("GET", "/", "sampled")
+
+    async def request():
+        await asyncio.sleep(0.02)
+        busy_handler(0.1)
+
+    task = asyncio.create_task(request())
+    await asyncio.sleep(0)
+    sampler = TaskSampler(task, asyncio.get_running_loop(), profile, 0.002)
+    sampler.start()
+    await task
+    await sampler.stop()
+    assert not sampler.is_alive()
+
+    stacks = "\n".join(profile.stacks)
+    assert "busy_handler" in stacks
+    assert "[await" in stacks or "[scheduled]" in stacks
+
+async def call(middleware, headers=()):
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/api/", "headers": list(headers)}
+    await middleware(scope, receive, send)
+    return sent
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+async def test_sampled_requests_are_profiled_and_tagged():
+    store = ProfileStore()
+    sent = await call(ProfilingMiddleware(ok_app, store, sample_rate=1.0))
+    profile_id = dict(sent[0]["headers"])[b"x-profile-id"].decode()
+    assert store.get(profile_id).status_code == 200
+
+async def test_unsampled_requests_pass_through():
+    store = ProfileStore()
+    sent = await call(ProfilingMiddleware(ok_app, store))
+    assert sent[0]["headers"] == []
+    assert store.list() == []
@@ -0,0 +1,103 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from models.content_models import LandingPageContent
+from services.content_service import ContentService
+from services.publish_scheduler import PublishScheduler
+from services.snapshot_store import LocalSnapshotStore, TenantSnapshotStores, build_snapshot
+
+async def test_only_one_scheduler_holds_the_lease(new_db):
+    db = new_db()
+    first = PublishScheduler(db, lease_seconds=30)
+    second = PublishScheduler(db, lease_seconds=30)
+
+    assert await first._acquire_lease()
+    assert not await second._acquire_lease()
+    # The holder renews its own lease
+    assert await first._acquire_lease()
+
+    # An expired lease can be taken over
+    await db.scheduler_leases.update_one(
+        {"_id": "publish_scheduler"},
+        {"$set": {"expires_at": datetime.utcnow() - timedelta(seconds=1)}}
+    )
+    assert await second._acquire_lease()
+    assert not await first._acquire_lease()
+
+async def scheduled_draft(db, publish_at):
+    service = ContentService(db)
+    await service.initialize_default_content()
+    draft = await service.create_content_draft(updated_by="editor")
+    assert await service.schedule_publish(draft.id, publish_at, "editor")
+    return (await service.get_scheduled_content())[0]
+
+async def test_overdue_schedule_is_published_exactly_once(new_db):
+    db = new_db()
+    content = await scheduled_draft(db, datetime.utcnow() - timedelta(seconds=1))
+
+    stores = [
+        TenantSnapshotStores(lambda tenant_id: LocalSnapshotStore(ttl=60)) for _ in range(2)
+    ]
+    schedulers = [PublishScheduler(db, snapshot_stores=store) for store in stores]
+    await asyncio.gather(*(scheduler._cutover(content) for scheduler in schedulers))
+
+    published = await db.landing_page_content.find({"is_published": True}).to_list(10)
+    assert [doc["id"] for doc in published] == [content.id]
+    assert published[0]["updated_at"] == content.publish_at
+    assert published[0].get("publish_at") is None
+
+    # Whichever scheduler won serves the prewarmed snapshot
+    snapshots = [store.get(content.tenant_id).current() for store in stores]
+    assert [s.content_id for s in snapshots if s] == [content.id]
+    # ... and it is byte-for-byte what the stored document serializes to
+    served = next(s for s in snapshots if s)
+    assert served.etag == build_snapshot(LandingPageContent(**published[0])).etag
+
+async def test_cancelled_schedule_is_not_published(new_db):
+    db = new_db()
+    content = await scheduled_draft(db, datetime.utcnow() + timedelta(seconds=0.2))
+    scheduler = PublishScheduler(db)
+    cutover = asyncio.create_task(scheduler._cutover(content))
+    await db.landing_page_content.update_one({"id": content.id}, {"$set": {"publish_at": None}})
+    await cutover
+
+    doc = await db.landing_page_content.find_one({"id": content.id})
+    assert doc["is_published"] is False
+
+async def test_claim_left_by_a_dead_worker_is_taken_over_after_it_expires(new_db):
+    db = new_db()
+    content = await scheduled_draft(db, datetime.utcnow() - timedelta(seconds=1))
+    service = ContentService(db)
+
+    # A worker claims the schedule and dies before the publish write
+    assert await service.claim_scheduled_publish(content.id, content.publish_at, "dead", timedelta(seconds=30))
+    doc = await db.landing_page_content.find_one({"id": content.id})
+    assert doc["publish_at"] == content.publish_at and doc["claimed_by"] == "dead"
+    assert await service.get_scheduled_content(claimable=True) == []
+    scheduler = PublishScheduler(db)
+    await scheduler._cutover(content)
+    assert not (await db.landing_page_content.find_one({"id": content.id}))["is_published"]
+
+    # Once the lease runs out the schedule is due again and published
+    await db.landing_page_content.update_one(
+        {"id": content.id}, {"$set": {"claim_expires_at": datetime.utcnow() - timedelta(seconds=1)}}
+    )
+    assert [c.id for c in await service.get_scheduled_content(claimable=True)] == [content.id]
+    await scheduler._cutover(content)
+
+    doc = await db.landing_page_content.find_one({"id": content.id})
+    assert doc["is_published"] and doc.get("publish_at") is None
+    assert "claimed_by" not in doc and "claim_expires_at" not in doc
+
+async def test_publish_needs_the_claim_to_still_be_held(new_db):
+    db = new_db()
+    content = await scheduled_draft(db, datetime.utcnow() - timedelta(seconds=1))
+    service = ContentService(db)
+    assert await service.claim_scheduled_publish(content.id, content.publish_at, "slow", timedelta(seconds=30))
+
+    # Rescheduling voids the claim, so the slow worker cannot publish
+    await service.schedule_publish(content.id, datetime.utcnow() + timedelta(hours=1), "editor")
+    assert not await service.publish_content(content.id, claimed_by="slow")
+
+    published = await db.landing_page_content.find_one({"is_published": True})
+    assert published["id"] != content.id
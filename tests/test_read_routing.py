@@ -0,0 +1,74 @@
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from pymongo.read_preferences import Primary, SecondaryPreferred
+
+import database
+from routers.content_router import load_published_snapshot
+from routers.health_router import liveness, readiness
+from services.content_service import ContentService
+from services.snapshot_store import LocalSnapshotStore
+
+def test_public_read_preference_from_env(monkeypatch):
+    monkeypatch.delenv("MONGO_PUBLIC_READ_PREFERENCE", raising=False)
+    assert isinstance(database._public_read_preference(), SecondaryPreferred)
+
+    monkeypatch.setenv("MONGO_PUBLIC_READ_PREFERENCE", "primary")
+    assert isinstance(database._public_read_preference(), Primary)
+
+    monkeypatch.setenv("MONGO_PUBLIC_READ_PREFERENCE", "fastest")
+    with pytest.raises(ValueError):
+        database._public_read_preference()
+
+def test_pool_metrics_percentiles():
+    metrics = database.PoolMetrics()
+    for elapsed in range(1, 101):
+        metrics.record_ping(float(elapsed))
+    snapshot = metrics.snapshot()
+    assert snapshot["ping_ms"]["last"] == 100.0
+    assert snapshot["ping_ms"]["p95"] == 96.0
+
+async def test_probes_report_status_only():
+    metrics = database.PoolMetrics()
+    metrics.open_connections["db-0.internal:27017"] = 3
+
+    async def ping(command):
+        return {"ok": 1}
+
+    async def down(command):
+        raise ConnectionError("db-0.internal:27017 refused")
+
+    def request(command):
+        client = SimpleNamespace(admin=SimpleNamespace(command=command))
+        return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(mongo_client=client, pool_metrics=metrics)))
+
+    assert await liveness() == {"status": "alive"}
+    assert await readiness(request(ping)) == {"status": "ready"}
+    assert metrics.snapshot()["ping_ms"]["last"] is not None
+
+    response = await readiness(request(down))
+    assert response.status_code == 503
+    assert json.loads(response.body) == {"status": "unavailable"}
+
+async def test_lagging_secondary_does_not_insert_a_second_default(new_db):
+    primary, lagging_secondary = new_db(), new_db()
+    published = await ContentService(primary).initialize_default_content()
+
+    snapshot = await load_published_snapshot(
+        ContentService(lagging_secondary),
+        LocalSnapshotStore(),
+        ContentService(primary)
+    )
+
+    assert snapshot.content_id == published.id
+    assert await primary.landing_page_content.count_documents({}) == 1
+    assert await lagging_secondary.landing_page_content.count_documents({}) == 0
+
+async def test_snapshot_is_served_from_the_store_when_cached(new_db):
+    db = new_db()
+    store = LocalSnapshotStore()
+    first = await load_published_snapshot(ContentService(db), store, ContentService(db))
+    second = await load_published_snapshot(ContentService(db), store, ContentService(db))
+    assert second is first
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+from services.change_log import ContentChangeLog
+from services.retention_service import RetentionPolicy, RetentionService
+
+def version(tenant_id, id, days_old, **fields):
+    return {
+        "id": id,
+        "tenant_id": tenant_id,
+        "updated_at": datetime.utcnow() - timedelta(days=days_old),
+        "is_published": False,
+        **fields
+    }
+
+async def test_compaction_keeps_recent_published_and_pinned_versions(new_db):
+    db = new_db()
+    await db.landing_page_content.insert_many([
+        version("acme", "a1", 1),
+        version("acme", "a2", 2),
+        version("acme", "a3", 200),
+        version("acme", "a4", 300, is_published=True),
+        version("acme", "a5", 400, pinned=True),
+        version("acme", "a6", 500),
+        version("other", "o1", 600),
+    ])
+    service = RetentionService(db, RetentionPolicy(keep_last=2, keep_days=90, batch_size=1))
+
+    report = await service.enforce()
+
+    remaining = sorted(await db.landing_page_content.distinct("id"))
+    assert remaining == ["a1", "a2", "a4", "a5", "o1"]
+    assert report["deleted"] == 2
+    assert report["tenants"] == 2
+
+    tombstones = await ContentChangeLog(db).get_tombstones("acme", 0, 10)
+    assert sorted(t["content_id"] for t in tombstones) == ["a3", "a6"]
+    assert {t["deleted_by"] for t in tombstones} == {"retention"}
+
+async def test_compaction_keeps_drafts_scheduled_to_publish(new_db):
+    db = new_db()
+    await db.landing_page_content.insert_many([
+        version("acme", "a1", 1),
+        version("acme", "a2", 200, publish_at=datetime.utcnow() + timedelta(days=1)),
+        version("acme", "a3", 300, publish_at=None),
+    ])
+    service = RetentionService(db, RetentionPolicy(keep_last=1, keep_days=90))
+
+    report = await service.enforce()
+
+    assert sorted(await db.landing_page_content.distinct("id")) == ["a1", "a2"]
+    assert report["deleted"] == 1
+
+async def test_keep_last_is_per_tenant(new_db):
+    db = new_db()
+    await db.landing_page_content.insert_many(
+        [version("acme", f"a{i}", 100 + i) for i in range(3)]
+        + [version("other", "o1", 500)]
+    )
+    await RetentionService(db, RetentionPolicy(keep_last=1, keep_days=30)).enforce()
+    assert sorted(await db.landing_page_content.distinct("id")) == ["a0", "o1"]
+
+async def test_disabled_policy_does_not_start_the_job(new_db):
+    service = RetentionService(new_db(), RetentionPolicy(enabled=False))
+    service.start()
+    assert service._task is None
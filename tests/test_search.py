@@ -0,0 +1,47 @@
+import re
+
+from services.content_service import ContentService, _highlight
+
+def pattern(*terms):
+    return re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
+
+def test_highlight_marks_matches_and_escapes_the_rest():
+    snippet = _highlight("Tom & Jerry <studio>", pattern("jerry"))
+    assert snippet == "Tom &amp; <mark>Jerry</mark> &lt;studio&gt;"
+
+def test_highlight_never_matches_inside_escaped_entities():
+    # "amp" and "lt" only occur in the escaped text, never in the raw one
+    assert _highlight("Tom & Jerry", pattern("amp")) is None
+    snippet = _highlight("a < b, lt design", pattern("lt"))
+    assert snippet == "a &lt; b, <mark>lt</mark> design"
+
+def test_highlight_escapes_the_matched_text():
+    snippet = _highlight("email: a+b@studio.com", pattern("a+b@studio.com"))
+    assert snippet == "email: <mark>a+b@studio.com</mark>"
+    snippet = _highlight("R&D lab", pattern("r&d"))
+    assert snippet == "<mark>R&amp;D</mark> lab"
+
+def test_highlight_trims_long_text_around_the_first_match():
+    text = "x" * 100 + " studio " + "y" * 100
+    snippet = _highlight(text, pattern("studio"), width=10)
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert "<mark>studio</mark>" in snippet
+
+async def test_one_failing_index_does_not_stop_the_others(new_db):
+    db = new_db()
+    collection = db.landing_page_content
+    created = []
+    original = collection.create_index
+
+    async def create_index(keys, **options):
+        if keys == "publish_at":
+            from pymongo.errors import OperationFailure
+            raise OperationFailure("IndexOptionsConflict")
+        created.append(keys)
+        return await original(keys, **options)
+
+    service = ContentService(db)
+    service.collection.create_index = create_index
+    await service.ensure_indexes()
+    assert "id" in created
+    assert [("tenant_id", 1), ("change_seq", 1)] in created
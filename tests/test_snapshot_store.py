@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from models.content_models import LandingPageContent
+from routers.content_router import accepts_gzip
+from services.content_service import ContentService
+from services.snapshot_store import SharedSnapshotStore, build_snapshot, snapshot_from_bytes
+
+def snapshot(body: bytes):
+    return snapshot_from_bytes("content-1", "1.0", body)
+
+def test_publish_is_visible_to_every_worker(tmp_path):
+    writer = SharedSnapshotStore(str(tmp_path))
+    reader = SharedSnapshotStore(str(tmp_path))
+    assert reader.current() is None
+
+    writer.set(snapshot(b'{"a": 1}'))
+    assert bytes(reader.current().plain) == b'{"a": 1}'
+
+    writer.set(snapshot(b'{"a": 2}'))
+    assert bytes(reader.current().plain) == b'{"a": 2}'
+
+def test_clear_is_shared_and_never_reuses_a_generation(tmp_path):
+    writer = SharedSnapshotStore(str(tmp_path))
+    reader = SharedSnapshotStore(str(tmp_path))
+    writer.set(snapshot(b'{"a": 1}'))
+    first = reader.current().generation
+
+    writer.clear()
+    assert reader.current() is None
+    assert writer.current() is None
+
+    writer.set(snapshot(b'{"a": 2}'))
+    current = reader.current()
+    assert current.generation > first
+    assert bytes(current.plain) == b'{"a": 2}'
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate, br", True),
+    ("br;q=1.0, gzip;q=0.8", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0.0, *;q=1", False),
+    ("*", True),
+    ("*;q=0", False),
+    ("identity", False),
+    ("", False),
+])
+def test_accepts_gzip_honours_q_values(header, expected):
+    assert accepts_gzip(header) is expected
+
+async def test_snapshot_carries_only_public_fields(new_db):
+    db = new_db()
+    service = ContentService(db)
+    content = await service.get_content_by_id((await service.initialize_default_content()).id)
+    before = build_snapshot(content)
+
+    body = json.loads(bytes(before.plain))
+    for field in ("tenant_id", "revision", "pinned", "publish_at", "change_seq", "changed_at"):
+        assert field not in body
+    assert body["hero"]["main_title"] == content.hero.main_title
+
+    # Bookkeeping writes do not change what the public sees
+    await service.set_pinned(content.id, True)
+    stored = await service.get_content_by_id(content.id)
+    assert stored.pinned and stored.change_seq > content.change_seq
+    assert build_snapshot(stored).etag == before.etag
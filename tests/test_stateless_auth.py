@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+from services.auth_service import AdminAuthService
+from services.revocation_service import RevocationList
+
+async def test_revoked_token_is_rejected_on_every_worker(new_db):
+    db = new_db()
+    worker_a, worker_b = RevocationList(db), RevocationList(db)
+    expires = datetime.utcnow() + timedelta(minutes=15)
+
+    await worker_a.revoke_token("jti-1", "user-1", expires)
+    assert worker_a.is_revoked("jti-1", "user-1", datetime.utcnow())
+    assert not worker_b.is_revoked("jti-1", "user-1", datetime.utcnow())
+
+    await worker_b.sync()
+    assert worker_b.is_revoked("jti-1", "user-1", datetime.utcnow())
+    assert not worker_b.is_revoked("jti-2", "user-1", datetime.utcnow())
+
+async def test_user_revocation_only_hits_older_tokens(new_db):
+    revocations = RevocationList(new_db())
+    cutoff = datetime.utcnow()
+    await revocations.revoke_user("user-1", cutoff, cutoff + timedelta(minutes=15))
+
+    assert revocations.is_revoked(None, "user-1", cutoff - timedelta(seconds=1))
+    assert not revocations.is_revoked(None, "user-1", cutoff + timedelta(seconds=1))
+    assert not revocations.is_revoked(None, "user-2", cutoff - timedelta(seconds=1))
+
+async def test_expired_revocations_are_pruned(new_db):
+    revocations = RevocationList(new_db())
+    await revocations.revoke_token("old", "user-1", datetime.utcnow() - timedelta(seconds=1))
+    revocations._prune()
+    assert revocations.get_stats()["revoked_tokens"] == 0
+
+async def test_stateless_token_verifies_without_a_session_and_logout_revokes(new_db):
+    db = new_db()
+    auth = AdminAuthService(db, revocation_list=RevocationList(db))
+    user = await auth.create_admin_user("editor", "secret-password")
+    login = await auth.create_access_token(user)
+
+    # Only the refresh token is backed by a session document
+    await db.admin_sessions.delete_many({"token": {"$ne": login.refresh_token}})
+    verified = await auth.verify_token(login.access_token)
+    assert verified.username == "editor"
+
+    assert await auth.logout(login.access_token)
+    assert await auth.verify_token(login.access_token) is None
+
+async def test_logout_revokes_older_tokens_of_the_session_on_every_worker(new_db):
+    db = new_db()
+    auth = AdminAuthService(db, revocation_list=RevocationList(db))
+    user = await auth.create_admin_user("editor", "secret-password")
+    login = await auth.create_access_token(user)
+    refreshed = await auth.refresh_access_token(login.refresh_token)
+    other_login = await auth.create_access_token(user)
+    assert refreshed.access_token != login.access_token
+
+    assert await auth.logout(refreshed.access_token)
+    assert await auth.verify_token(login.access_token) is None
+    assert await auth.refresh_access_token(login.refresh_token) is None
+    # Another login session of the same user is untouched
+    assert (await auth.verify_token(other_login.access_token)).username == "editor"
+
+    other_worker = RevocationList(db)
+    await other_worker.sync()
+    assert other_worker.get_stats()["revoked_sessions"] == 1
+    worker_auth = AdminAuthService(db, revocation_list=other_worker)
+    assert await worker_auth.verify_token(login.access_token) is None
+
+async def test_token_of_another_tenant_is_rejected(new_db):
+    db = new_db()
+    auth = AdminAuthService(db, revocation_list=RevocationList(db))
+    user = await auth.create_admin_user("editor", "secret-password")
+    login = await auth.create_access_token(user)
+
+    other = AdminAuthService(db, revocation_list=RevocationList(db), tenant_id="acme")
+    assert await other.verify_token(login.access_token) is None
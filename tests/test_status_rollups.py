@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from services.status_rollup_service import StatusRollupService, hour_bucket
+
+def at(hour, minute=0):
+    return datetime(2024, 5, 1, hour, minute)
+
+async def test_record_counts_into_hourly_buckets(new_db):
+    service = StatusRollupService(new_db())
+    for timestamp in (at(9, 5), at(9, 55), at(10, 1)):
+        await service.record("web", timestamp)
+
+    rows = await service.query(at(0), at(23))
+    assert [(row["bucket"], row["count"]) for row in rows] == [(at(9), 2), (at(10), 1)]
+
+async def test_rebuild_recounts_and_drops_buckets_without_checks(new_db):
+    db = new_db()
+    service = StatusRollupService(db)
+    await db.status_checks.insert_many([
+        {"id": "1", "client_name": "web", "timestamp": at(9, 10)},
+        {"id": "2", "client_name": "web", "timestamp": at(9, 20)},
+    ])
+    # Drifted counts, and a bucket whose checks were deleted
+    await db.status_check_rollups.insert_many([
+        {"client_name": "web", "bucket": at(9), "count": 7},
+        {"client_name": "web", "bucket": at(11), "count": 3},
+        {"client_name": "web", "bucket": at(20), "count": 5},
+    ])
+
+    assert await service.rebuild(at(8), at(12)) == 1
+
+    rows = await service.query(at(0), at(23))
+    # at(20) is outside the rebuilt range and left alone
+    assert [(row["bucket"], row["count"]) for row in rows] == [(at(9), 2), (at(20), 5)]
+
+def test_hour_bucket_truncates_to_the_hour():
+    assert hour_bucket(at(9, 59)) == at(9)
@@ -0,0 +1,70 @@
+import gc
+import os
+
+import pytest
+from fastapi import HTTPException
+
+from models.content_models import TenantCreateRequest
+from routers.admin_router import create_tenant, setup_admin
+from services.auth_service import AdminAuthService
+from services.snapshot_store import SharedSnapshotStore, TenantSnapshotStores, snapshot_from_bytes
+from services.tenant_service import TenantRegistry
+
+async def test_setup_only_works_while_no_admin_exists_anywhere(new_db):
+    db = new_db()
+    await AdminAuthService(db, tenant_id="acme").create_admin_user("owner", "secret")
+
+    # A site without admins does not reopen setup
+    with pytest.raises(HTTPException) as error:
+        await setup_admin("me", "pw", AdminAuthService(db))
+    assert error.value.status_code == 400
+
+    await db.admin_users.delete_many({})
+    with pytest.raises(HTTPException) as error:
+        await setup_admin("me", "pw", AdminAuthService(db, tenant_id="acme"))
+    assert error.value.status_code == 404
+
+    result = await setup_admin("me", "pw", AdminAuthService(db))
+    assert result["success"]
+    assert await db.admin_users.count_documents({"tenant_id": "default"}) == 1
+
+async def test_creating_a_tenant_creates_its_first_admin(new_db):
+    db = new_db()
+    request = TenantCreateRequest(
+        id="acme", name="Acme", hosts=["acme.example"],
+        admin_username="owner", admin_password="secret"
+    )
+    platform = AdminAuthService(db)
+    tenant = await create_tenant(request, current_user=None, registry=TenantRegistry(db), auth_service=platform)
+
+    assert tenant.id == "acme"
+    user = await AdminAuthService(db, tenant_id="acme").authenticate_user("owner", "secret")
+    assert user and user.tenant_id == "acme"
+    assert await platform.authenticate_user("owner", "secret") is None
+
+def open_fds():
+    return len(os.listdir("/proc/self/fd"))
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc")
+def test_evicted_store_stays_usable_and_is_released_when_dropped(tmp_path):
+    stores = TenantSnapshotStores(
+        lambda tenant_id: SharedSnapshotStore(str(tmp_path / tenant_id)), max_tenants=1
+    )
+    in_flight = stores.get("a")
+    in_flight.set(snapshot_from_bytes("c1", "1.0", b"{}"))
+
+    stores.get("b")
+    assert stores.evictions == 1
+    # A request still holding the evicted store keeps working
+    assert in_flight.current().content_id == "c1"
+
+    gc.collect()
+    held = open_fds()
+    del in_flight
+    gc.collect()
+    # Control word and snapshot mappings are closed with the last reference
+    assert open_fds() < held
+
+    stores.close()
+    assert stores.get("a").current().content_id == "c1"
+    stores.close()